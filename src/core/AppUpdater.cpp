@@ -7,7 +7,7 @@
 #include <QDebug>
 #include <QProcess>
 #include <QStandardPaths>
-#include <QFile>
+#include <QSaveFile>
 #include <QCoreApplication>
 #include <QDir>
 #include <QRegularExpression>
@@ -141,35 +141,46 @@ void AppUpdater::onCheckFinished(QNetworkReply *reply) {
 }
 
 void AppUpdater::downloadAndInstall(const QUrl &downloadUrl) {
+    QString tempPath = QStandardPaths::writableLocation(QStandardPaths::TempLocation);
+
+    // Stream the installer to disk as it arrives rather than buffering the whole
+    // payload until the reply finishes. QSaveFile only replaces the target on
+    // commit, so a failed download never leaves a truncated installer behind.
+    QSaveFile *installerFile = new QSaveFile(tempPath + "/LzyDownloader-Setup.exe", this);
+    if (!installerFile->open(QIODevice::WriteOnly)) {
+        delete installerFile;
+        emit updateCheckFailed("Failed to save installer.");
+        return;
+    }
+
     QNetworkRequest request(downloadUrl);
     QNetworkReply *reply = m_networkManager->get(request);
 
     connect(reply, &QNetworkReply::downloadProgress, this, &AppUpdater::downloadProgress);
-    connect(reply, &QNetworkReply::finished, this, [this, reply](){
-        onDownloadFinished(reply);
+    connect(reply, &QNetworkReply::readyRead, installerFile, [reply, installerFile]() {
+        installerFile->write(reply->readAll());
+    });
+    connect(reply, &QNetworkReply::finished, this, [this, reply, installerFile](){
+        onDownloadFinished(reply, installerFile);
     });
 }
 
-void AppUpdater::onDownloadFinished(QNetworkReply *reply) {
+void AppUpdater::onDownloadFinished(QNetworkReply *reply, QSaveFile *installerFile) {
+    reply->deleteLater();
+    installerFile->deleteLater();
+
     if (reply->error() != QNetworkReply::NoError) {
+        installerFile->cancelWriting();
         emit updateCheckFailed("Failed to download update: " + reply->errorString());
-        reply->deleteLater();
         return;
     }
 
-    QString tempPath = QStandardPaths::writableLocation(QStandardPaths::TempLocation);
-    QString installerPath = tempPath + "/LzyDownloader-Setup.exe";
-
-    QFile installerFile(installerPath);
-    if (!installerFile.open(QIODevice::WriteOnly)) {
+    installerFile->write(reply->readAll());
+    if (!installerFile->commit()) {
         emit updateCheckFailed("Failed to save installer.");
-        reply->deleteLater();
         return;
     }
-
-    installerFile.write(reply->readAll());
-    installerFile.close();
-    reply->deleteLater();
+    const QString installerPath = installerFile->fileName();
 
     emit downloadFinished();
 
@@ -178,6 +189,12 @@ void AppUpdater::onDownloadFinished(QNetworkReply *reply) {
     args << "/S"; // Silent install
     args << "/D=" + QDir::toNativeSeparators(QCoreApplication::applicationDirPath());
 
-    QProcess::startDetached(installerPath, args);
+    // startDetached goes straight to CreateProcess without inheriting handles,
+    // so the hand-off is already as cheap as it gets; only quit once the
+    // installer is actually running.
+    if (!QProcess::startDetached(installerPath, args)) {
+        emit updateCheckFailed("Failed to launch installer.");
+        return;
+    }
     QCoreApplication::quit();
 }
@@ -6,6 +6,8 @@
 #include <QUrl>
 #include <QStringList>
 
+class QSaveFile;
+
 class AppUpdater : public QObject {
     Q_OBJECT
 
@@ -23,7 +25,7 @@ signals:
 
 private slots:
     void onCheckFinished(QNetworkReply *reply);
-    void onDownloadFinished(QNetworkReply *reply);
+    void onDownloadFinished(QNetworkReply *reply, QSaveFile *installerFile);
 
 private:
     void fetchNextUrl();
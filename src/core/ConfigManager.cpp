@@ -3,12 +3,14 @@
 #include <QCoreApplication>
 #include <QStandardPaths>
 #include <QFile>
+#include <QTimer>
+#include "utils/LaunchArgs.h"
 
 ConfigManager::ConfigManager(const QString &filePath, QObject *parent)
     : QObject(parent) {
     // Determine the OS-native user data directory (e.g., %LOCALAPPDATA%\LzyDownloader)
     QString configDir = QStandardPaths::writableLocation(QStandardPaths::AppLocalDataLocation);
-    if (QCoreApplication::arguments().contains("--headless") || QCoreApplication::arguments().contains("--server")) {
+    if (LaunchArgs::isServerMode()) {
         configDir = QDir(configDir).filePath("Server");
     }
     QDir dir(configDir);
@@ -24,6 +26,20 @@ ConfigManager::ConfigManager(const QString &filePath, QObject *parent)
     }
 
     m_settings = new QSettings(configPath, QSettings::IniFormat, this);
+
+    // Settings changed from combos and toggles are live in QSettings at once;
+    // scheduleSave() coalesces the disk sync so scrolling through a combo
+    // writes the file once.
+    m_saveTimer = new QTimer(this);
+    m_saveTimer->setSingleShot(true);
+    m_saveTimer->setInterval(250);
+    connect(m_saveTimer, &QTimer::timeout, this, &ConfigManager::save);
+    // Flush a change that is still waiting on the debounce timer before exit.
+    connect(qApp, &QCoreApplication::aboutToQuit, this, [this]() {
+        if (m_saveTimer->isActive()) {
+            save();
+        }
+    });
     initializeDefaultSettings();
     cleanUpLegacyKeys();
 
@@ -162,6 +178,22 @@ QVariant ConfigManager::get(const QString &section, const QString &key, const QV
     return m_settings->value(section + "/" + key, finalFallback);
 }
 
+QVariantMap ConfigManager::getSection(const QString &section) {
+    // Snapshot a whole group: application defaults first, then any stored
+    // values on top. Keys are read by their full "section/key" path rather than
+    // through beginGroup()/endGroup(), because the shared QSettings group
+    // prefix would otherwise leak into get() calls made from worker threads.
+    QVariantMap values = m_defaultSettings.value(section);
+    const QString prefix = section + "/";
+    const QStringList keys = m_settings->allKeys();
+    for (const QString &fullKey : keys) {
+        if (fullKey.startsWith(prefix) && fullKey.indexOf(u'/', prefix.size()) < 0) {
+            values.insert(fullKey.mid(prefix.size()), m_settings->value(fullKey));
+        }
+    }
+    return values;
+}
+
 bool ConfigManager::set(const QString &section, const QString &key, const QVariant &value) {
     QString fullKey = section + "/" + key;
     if (m_settings->contains(fullKey) && m_settings->value(fullKey) == value) {
@@ -181,9 +213,14 @@ void ConfigManager::remove(const QString &section, const QString &key) {
 }
 
 void ConfigManager::save() {
+    m_saveTimer->stop();
     m_settings->sync();
 }
 
+void ConfigManager::scheduleSave() {
+    m_saveTimer->start();
+}
+
 QString ConfigManager::getConfigDir() const {
     return QFileInfo(m_settings->fileName()).absolutePath();
 }
@@ -5,15 +5,19 @@
 #include <QSettings>
 #include <QVariant>
 
+class QTimer;
+
 class ConfigManager : public QObject {
     Q_OBJECT
 
 public:
     explicit ConfigManager(const QString &filePath, QObject *parent = nullptr);
     QVariant get(const QString &section, const QString &key, const QVariant &defaultValue = QVariant());
+    QVariantMap getSection(const QString &section);
     bool set(const QString &section, const QString &key, const QVariant &value);
     void remove(const QString &section, const QString &key);
     void save();
+    void scheduleSave();
     QString getConfigDir() const;
     void setDefaults();
     QVariant getDefault(const QString &section, const QString &key);
@@ -28,6 +32,7 @@ private:
     void cleanUpLegacyKeys();
 
     QSettings *m_settings;
+    QTimer *m_saveTimer;
     QMap<QString, QMap<QString, QVariant>> m_defaultSettings;
 };
 
@@ -8,13 +8,16 @@
 #include <QFileInfo>
 #include <QJsonDocument>
 #include <QJsonObject>
-#include <QThread>
-#include <QCoreApplication>
+#include <QTimer>
 #include <QUrlQuery>
 #include <QDebug>
 
 namespace { // Anonymous namespace to limit scope to this file
 
+constexpr int kSizeCheckIntervalMs = 100;
+constexpr int kStableSizeChecks = 3;
+constexpr int kMaxSizeChecks = 20;
+
 void cleanupTempFiles(const DownloadItem &item, const QDir &tempDir, const QString &mediaInfoJsonPath)
 {
     if (item.options.value("type").toString() == "gallery") {
@@ -148,28 +151,32 @@ void DownloadFinalizer::finalize(const QString &id, DownloadItem item) {
         item.metadata["playlist_index"] = item.playlistIndex;
     }
 
-    qint64 lastSize = -1;
-    int stableCount = 0;
-    int maxRetries = 20;
-
     emit progressUpdated(id, {{"status", "Verifying download completeness..."}});
 
     if (fileInfo.isFile()) {
-        for (int i = 0; i < maxRetries; ++i) {
-            fileInfo.refresh();
-            qint64 currentSize = fileInfo.size();
-            if (currentSize == lastSize && currentSize > 0) {
-                stableCount++;
-            } else {
-                stableCount = 0;
-            }
-            lastSize = currentSize;
-            if (stableCount >= 3) break;
-            QThread::msleep(100);
-            QCoreApplication::processEvents();
-        }
+        waitForStableSize(id, item, -1, 0, 0);
+    } else {
+        applySortingAndMove(id, item);
+    }
+}
+
+void DownloadFinalizer::waitForStableSize(const QString &id, const DownloadItem &item, qint64 lastSize, int stableCount, int attempt) {
+    const qint64 currentSize = QFileInfo(item.tempFilePath).size();
+    stableCount = (currentSize == lastSize && currentSize > 0) ? stableCount + 1 : 0;
+    if (stableCount >= kStableSizeChecks || attempt + 1 >= kMaxSizeChecks) {
+        applySortingAndMove(id, item);
+        return;
     }
-    
+
+    // Re-check from the event loop instead of sleeping the GUI thread between reads.
+    QTimer::singleShot(kSizeCheckIntervalMs, this, [this, id, item, currentSize, stableCount, attempt]() {
+        waitForStableSize(id, item, currentSize, stableCount, attempt + 1);
+    });
+}
+
+void DownloadFinalizer::applySortingAndMove(const QString &id, DownloadItem item) {
+    const QFileInfo fileInfo(item.tempFilePath);
+
     emit progressUpdated(id, {{"status", "Applying sorting rules..."}});
 
     QString finalDir = m_sortingManager->getSortedDirectory(item.metadata, item.options);
@@ -23,6 +23,8 @@ signals:
     void finalPathReady(const QString &id, const QString &path);
 
 private:
+    void waitForStableSize(const QString &id, const DownloadItem &item, qint64 lastSize, int stableCount, int attempt);
+    void applySortingAndMove(const QString &id, DownloadItem item);
     bool copyDirectoryRecursively(const QString &sourceDir, const QString &destDir);
 
     ConfigManager *m_configManager;
@@ -159,6 +159,8 @@ void DownloadManager::onConfigSettingChanged(const QString &section, const QStri
 
     applyMaxConcurrentSetting(value.toString());
     
+    // This is the only place that reacts to max_threads, so raising the limit
+    // fills the new slots here without a second, queued reschedule elsewhere.
     // Only attempt to start downloads if there are actually items in the queue.
     // This prevents a spurious queueFinished signal when the user clicks Download 
     // and the UI saves the max_threads setting before the new item is enqueued.
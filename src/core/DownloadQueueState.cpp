@@ -7,12 +7,13 @@
 #include <QJsonObject>
 #include <QDebug>
 #include <QCoreApplication>
+#include "utils/LaunchArgs.h"
 
 DownloadQueueState::DownloadQueueState(QObject *parent)
     : QObject(parent)
 {
     QString configDir = QStandardPaths::writableLocation(QStandardPaths::AppConfigLocation);
-    if (QCoreApplication::arguments().contains("--headless") || QCoreApplication::arguments().contains("--server")) {
+    if (LaunchArgs::isServerMode()) {
         configDir = QDir(configDir).filePath("Server");
     }
     QDir().mkpath(configDir);
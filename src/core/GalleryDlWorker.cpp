@@ -67,10 +67,11 @@ void GalleryDlWorker::onReadyReadStandardOutput()
     QByteArray completeData = m_outputBuffer.left(lastDelimiter + 1);
     m_outputBuffer.remove(0, lastDelimiter + 1);
 
-    const QStringList lines = QString::fromUtf8(completeData).split(QRegularExpression("[\\r\\n]"), Qt::SkipEmptyParts);
+    static const QRegularExpression lineBreakRe("[\\r\\n]");
+    const QStringList lines = QString::fromUtf8(completeData).split(lineBreakRe, Qt::SkipEmptyParts);
 
     // Match file paths on Windows (C:\...), UNC (\\server\...), and Unix (/home/...)
-    QRegularExpression pathRe(R"((?:(?:[A-Za-z]:[/\\])|(?:[/\\]{2}[\w.-]+[/\\])|(?:/[A-Za-z0-9_.-]+?/))[^\n]+\.(?:jpg|jpeg|png|gif|webp|webm|mp4|mkv|avi|mov|pdf|zip|txt|mp3|ogg|flac|wav|svg|bmp|tiff|gifv|mpd|m3u8|vtt|ass|srt|json|xml|html|torrent|cbz|cbr|epub))", QRegularExpression::CaseInsensitiveOption);
+    static const QRegularExpression pathRe(R"((?:(?:[A-Za-z]:[/\\])|(?:[/\\]{2}[\w.-]+[/\\])|(?:/[A-Za-z0-9_.-]+?/))[^\n]+\.(?:jpg|jpeg|png|gif|webp|webm|mp4|mkv|avi|mov|pdf|zip|txt|mp3|ogg|flac|wav|svg|bmp|tiff|gifv|mpd|m3u8|vtt|ass|srt|json|xml|html|torrent|cbz|cbr|epub))", QRegularExpression::CaseInsensitiveOption);
 
     for (const QString &line : lines) {
         QString trimmedLine = line.trimmed();
@@ -111,7 +112,8 @@ void GalleryDlWorker::onReadyReadStandardError()
     QByteArray completeData = m_errorBuffer.left(lastDelimiter + 1);
     m_errorBuffer.remove(0, lastDelimiter + 1);
 
-    const QStringList lines = QString::fromUtf8(completeData).split(QRegularExpression("[\\r\\n]"), Qt::SkipEmptyParts);
+    static const QRegularExpression lineBreakRe("[\\r\\n]");
+    const QStringList lines = QString::fromUtf8(completeData).split(lineBreakRe, Qt::SkipEmptyParts);
 
     for (const QString &line : lines) {
         QString trimmedLine = line.trimmed();
@@ -10,6 +10,7 @@
 #include <QRegularExpression>
 #include <QDebug>
 #include <QCoreApplication>
+#include "utils/LaunchArgs.h"
 
 LocalApiServer::LocalApiServer(ConfigManager *configManager, QObject *parent)
     : QObject(parent), m_configManager(configManager), m_server(new QTcpServer(this))
@@ -62,7 +63,7 @@ QString LocalApiServer::getApiKey() const
 void LocalApiServer::generateOrLoadApiKey()
 {
     QString dataPath = QStandardPaths::writableLocation(QStandardPaths::AppLocalDataLocation);
-    if (QCoreApplication::arguments().contains("--headless") || QCoreApplication::arguments().contains("--server")) {
+    if (LaunchArgs::isServerMode()) {
         dataPath = QDir(dataPath).filePath("Server");
     }
     QDir().mkpath(dataPath);
@@ -179,6 +179,8 @@ FoundBinary findBinary(const QString& name, ConfigManager* configManager)
 FoundBinary resolveBinary(const QString& name, ConfigManager* configManager)
 {
 #ifdef Q_OS_WIN
+    // Naming the .exe suffix up front makes findExecutable check one file per
+    // PATH directory instead of trying every %PATHEXT% extension.
     QString exeName = name + ".exe";
 #else
     QString exeName = name;
@@ -222,20 +224,9 @@ FoundBinary resolveBinary(const QString& name, ConfigManager* configManager)
         return {QDir::toNativeSeparators(userToolPath), "User Local"};
     }
 
-    qDebug() << "[ProcessUtils]" << name << "NOT FOUND - searching all PATH directories for" << exeName;
-    
-    // Final diagnostic: manually search PATH
-    QString pathEnv = QProcessEnvironment::systemEnvironment().value("PATH");
-    QStringList pathDirs = pathEnv.split(QDir::listSeparator(), Qt::SkipEmptyParts);
-    qDebug() << "[ProcessUtils] PATH contains" << pathDirs.size() << "directories";
-    for (const QString& dir : pathDirs) {
-        QString candidate = QDir(dir).filePath(exeName);
-        if (QFileInfo::exists(candidate)) {
-            qDebug() << "[ProcessUtils] FOUND" << name << "at" << candidate << "(in PATH dir:" << dir << ")";
-            return {QDir::toNativeSeparators(candidate), "System PATH"};
-        }
-    }
-    
+    // findExecutable already walked every PATH directory above, so a second
+    // manual pass would only repeat the same misses.
+    qDebug() << "[ProcessUtils]" << name << "NOT FOUND in PATH or common user locations";
     return {name, "Not Found"};
 }
 
@@ -260,9 +251,14 @@ bool hasCachedBinary(const QString& name) {
 }
 
 void setProcessEnvironment(QProcess &process) {
-    QProcessEnvironment env = QProcessEnvironment::systemEnvironment();
-    env.insert("PYTHONUTF8", "1");
-    env.insert("PYTHONIOENCODING", "utf-8");
+    // The app never changes its own environment, so snapshot it once instead of
+    // copying the whole system environment for every launched process.
+    static const QProcessEnvironment env = [] {
+        QProcessEnvironment base = QProcessEnvironment::systemEnvironment();
+        base.insert("PYTHONUTF8", "1");
+        base.insert("PYTHONIOENCODING", "utf-8");
+        return base;
+    }();
     process.setProcessEnvironment(env);
 
 #ifdef Q_OS_WIN
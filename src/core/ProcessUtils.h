@@ -1,6 +1,7 @@
 #pragma once
 #include <QString>
 #include <QHash>
+#include <QStringList>
 
 class ConfigManager;
 class QProcess;
@@ -10,6 +11,11 @@ namespace ProcessUtils {
         QString path;
         QString source; // "Custom", "Bundled", "System PATH", or "Not Found"
     };
+    // Binaries each download backend needs. Shared read-only lists rather than
+    // a fresh QStringList at every availability check.
+    inline const QStringList kYtDlpRequiredBinaries = {"yt-dlp", "ffmpeg", "ffprobe", "deno"};
+    inline const QStringList kGalleryDlRequiredBinaries = {"gallery-dl", "ffmpeg", "ffprobe"};
+
     FoundBinary findBinary(const QString& name, ConfigManager* configManager);
     FoundBinary resolveBinary(const QString& name, ConfigManager* configManager);
     void setProcessEnvironment(QProcess &process);
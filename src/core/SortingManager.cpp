@@ -10,6 +10,8 @@
 
 SortingManager::SortingManager(ConfigManager *configManager, QObject *parent)
     : QObject(parent), m_configManager(configManager) {
+    connect(m_configManager, &ConfigManager::settingChanged, this, &SortingManager::onSettingChanged);
+    connect(m_configManager, &ConfigManager::settingsReset, this, [this]() { m_rulesLoaded = false; });
 }
 
 namespace {
@@ -106,6 +108,60 @@ bool hasPlaylistContext(const QVariantMap &metadata, const QVariantMap &download
 
 }
 
+void SortingManager::onSettingChanged(const QString &section) {
+    if (section == "SortingRules") {
+        m_rulesLoaded = false;
+    }
+}
+
+const QList<SortingManager::Rule> &SortingManager::rules() {
+    if (m_rulesLoaded) {
+        return m_rules;
+    }
+
+    // Rules are stored with flat keys: rule_N_name, rule_N_applies_to, rule_N_target_folder, etc.
+    m_rules.clear();
+    const int size = m_configManager->get("SortingRules", "size", 0).toInt();
+    for (int i = 0; i < size; ++i) {
+        QString key = QString("rule_%1").arg(i);
+
+        Rule rule;
+        rule.name = m_configManager->get("SortingRules", key + "_name").toString();
+        QVariant appliesToVar = m_configManager->get("SortingRules", key + "_applies_to");
+        rule.appliesTo = appliesToVar.isValid() ? appliesToVar.toString() : "All Downloads";
+        rule.targetFolder = m_configManager->get("SortingRules", key + "_target_folder").toString();
+        rule.subfolderPattern = m_configManager->get("SortingRules", key + "_subfolder_pattern").toString();
+
+        int condSize = m_configManager->get("SortingRules", key + "_conditions_size", 0).toInt();
+        for (int j = 0; j < condSize; ++j) {
+            QString condKey = key + QString("_condition_%1").arg(j);
+            RuleCondition condition;
+            condition.field = m_configManager->get("SortingRules", condKey + "_field").toString();
+            condition.op = m_configManager->get("SortingRules", condKey + "_operator").toString();
+            condition.value = m_configManager->get("SortingRules", condKey + "_value").toString();
+            if (canonicalOperator(condition.op) == "is_one_of") {
+                // Split and trim the value list once rather than on every match.
+                for (QStringView line : QStringView(condition.value).split(u'\n')) {
+                    const QStringView trimmed = line.trimmed();
+                    if (!trimmed.isEmpty()) {
+                        condition.values.append(trimmed.toString());
+                    }
+                }
+            }
+            rule.conditions.append(condition);
+        }
+
+        // Skip invalid rules
+        if (rule.name.isEmpty() || rule.targetFolder.isEmpty()) {
+            qDebug() << "  Rule" << i << "(" << key << ") is invalid (empty name or target), skipping.";
+            continue;
+        }
+        m_rules.append(rule);
+    }
+    m_rulesLoaded = true;
+    return m_rules;
+}
+
 QString SortingManager::normalizedMetadataKey(const QString &key) const {
     QString normalized = key.trimmed().toLower();
     normalized.replace(QRegularExpression("[^a-z0-9]+"), "_");
@@ -188,9 +244,9 @@ QString SortingManager::getSortedDirectory(const QVariantMap &videoMetadata, con
     }
     qDebug() << "  downloadOptions type:" << downloadOptions.value("type", "video").toString();
 
-    int size = m_configManager->get("SortingRules", "size", 0).toInt();
-    qDebug() << "  SortingRules size:" << size;
-    if (size == 0) {
+    const QList<Rule> &sortingRules = rules();
+    qDebug() << "  SortingRules size:" << sortingRules.size();
+    if (sortingRules.isEmpty()) {
         // No rules to process, return default directory
         QString baseDir = m_configManager->get("Paths", "completed_downloads_directory").toString();
         if (baseDir.isEmpty()) {
@@ -199,35 +255,14 @@ QString SortingManager::getSortedDirectory(const QVariantMap &videoMetadata, con
         return baseDir;
     }
 
-    // Rules are stored with flat keys: rule_N_name, rule_N_applies_to, rule_N_target_folder, etc.
-    for (int i = 0; i < size; ++i) {
-        QString key = QString("rule_%1").arg(i);
-        
-        QString ruleName = m_configManager->get("SortingRules", key + "_name").toString();
-        QVariant appliesToVar = m_configManager->get("SortingRules", key + "_applies_to");
-        QString appliesTo = appliesToVar.isValid() ? appliesToVar.toString() : "All Downloads";
-        QString targetFolder = m_configManager->get("SortingRules", key + "_target_folder").toString();
-        QString subfolderPattern = m_configManager->get("SortingRules", key + "_subfolder_pattern").toString();
-        
-        // Load conditions
-        int condSize = m_configManager->get("SortingRules", key + "_conditions_size", 0).toInt();
-        QJsonArray conditionsArray;
-        for (int j = 0; j < condSize; ++j) {
-            QString condKey = key + QString("_condition_%1").arg(j);
-            QJsonObject cond;
-            cond["field"] = m_configManager->get("SortingRules", condKey + "_field").toString();
-            cond["operator"] = m_configManager->get("SortingRules", condKey + "_operator").toString();
-            cond["value"] = m_configManager->get("SortingRules", condKey + "_value").toString();
-            conditionsArray.append(cond);
-        }
-        
-        // Skip invalid rules
-        if (ruleName.isEmpty() || targetFolder.isEmpty()) {
-            qDebug() << "  Rule" << i << "(" << key << ") is invalid (empty name or target), skipping.";
-            continue;
-        }
-        
-        qDebug() << "  Checking rule" << i << "(" << ruleName << "), appliesTo:" << appliesTo << "targetFolder:" << targetFolder << "conditions:" << condSize;
+    for (int i = 0; i < sortingRules.size(); ++i) {
+        const Rule &rule = sortingRules.at(i);
+        const QString &ruleName = rule.name;
+        const QString &appliesTo = rule.appliesTo;
+        const QString &targetFolder = rule.targetFolder;
+        const QString &subfolderPattern = rule.subfolderPattern;
+
+        qDebug() << "  Checking rule" << i << "(" << ruleName << "), appliesTo:" << appliesTo << "targetFolder:" << targetFolder << "conditions:" << rule.conditions.size();
 
         // 1. Check if the rule applies to this download type
         QString downloadType = downloadOptions.value("type", "video").toString();
@@ -254,13 +289,12 @@ QString SortingManager::getSortedDirectory(const QVariantMap &videoMetadata, con
         }
 
         // 2. Check if all conditions match
-        qDebug() << "    Conditions count:" << conditionsArray.size();
+        qDebug() << "    Conditions count:" << rule.conditions.size();
         bool allConditionsMatch = true;
-        for (int c = 0; c < conditionsArray.size(); ++c) {
-            QJsonObject condition = conditionsArray[c].toObject();
-            QString field = condition["field"].toString();
-            QString op = condition["operator"].toString();
-            QString value = condition["value"].toString();
+        for (int c = 0; c < rule.conditions.size(); ++c) {
+            const QString &field = rule.conditions.at(c).field;
+            const QString &op = rule.conditions.at(c).op;
+            const QString &value = rule.conditions.at(c).value;
 
             const QString normalizedOperator = canonicalOperator(op);
             QVariant metadataValue = metadataValueForField(field, sortingMetadata);
@@ -293,12 +327,13 @@ QString SortingManager::getSortedDirectory(const QVariantMap &videoMetadata, con
                 } else if (normalizedOperator == "ends_with") {
                     match = metadataValue.toString().endsWith(value, Qt::CaseInsensitive);
                 } else if (normalizedOperator == "is_one_of") {
-                    QStringList values = value.split('\n', Qt::SkipEmptyParts);
+                    const QStringList &values = rule.conditions.at(c).values;
+                    const QString metadataText = metadataValue.toString();
                     qDebug() << "      Is One Of has" << values.size() << "values. First 5:" << values.mid(0, 5);
                     for (const QString &v : values) {
-                        if (metadataValue.toString().compare(v.trimmed(), Qt::CaseInsensitive) == 0) {
+                        if (metadataText.compare(v, Qt::CaseInsensitive) == 0) {
                             match = true;
-                            qDebug() << "      Is One Of MATCHED on:" << v.trimmed();
+                            qDebug() << "      Is One Of MATCHED on:" << v;
                             break;
                         }
                     }
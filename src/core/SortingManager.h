@@ -3,6 +3,8 @@
 
 #include <QObject>
 #include <QVariantMap>
+#include <QList>
+#include <QStringList>
 #include "ConfigManager.h"
 
 class SortingManager : public QObject {
@@ -13,7 +15,26 @@ public:
 
     QString getSortedDirectory(const QVariantMap &videoMetadata, const QVariantMap &downloadOptions);
 
+private slots:
+    void onSettingChanged(const QString &section);
+
 private:
+    struct RuleCondition {
+        QString field;
+        QString op;
+        QString value;
+        QStringList values; // Trimmed lines of an "Is One Of" value
+    };
+
+    struct Rule {
+        QString name;
+        QString appliesTo;
+        QString targetFolder;
+        QString subfolderPattern;
+        QList<RuleCondition> conditions;
+    };
+
+    const QList<Rule> &rules();
     QVariant metadataValueForField(const QString &field, const QVariantMap &metadata) const;
     QVariant metadataValueForKey(const QString &key, const QVariantMap &metadata) const;
     QString normalizedMetadataKey(const QString &key) const;
@@ -21,6 +42,9 @@ private:
     QString parseAndReplaceTokens(const QString &pattern, const QVariantMap &metadata);
 
     ConfigManager *m_configManager;
+    // Parsed copy of the SortingRules section, rebuilt after it changes.
+    QList<Rule> m_rules;
+    bool m_rulesLoaded = false;
 };
 
 #endif // SORTINGMANAGER_H
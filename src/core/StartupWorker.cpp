@@ -54,8 +54,7 @@ void StartupWorker::logBinaryPaths() {
 
 void StartupWorker::checkBinaries() {
     QStringList missing;
-    const QStringList requiredBinaries = {"yt-dlp", "ffmpeg", "ffprobe", "deno"};
-    for (const QString &binary : requiredBinaries) {
+    for (const QString &binary : ProcessUtils::kYtDlpRequiredBinaries) {
         QString source = ProcessUtils::findBinary(binary, m_configManager).source;
         if (source == "Not Found" || source == "Invalid Custom") {
             missing << binary;
@@ -3,6 +3,10 @@
 #include "core/ProcessUtils.h"
 #include <QDebug>
 
+namespace {
+constexpr int kMaxValidatedUrls = 512;
+}
+
 UrlValidator::UrlValidator(ConfigManager *configManager, QObject *parent)
     : QObject(parent), m_configManager(configManager) {
 
@@ -11,6 +15,12 @@ UrlValidator::UrlValidator(ConfigManager *configManager, QObject *parent)
 }
 
 void UrlValidator::validate(const QString &url) {
+    if (m_validatedUrls.contains(url)) {
+        qDebug() << "UrlValidator: URL already validated this session:" << url;
+        emit validationFinished(true, QString());
+        return;
+    }
+
     YtDlpArgsBuilder argsBuilder;
     const QStringList args = argsBuilder.buildValidationArgs(m_configManager, url);
     if (args.isEmpty()) {
@@ -26,13 +36,19 @@ void UrlValidator::validate(const QString &url) {
 
     ProcessUtils::setProcessEnvironment(*m_process);
     qDebug() << "UrlValidator executing command:" << ytDlpBinary.path << args;
+    m_pendingUrl = url;
     m_process->start(ytDlpBinary.path, args);
 }
 
 void UrlValidator::onProcessFinished(int exitCode, QProcess::ExitStatus exitStatus) {
     bool isValid = (exitStatus == QProcess::NormalExit && exitCode == 0);
     QString error;
-    if (!isValid) {
+    if (isValid) {
+        if (m_validatedUrls.size() >= kMaxValidatedUrls) {
+            m_validatedUrls.clear();
+        }
+        m_validatedUrls.insert(m_pendingUrl);
+    } else {
         QString stderrOutput = m_process->readAllStandardError();
         qWarning().noquote() << "UrlValidator yt-dlp stderr:" << stderrOutput.trimmed();
         error = "yt-dlp encountered an error.";
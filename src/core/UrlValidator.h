@@ -3,6 +3,7 @@
 
 #include <QObject>
 #include <QProcess>
+#include <QSet>
 #include "ConfigManager.h"
 
 class UrlValidator : public QObject {
@@ -21,6 +22,10 @@ private slots:
 private:
     ConfigManager *m_configManager;
     QProcess *m_process;
+    QString m_pendingUrl;
+    // URLs yt-dlp has already accepted this session; re-submitting one skips
+    // spawning another validation process.
+    QSet<QString> m_validatedUrls;
 };
 
 #endif // URLVALIDATOR_H
\ No newline at end of file
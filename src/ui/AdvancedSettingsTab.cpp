@@ -24,7 +24,6 @@
 #include <QApplication>
 #include <QSizePolicy>
 #include <QEvent>
-#include <vector>
 
 #ifdef Q_OS_WIN
 #include <windows.h>
@@ -74,7 +73,6 @@ private:
 AdvancedSettingsTab::AdvancedSettingsTab(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
     setupUI();
-    loadSettings();
 }
 
 AdvancedSettingsTab::~AdvancedSettingsTab() {}
@@ -135,57 +133,55 @@ void AdvancedSettingsTab::setupUI() {
     m_categoryList->setSpacing(2);
     applyCategoryListStyleSheet();
     m_categoryList->setToolTip("Switch between advanced setting sections.");
-    auto addPage = [this](const QString &title, QWidget *page, const QString &tooltip) {
-        auto *item = new QListWidgetItem(title);
-        item->setToolTip(tooltip);
-        m_categoryList->addItem(item);
-        m_stackedWidget->addWidget(page);
-    };
-
-    ConfigurationPage* configPage = new ConfigurationPage(m_configManager, this);
-    connect(configPage, &ConfigurationPage::themeChanged, this, &AdvancedSettingsTab::onThemeChanged);
-
-    struct PageDescriptor {
-        QString title;
-        QWidget *page;
-        QString tooltip;
-    };
-
-    const std::vector<PageDescriptor> descriptors = {
+    m_categories = {
         { "Essentials",
-          new SettingsSectionPage({
-              configPage,
-              new AuthenticationPage(m_configManager, this)
-          }, this),
-          "Start here: folders, theme, local API, and login cookie access." },
+          "Start here: folders, theme, local API, and login cookie access.",
+          [this]() -> QWidget * {
+              ConfigurationPage *configPage = new ConfigurationPage(m_configManager, this);
+              connect(configPage, &ConfigurationPage::themeChanged, this, &AdvancedSettingsTab::onThemeChanged);
+              return new SettingsSectionPage({
+                  configPage,
+                  new AuthenticationPage(m_configManager, this)
+              }, this);
+          } },
         { "Formats",
-          new SettingsSectionPage({
-              new VideoSettingsPage(m_configManager, this),
-              new AudioSettingsPage(m_configManager, this),
-              new LivestreamSettingsPage(m_configManager, this)
-          }, this),
-          "Default video, audio, and livestream quality/format choices." },
+          "Default video, audio, and livestream quality/format choices.",
+          [this]() -> QWidget * {
+              return new SettingsSectionPage({
+                  new VideoSettingsPage(m_configManager, this),
+                  new AudioSettingsPage(m_configManager, this),
+                  new LivestreamSettingsPage(m_configManager, this)
+              }, this);
+          } },
         { "Download Flow",
-          new DownloadOptionsPage(m_configManager, this),
-          "Downloader engine, automation, clipping, chapters, filenames, and proxy behavior." },
+          "Downloader engine, automation, clipping, chapters, filenames, and proxy behavior.",
+          [this]() -> QWidget * { return new DownloadOptionsPage(m_configManager, this); } },
         { "Files & Tags",
-          new SettingsSectionPage({
-              new OutputTemplatesPage(m_configManager, this),
-              new MetadataPage(m_configManager, this),
-              new SubtitlesPage(m_configManager, this)
-          }, this),
-          "Filename templates, metadata, artwork, and subtitles." },
+          "Filename templates, metadata, artwork, and subtitles.",
+          [this]() -> QWidget * {
+              return new SettingsSectionPage({
+                  new OutputTemplatesPage(m_configManager, this),
+                  new MetadataPage(m_configManager, this),
+                  new SubtitlesPage(m_configManager, this)
+              }, this);
+          } },
         { "External Tools",
-          new BinariesPage(m_configManager, this),
-          "Manage paths, versions, installs, and updates for external dependencies." }
+          "Manage paths, versions, installs, and updates for external dependencies.",
+          [this]() -> QWidget * { return new BinariesPage(m_configManager, this); } }
     };
 
-    for (const auto &descriptor : descriptors) {
-        addPage(descriptor.title, descriptor.page, descriptor.tooltip);
+    // Each category starts as an empty placeholder; ensurePage() swaps in the
+    // real page the first time it is selected.
+    for (const CategoryPage &category : m_categories) {
+        auto *item = new QListWidgetItem(category.title);
+        item->setToolTip(category.tooltip);
+        m_categoryList->addItem(item);
+        m_stackedWidget->addWidget(new QWidget(m_stackedWidget));
     }
 
     // Dynamically adjust size policies to prevent hidden tabs from forcing a large minimum window width
     connect(m_categoryList, &QListWidget::currentRowChanged, this, [this](int index) {
+        ensurePage(index);
         for (int i = 0; i < m_stackedWidget->count(); ++i) {
             QWidget *page = m_stackedWidget->widget(i);
             if (i == index) {
@@ -234,11 +230,57 @@ void AdvancedSettingsTab::setupUI() {
     connect(m_restoreDefaultsButton, &QPushButton::clicked, this, &AdvancedSettingsTab::restoreDefaults);
 }
 
+QWidget *AdvancedSettingsTab::ensurePage(int index) {
+    if (index < 0 || index >= m_categories.size()) {
+        return nullptr;
+    }
+
+    CategoryPage &category = m_categories[index];
+    if (category.page) {
+        return category.page;
+    }
+
+    QWidget *placeholder = m_stackedWidget->widget(index);
+    category.page = category.create();
+    m_stackedWidget->insertWidget(index, category.page);
+    // Pages built off-screen (e.g. External Tools for the missing-binaries dialog)
+    // must not count toward the stack's minimum size until they are shown.
+    if (index == m_categoryList->currentRow()) {
+        category.page->setSizePolicy(QSizePolicy::Preferred, QSizePolicy::Preferred);
+    } else {
+        category.page->setSizePolicy(QSizePolicy::Ignored, QSizePolicy::Ignored);
+    }
+    m_stackedWidget->removeWidget(placeholder);
+    placeholder->deleteLater();
+
+    QMetaObject::invokeMethod(category.page, "loadSettings");
+    if (auto *binaries = qobject_cast<BinariesPage *>(category.page)) {
+        if (!m_galleryDlVersion.isEmpty()) {
+            binaries->setGalleryDlVersion(m_galleryDlVersion);
+        }
+        if (!m_ytDlpVersion.isEmpty()) {
+            binaries->setYtDlpVersion(m_ytDlpVersion);
+        }
+    }
+    return category.page;
+}
+
+BinariesPage *AdvancedSettingsTab::binariesPage() {
+    for (int i = 0; i < m_categories.size(); ++i) {
+        if (m_categories.at(i).title == "External Tools") {
+            return qobject_cast<BinariesPage *>(ensurePage(i));
+        }
+    }
+    return nullptr;
+}
+
 void AdvancedSettingsTab::loadSettings() {
-    for (int i = 0; i < m_stackedWidget->count(); ++i) {
-        QWidget *page = m_stackedWidget->widget(i);
-        // Invoke dynamically so we don't need to manually cast/know the types 
-        QMetaObject::invokeMethod(page, "loadSettings");
+    // Pages that have not been built yet read their settings when first shown.
+    for (const CategoryPage &category : m_categories) {
+        if (category.page) {
+            // Invoke dynamically so we don't need to manually cast/know the types
+            QMetaObject::invokeMethod(category.page, "loadSettings");
+        }
     }
 }
 
@@ -260,12 +302,14 @@ void AdvancedSettingsTab::changeEvent(QEvent *event) {
 }
 
 void AdvancedSettingsTab::setGalleryDlVersion(const QString &version) {
+    m_galleryDlVersion = version;
     if (auto page = m_stackedWidget->findChild<BinariesPage*>()) {
         page->setGalleryDlVersion(version);
     }
 }
 
 void AdvancedSettingsTab::setYtDlpVersion(const QString &version) {
+    m_ytDlpVersion = version;
     if (auto page = m_stackedWidget->findChild<BinariesPage*>()) {
         page->setYtDlpVersion(version);
     }
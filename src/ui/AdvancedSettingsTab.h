@@ -3,6 +3,8 @@
 
 #include "core/ConfigManager.h"
 #include <QtWidgets/QWidget>
+#include <QVector>
+#include <functional>
 
 class QEvent;
 
@@ -10,6 +12,7 @@ class QListWidget;
 class QStackedWidget;
 class QPushButton;
 class UpdatesPage;
+class BinariesPage;
 
 class AdvancedSettingsTab : public QWidget {
     Q_OBJECT
@@ -18,6 +21,8 @@ public:
     explicit AdvancedSettingsTab(ConfigManager *configManager, QWidget *parent = nullptr);
     ~AdvancedSettingsTab();
 
+    BinariesPage *binariesPage();
+
 signals:
     void themeChanged(const QString &themeName);
 
@@ -34,12 +39,23 @@ private:
     void setupUI();
     void loadSettings();
     void applyCategoryListStyleSheet();
+    QWidget *ensurePage(int index);
 
+    // Category pages are only constructed the first time they are shown.
+    struct CategoryPage {
+        QString title;
+        QString tooltip;
+        std::function<QWidget *()> create;
+        QWidget *page = nullptr;
+    };
 
     ConfigManager *m_configManager;
 
     QListWidget *m_categoryList;
     QStackedWidget *m_stackedWidget;
+    QVector<CategoryPage> m_categories;
+    QString m_galleryDlVersion;
+    QString m_ytDlpVersion;
 
     // Restore Defaults
     QPushButton *m_restoreDefaultsButton;
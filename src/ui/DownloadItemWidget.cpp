@@ -11,19 +11,93 @@
 #include <QPainter>
 #include <QApplication>
 #include <QStyle>
+#include <QHash>
+#include <QTimer>
+#include <QPalette>
+
+namespace {
+// Progress bar state colors. The app always runs the Fusion style, which paints
+// the chunk with the Highlight role, so bars are recolored through their
+// palette rather than a style sheet that has to be parsed on every change.
+const QColor kActiveChunkColor(0x3b, 0x82, 0xf6);
+const QColor kFinalizingChunkColor(0x00, 0x80, 0x80);
+const QColor kCompleteChunkColor(0x22, 0xc5, 0x5e);
+const QColor kOverallChunkColor(0x64, 0x74, 0x8b);
+const QColor kOverallCompleteChunkColor(0x94, 0xa3, 0xb8);
+const QColor kErrorTextColor(0xdc, 0x26, 0x26);
+
+const QString kErrorLabelStyle = QStringLiteral("color: #dc2626;");
+
+// Status words yt-dlp reports while post-processing after the transfer hits 100%.
+const QStringList kFinalizingStatusWords = {
+    "Processing", "Merging", "Post", "Extracting", "Converting", "Applying",
+    "Fixing", "Verifying", "Moving", "Copying", "Embedding"
+};
+
+bool isFinalizingStatus(const QString &status) {
+    if (status == "Complete") {
+        return true;
+    }
+    for (const QString &word : kFinalizingStatusWords) {
+        if (status.contains(word, Qt::CaseInsensitive)) {
+            return true;
+        }
+    }
+    return false;
+}
+
+// Minimum spacing between progress repaints for one row.
+constexpr int kProgressFlushIntervalMs = 100;
+
+// Roles left unset keep following the application palette, so theme switches
+// still reach the bar; an invalid color restores the default for that role.
+// QWidget::setPalette() ignores an identical palette, so repeated progress
+// updates in the same state cost nothing.
+void setProgressColors(QProgressBar *bar, const QColor &chunk, const QColor &text = QColor()) {
+    QPalette palette;
+    if (chunk.isValid()) {
+        palette.setColor(QPalette::Highlight, chunk);
+    }
+    if (text.isValid()) {
+        palette.setColor(QPalette::Text, text);
+    }
+    bar->setPalette(palette);
+}
+
+// setStyleSheet() repolishes the widget even when the sheet is unchanged, which
+// adds up when progress arrives several times a second per row.
+void setStyleSheetIfChanged(QWidget *widget, const QString &styleSheet) {
+    if (widget->styleSheet() != styleSheet) {
+        widget->setStyleSheet(styleSheet);
+    }
+}
+}
 
 static QIcon createColoredIcon(QStyle::StandardPixmap sp, const QColor &color) {
+    // Every download row uses the same handful of tinted icons, so render each
+    // one once and hand out the shared QIcon for later rows.
+    static QHash<quint64, QIcon> cache;
+    const quint64 key = (quint64(sp) << 32) | color.rgba();
+    auto it = cache.constFind(key);
+    if (it != cache.constEnd()) return it.value();
+
     QPixmap pixmap = QApplication::style()->standardIcon(sp).pixmap(32, 32);
     if (pixmap.isNull()) return QIcon();
     QPainter painter(&pixmap);
     painter.setCompositionMode(QPainter::CompositionMode_SourceIn);
     painter.fillRect(pixmap.rect(), color);
-    return QIcon(pixmap);
+    painter.end();
+    return cache.insert(key, QIcon(pixmap)).value();
 }
 
 DownloadItemWidget::DownloadItemWidget(const QVariantMap &itemData, QWidget *parent)
     : QWidget(parent), m_itemData(itemData) {
     setupUi();
+
+    m_progressFlushTimer = new QTimer(this);
+    m_progressFlushTimer->setSingleShot(true);
+    m_progressFlushTimer->setInterval(kProgressFlushIntervalMs);
+    connect(m_progressFlushTimer, &QTimer::timeout, this, &DownloadItemWidget::flushPendingProgress);
 }
 
 QString DownloadItemWidget::getId() const {
@@ -162,6 +236,44 @@ void DownloadItemWidget::updateProgress(const QVariantMap &progressData) {
         return; // Ignore delayed progress signals if already finished
     }
 
+    // yt-dlp reports progress many times a second. Apply the first update right
+    // away, then fold anything arriving within the flush interval into one
+    // pending update so each row repaints at most ~10 times a second.
+    if (!m_progressFlushTimer->isActive()) {
+        applyProgress(progressData);
+        m_progressFlushTimer->start();
+        return;
+    }
+
+    if (progressData.value("progress", 0).toInt() < 0) {
+        // Going back to indeterminate hides the overall bar, so an older
+        // overall value must not be replayed on top of it.
+        m_pendingProgress.remove("overall_progress");
+    }
+    for (auto it = progressData.cbegin(); it != progressData.cend(); ++it) {
+        m_pendingProgress.insert(it.key(), it.value());
+    }
+}
+
+void DownloadItemWidget::flushPendingProgress() {
+    if (m_pendingProgress.isEmpty() || m_isFinished) {
+        return;
+    }
+    applyPendingProgress();
+    m_progressFlushTimer->start();
+}
+
+void DownloadItemWidget::applyPendingProgress() {
+    m_progressFlushTimer->stop();
+    if (m_pendingProgress.isEmpty()) {
+        return;
+    }
+    const QVariantMap pending = m_pendingProgress;
+    m_pendingProgress.clear();
+    applyProgress(pending);
+}
+
+void DownloadItemWidget::applyProgress(const QVariantMap &progressData) {
     if (progressData.contains("title")) {
         const QString title = progressData["title"].toString().trimmed();
         if (!title.isEmpty()) {
@@ -171,7 +283,7 @@ void DownloadItemWidget::updateProgress(const QVariantMap &progressData) {
     }
 
     if (progressData.contains("status")) {
-        m_statusLabel->setStyleSheet("");
+        setStyleSheetIfChanged(m_statusLabel, QString());
         QString statusText = progressData["status"].toString();
 
         if (statusText == "Downloading...") {
@@ -190,30 +302,19 @@ void DownloadItemWidget::updateProgress(const QVariantMap &progressData) {
         if (progress < 0) {
             // Indeterminate state (queued/starting) - colorless/default
             m_progressBar->setRange(0, 0);
-            m_progressBar->setStyleSheet("");
+            setProgressColors(m_progressBar, QColor());
             m_progressBar->setProgressText("");
-        } else if (progress == 100 && (m_statusLabel->text().contains("Processing", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Merging", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Post", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Extracting", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Converting", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Applying", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Fixing", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Verifying", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Moving", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Copying", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text().contains("Embedding", Qt::CaseInsensitive) ||
-                                       m_statusLabel->text() == "Complete")) {
+        } else if (progress == 100 && isFinalizingStatus(m_statusLabel->text())) {
             // Still in post-processing / finalizing phase - teal (animated)
             m_progressBar->setRange(0, 0);
-            m_progressBar->setStyleSheet("QProgressBar::chunk { background-color: #008080; }");
+            setProgressColors(m_progressBar, kFinalizingChunkColor);
             m_progressBar->setProgressText("Finalizing...");
         } else {
             m_progressBar->setRange(0, 100);
             m_progressBar->setValue(progress);
 
             // Actively downloading - light blue for all active transfers
-            m_progressBar->setStyleSheet("QProgressBar::chunk { background-color: #3b82f6; }");
+            setProgressColors(m_progressBar, kActiveChunkColor);
 
             // Build centered progress text: percentage + size + speed + ETA
             QStringList parts;
@@ -237,7 +338,7 @@ void DownloadItemWidget::updateProgress(const QVariantMap &progressData) {
         m_overallProgressLabel->show();
         m_overallProgressBar->setRange(0, 100);
         m_overallProgressBar->setValue(overallProgress);
-        m_overallProgressBar->setStyleSheet("QProgressBar::chunk { background-color: #64748b; }");
+        setProgressColors(m_overallProgressBar, kOverallChunkColor);
 
         QString overallLabel = QString("Overall %1%").arg(overallProgress);
         if (progressData.contains("overall_downloaded_size") && progressData.contains("overall_total_size")) {
@@ -255,7 +356,8 @@ void DownloadItemWidget::updateProgress(const QVariantMap &progressData) {
 }
 
 void DownloadItemWidget::setThumbnail(const QString &imagePath) {
-    if (imagePath.isEmpty()) {
+    // Progress reports keep repeating the same path; only decode and scale it once.
+    if (imagePath.isEmpty() || imagePath == m_thumbnailPath) {
         return;
     }
 
@@ -272,6 +374,7 @@ void DownloadItemWidget::setThumbnail(const QString &imagePath) {
     // Scale the pixmap to fit the label while maintaining aspect ratio
     QPixmap scaled = pixmap.scaled(m_thumbnailLabel->size(), Qt::KeepAspectRatio, Qt::SmoothTransformation);
     m_thumbnailLabel->setPixmap(scaled);
+    m_thumbnailPath = imagePath;
 }
 
 void DownloadItemWidget::setFinalPath(const QString &path) {
@@ -280,6 +383,10 @@ void DownloadItemWidget::setFinalPath(const QString &path) {
 }
 
 void DownloadItemWidget::setFinished(bool success, const QString &message) {
+    // The worker's last progress update, carrying the final title and
+    // thumbnail, usually lands just before this while it is still being
+    // coalesced; apply it before switching to the finished state.
+    applyPendingProgress();
     m_cancelButton->hide();
     m_moveUpButton->hide();
     m_moveDownButton->hide();
@@ -292,9 +399,9 @@ void DownloadItemWidget::setFinished(bool success, const QString &message) {
         m_retryButton->setIcon(createColoredIcon(QStyle::SP_BrowserReload, QColor("#eab308")));
         m_retryButton->setToolTip("Retry");
         m_retryButton->show();
-        m_statusLabel->setStyleSheet("color: #dc2626;");
+        m_statusLabel->setStyleSheet(kErrorLabelStyle);
         if (m_progressBar->maximum() == 0) m_progressBar->setRange(0, 100); // Exit indeterminate mode
-        m_progressBar->setStyleSheet("QProgressBar { color: #dc2626; }");
+        setProgressColors(m_progressBar, QColor(), kErrorTextColor);
         m_progressBar->setProgressText("Download failed");
         m_overallProgressBar->hide();
         m_overallProgressLabel->hide();
@@ -308,12 +415,12 @@ void DownloadItemWidget::setFinished(bool success, const QString &message) {
         m_statusLabel->setStyleSheet("");
         m_progressBar->setRange(0, 100);
         m_progressBar->setValue(100);
-        m_progressBar->setStyleSheet("QProgressBar::chunk { background-color: #22c55e; }");
+        setProgressColors(m_progressBar, kCompleteChunkColor);
         m_progressBar->setProgressText("Complete");
         if (m_overallProgressBar->isVisible()) {
             m_overallProgressBar->setRange(0, 100);
             m_overallProgressBar->setValue(100);
-            m_overallProgressBar->setStyleSheet("QProgressBar::chunk { background-color: #94a3b8; }");
+            setProgressColors(m_overallProgressBar, kOverallCompleteChunkColor);
             m_overallProgressLabel->setText("Overall 100%");
         }
     }
@@ -321,6 +428,7 @@ void DownloadItemWidget::setFinished(bool success, const QString &message) {
 }
 
 void DownloadItemWidget::setCancelled() {
+    applyPendingProgress();
     m_cancelButton->hide();
     m_moveUpButton->hide();
     m_moveDownButton->hide();
@@ -331,10 +439,10 @@ void DownloadItemWidget::setCancelled() {
     m_isFinished = true;
     m_isSuccessful = false;
     m_clearButton->show();
-    m_statusLabel->setStyleSheet("color: #dc2626;");
+    m_statusLabel->setStyleSheet(kErrorLabelStyle);
     m_statusLabel->setText("Stopped");
     if (m_progressBar->maximum() == 0) m_progressBar->setRange(0, 100); // Exit indeterminate mode
-    m_progressBar->setStyleSheet("QProgressBar { color: #dc2626; }");
+    setProgressColors(m_progressBar, QColor(), kErrorTextColor);
     m_progressBar->setProgressText("Stopped");
     m_overallProgressBar->hide();
     m_overallProgressLabel->hide();
@@ -349,6 +457,7 @@ void DownloadItemWidget::setCancelled() {
 void DownloadItemWidget::setPaused(bool paused) {
     m_isPaused = paused;
     if (paused) {
+        applyPendingProgress();
         m_statusLabel->setText("Paused");
     }
 }
@@ -386,7 +495,7 @@ void DownloadItemWidget::onRetryClicked() {
 
     // Clear red error/stopped stylesheets
     m_statusLabel->setStyleSheet("");
-    m_progressBar->setStyleSheet("");
+    setProgressColors(m_progressBar, QColor());
 
     emit retryRequested(m_itemData);
 }
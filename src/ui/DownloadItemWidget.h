@@ -10,6 +10,7 @@
 class QLabel;
 class QPushButton;
 class QProgressBar;
+class QTimer;
 
 // Custom progress bar that paints the percentage text centered on the bar
 class ProgressLabelBar : public QProgressBar {
@@ -23,7 +24,11 @@ public:
         setTextVisible(false); // We draw our own centered text
     }
 
-    void setProgressText(const QString &text) { m_progressText = text; update(); }
+    void setProgressText(const QString &text) {
+        if (text == m_progressText) return;
+        m_progressText = text;
+        update();
+    }
     QString progressText() const { return m_progressText; }
 
 protected:
@@ -80,10 +85,13 @@ private slots:
     void onPauseResumeClicked();
     void onMoveUpClicked();
     void onMoveDownClicked();
+    void flushPendingProgress();
 
 private:
     void setupUi();
     void setThumbnail(const QString &imagePath);
+    void applyProgress(const QVariantMap &progressData);
+    void applyPendingProgress();
 
     QVariantMap m_itemData;
     QLabel *m_thumbnailLabel;
@@ -99,6 +107,9 @@ private:
     QPushButton *m_openFolderButton;
     QPushButton *m_moveUpButton;
     QPushButton *m_moveDownButton;
+    QTimer *m_progressFlushTimer;
+    QVariantMap m_pendingProgress;
+    QString m_thumbnailPath;
     bool m_isFinished = false;
     bool m_isSuccessful = false;
     bool m_isPaused = false;
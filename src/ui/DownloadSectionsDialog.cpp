@@ -12,11 +12,23 @@
 #include <QStandardItemModel>
 #include <QRegularExpression>
 
+namespace {
+// Shared by every section row the dialog creates.
+const QStringList kSectionTypeChoices = {"Time Range", "Chapter"};
+}
+
 DownloadSectionsDialog::DownloadSectionsDialog(const QVariantMap &infoDict, QWidget *parent)
     : QDialog(parent)
 {
     if (infoDict.contains("chapters") && infoDict["chapters"].typeId() == QMetaType::QVariantList) {
-        m_chapters = infoDict["chapters"].toList();
+        // Every section row offers the same chapter list, so extract the titles once.
+        const QVariantList chapters = infoDict["chapters"].toList();
+        for (const QVariant &chapter : chapters) {
+            QVariantMap chapterMap = chapter.toMap();
+            if (chapterMap.contains("title")) {
+                m_chapterTitles.append(chapterMap["title"].toString());
+            }
+        }
     }
     setupUi();
     addSectionWidget(); // Start with one section by default
@@ -94,10 +106,9 @@ QWidget* DownloadSectionsDialog::createSectionWidget()
     QComboBox *typeCombo = new QComboBox(frame);
     typeCombo->setObjectName("typeCombo");
     typeCombo->setToolTip("Choose whether to define the section by time or by chapter name.");
-    typeCombo->addItem("Time Range");
-    typeCombo->addItem("Chapter");
+    typeCombo->addItems(kSectionTypeChoices);
     typeCombo->setFixedWidth(120);
-    if (m_chapters.isEmpty()) {
+    if (m_chapterTitles.isEmpty()) {
         if (auto *model = qobject_cast<QStandardItemModel*>(typeCombo->model())) {
             model->item(1)->setEnabled(false);
         }
@@ -134,12 +145,7 @@ QWidget* DownloadSectionsDialog::createSectionWidget()
     QComboBox *chapterCombo = new QComboBox(chapterWidget);
     chapterCombo->setObjectName("chapterCombo");
     chapterCombo->setToolTip("Select a chapter to download.");
-    for (const QVariant &chapter : m_chapters) {
-        QVariantMap chapterMap = chapter.toMap();
-        if (chapterMap.contains("title")) {
-            chapterCombo->addItem(chapterMap["title"].toString());
-        }
-    }
+    chapterCombo->addItems(m_chapterTitles);
     chapterLayout->addWidget(new QLabel("Chapter:", chapterWidget));
     chapterLayout->addWidget(chapterCombo);
     chapterLayout->addStretch();
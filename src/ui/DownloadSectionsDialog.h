@@ -3,6 +3,7 @@
 #include <QDialog>
 #include <QVariantMap>
 #include <QList>
+#include <QStringList>
 
 class QVBoxLayout;
 class QWidget;
@@ -28,5 +29,5 @@ private:
     void removeSectionWidget(QWidget* sectionWidget);
 
     QVBoxLayout *m_sectionsLayout;
-    QVariantList m_chapters;
+    QStringList m_chapterTitles;
 };
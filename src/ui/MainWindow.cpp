@@ -25,6 +25,7 @@
 #include "ui/advanced_settings/BinariesPage.h"
 #include "ToggleSwitch.h"
 #include "utils/BinaryFinder.h"
+#include "utils/LaunchArgs.h"
 #include "SupportedSitesDialog.h"
 
 #include <QVBoxLayout>
@@ -40,6 +41,7 @@
 #include <QIcon>
 #include <QApplication>
 #include <QPalette>
+#include <QStyle>
 #include <QStyleFactory>
 #include <QDesktopServices>
 #include <QRegularExpression>
@@ -111,8 +113,7 @@ QString directCliUrl()
 
 bool hasNonInteractiveLaunchArgument()
 {
-    const QStringList args = QCoreApplication::arguments();
-    return args.contains("--headless") || args.contains("--server") || !directCliUrl().isEmpty();
+    return LaunchArgs::isServerMode() || !directCliUrl().isEmpty();
 }
 
 bool isNonInteractiveRequest(const QVariantMap &options)
@@ -140,7 +141,7 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
       m_silentUpdateCheck(false), m_nonInteractiveLaunch(hasNonInteractiveLaunchArgument()), m_lastAutoPasteTimestamp(0)
 {
     // Intercept window creation BEFORE it can be shown by main.cpp
-    if (QCoreApplication::arguments().contains("--headless") || QCoreApplication::arguments().contains("--server")) {
+    if (LaunchArgs::isServerMode()) {
         setAttribute(Qt::WA_DontShowOnScreen, true);
     }
 
@@ -162,6 +163,7 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
         m_configManager->set("General", "exit_after", false);
     }
     m_configManager->save();
+    m_exitAfter = m_configManager->get("General", "exit_after", false).toBool();
 
     m_archiveManager = new ArchiveManager(m_configManager, this);
     m_downloadManager = new DownloadManager(m_configManager, this);
@@ -170,15 +172,19 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
     m_clipboard = QApplication::clipboard(); // Initialize QClipboard
 
     // --- Dynamic Binary Discovery ---
-    QMap<QString, QString> foundBinaries = BinaryFinder::findAllBinaries();
-    for (auto it = foundBinaries.constBegin(); it != foundBinaries.constEnd(); ++it) {
-        QString configKey = it.key() + "_path";
-        QString currentPath = m_configManager->get("Binaries", configKey).toString();
-        // If current path is empty or invalid, update it
+    // Only search for binaries whose configured path is empty or invalid, so a
+    // launch with a working setup doesn't walk the search directories at all.
+    QStringList binariesToFind;
+    for (const QString &bin : BinaryFinder::allBinaryNames()) {
+        QString currentPath = m_configManager->get("Binaries", bin + "_path").toString();
         if (currentPath.isEmpty() || !QFile::exists(currentPath)) {
-            if (!it.value().isEmpty()) {
-                m_configManager->set("Binaries", configKey, it.value());
-            }
+            binariesToFind << bin;
+        }
+    }
+    QMap<QString, QString> foundBinaries = BinaryFinder::findBinaries(binariesToFind);
+    for (auto it = foundBinaries.constBegin(); it != foundBinaries.constEnd(); ++it) {
+        if (!it.value().isEmpty()) {
+            m_configManager->set("Binaries", it.key() + "_path", it.value());
         }
     }
     m_configManager->save();
@@ -205,17 +211,6 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
         qInfo() << "[LocalApi] Attempting to start Local API Server on startup...";
         m_localApiServer->start();
     }
-    connect(m_configManager, &ConfigManager::settingChanged, this, [this](const QString &section, const QString &key, const QVariant &value) {
-        if (section == "General" && key == "enable_local_api") {
-            if (value.toBool()) {
-                qInfo() << "[LocalApi] Local API Server enabled by user setting. Starting server...";
-                m_localApiServer->start();
-            } else {
-                qInfo() << "[LocalApi] Local API Server disabled by user setting. Stopping server...";
-                m_localApiServer->stop();
-            }
-        }
-    });
 
 #ifdef Q_OS_WIN
     bool isDebug = false;
@@ -226,21 +221,12 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
 #endif
     bool showConsole = m_configManager->get("General", "show_debug_console", isDebug).toBool();
     ApplyConsoleState(showConsole);
-    connect(m_configManager, &ConfigManager::settingChanged, this, [](const QString &section, const QString &key, const QVariant &value) {
-        if (section == "General" && key == "show_debug_console") {
-            ApplyConsoleState(value.toBool());
-        }
-    });
 #endif
 
-    // Dynamically reschedule queue if the user increases Max Concurrent
-    connect(m_configManager, &ConfigManager::settingChanged, this, [this](const QString &section, const QString &key, const QVariant &/*value*/) {
-        if (section == "General" && key == "max_threads") {
-            if (m_downloadManager) {
-                QMetaObject::invokeMethod(m_downloadManager, "startNextDownload", Qt::QueuedConnection);
-            }
-        }
-    });
+    // One slot handles every General setting MainWindow reacts to, instead of a
+    // separate closure per key that each run on every settings change.
+    connect(m_configManager, &ConfigManager::settingChanged, this, &MainWindow::onSettingChanged);
+    connect(m_configManager, &ConfigManager::settingsReset, this, &MainWindow::onSettingsReset);
 
     setupUI();
     setupTrayIcon();
@@ -313,7 +299,7 @@ MainWindow::MainWindow(ExtractorJsonParser *extractorJsonParser, QWidget *parent
 
     // Defer the setup dialogs until after the main window is shown
     QTimer::singleShot(0, this, [this]() {
-        bool isHeadless = QCoreApplication::arguments().contains("--headless") || QCoreApplication::arguments().contains("--server");
+        bool isHeadless = LaunchArgs::isServerMode();
         bool isNonInteractive = m_nonInteractiveLaunch;
 
         if (isHeadless) {
@@ -559,12 +545,11 @@ void MainWindow::setupUI() {
     m_uiBuilder->build(this, mainLayout, m_startTab, m_activeDownloadsTab, m_advancedSettingsTab, sortingTab);
 
     // Connect signals from the builder's widgets
-    connect(m_uiBuilder->exitAfterSwitch(), &ToggleSwitch::toggled, this, [this](bool checked){
-        m_configManager->set("General", "exit_after", checked);
-        m_configManager->save();
-    });
+    connect(m_uiBuilder->exitAfterSwitch(), &ToggleSwitch::toggled, this, &MainWindow::onExitAfterToggled);
 
-    connect(m_startTab, &StartTab::downloadRequested, this, &MainWindow::onDownloadRequested);
+    // Queued so the Download click returns (and the input clears) before binary
+    // checks, metadata fetches or process launches start for each URL.
+    connect(m_startTab, &StartTab::downloadRequested, this, &MainWindow::onDownloadRequested, Qt::QueuedConnection);
     connect(m_startTab, &StartTab::navigateToExternalBinaries, this, [this]() {
         m_uiBuilder->tabWidget()->setCurrentWidget(m_advancedSettingsTab);
         m_advancedSettingsTab->navigateToCategory("External Binaries");
@@ -763,8 +748,7 @@ void MainWindow::onDownloadRequested(const QString &url, const QVariantMap &opti
     QStringList missingBinaries;
 
     if (type == "gallery") {
-        QStringList required = {"gallery-dl", "ffmpeg", "ffprobe"};
-        for (const QString &bin : required) {
+        for (const QString &bin : ProcessUtils::kGalleryDlRequiredBinaries) {
             QString source = ProcessUtils::findBinary(bin, m_configManager).source;
             if (source == "Not Found" || source == "Invalid Custom") {
                 missingBinaries << bin;
@@ -776,8 +760,7 @@ void MainWindow::onDownloadRequested(const QString &url, const QVariantMap &opti
             missingBinaries << "yt-dlp";
         }
     } else {
-        QStringList required = {"yt-dlp", "ffmpeg", "ffprobe", "deno"};
-        for (const QString &bin : required) {
+        for (const QString &bin : ProcessUtils::kYtDlpRequiredBinaries) {
             QString source = ProcessUtils::findBinary(bin, m_configManager).source;
             if (source == "Not Found" || source == "Invalid Custom") {
                 missingBinaries << bin;
@@ -810,10 +793,10 @@ void MainWindow::onDownloadRequested(const QString &url, const QVariantMap &opti
 
         missingBinaries.clear();
         const QStringList requiredAfterSetup = type == "gallery"
-            ? QStringList{"gallery-dl", "ffmpeg", "ffprobe"}
+            ? ProcessUtils::kGalleryDlRequiredBinaries
             : type == "view_formats"
                 ? QStringList{"yt-dlp"}
-                : QStringList{"yt-dlp", "ffmpeg", "ffprobe", "deno"};
+                : ProcessUtils::kYtDlpRequiredBinaries;
         for (const QString &bin : requiredAfterSetup) {
             QString source = ProcessUtils::resolveBinary(bin, m_configManager).source;
             if (source == "Not Found" || source == "Invalid Custom") {
@@ -857,7 +840,7 @@ void MainWindow::onDownloadRequested(const QString &url, const QVariantMap &opti
         return;
     }
 
-    static QRegularExpression fastTrackRe(R"(^(https?://)?(www\.)?(youtube\.com|youtu\.be|music\.youtube\.com|tiktok\.com|instagram\.com|twitter\.com|x\.com)/)");
+    static const QRegularExpression fastTrackRe(R"(^(https?://)?(www\.)?(youtube\.com|youtu\.be|music\.youtube\.com|tiktok\.com|instagram\.com|twitter\.com|x\.com)/)");
     if (fastTrackRe.match(url).hasMatch()) {
         m_downloadManager->enqueueDownload(url, mutableOptions); // Corrected: m_downloadManager
         m_uiBuilder->tabWidget()->setCurrentWidget(m_activeDownloadsTab);
@@ -947,6 +930,40 @@ void MainWindow::onValidationFinished(bool isValid, const QString &error) {
     m_pendingOptions.clear();
 }
 
+void MainWindow::onSettingChanged(const QString &section, const QString &key, const QVariant &value) {
+    if (section != "General") {
+        return;
+    }
+
+    if (key == "enable_local_api") {
+        if (value.toBool()) {
+            qInfo() << "[LocalApi] Local API Server enabled by user setting. Starting server...";
+            m_localApiServer->start();
+        } else {
+            qInfo() << "[LocalApi] Local API Server disabled by user setting. Stopping server...";
+            m_localApiServer->stop();
+        }
+    } else if (key == "exit_after") {
+        // Keep the exit-after flag in step with the switch so the queue-finished
+        // path never has to go back to the settings store.
+        m_exitAfter = value.toBool();
+    }
+#ifdef Q_OS_WIN
+    else if (key == "show_debug_console") {
+        ApplyConsoleState(value.toBool());
+    }
+#endif
+}
+
+void MainWindow::onSettingsReset() {
+    m_exitAfter = m_configManager->get("General", "exit_after", false).toBool();
+}
+
+void MainWindow::onExitAfterToggled(bool checked) {
+    m_configManager->set("General", "exit_after", checked);
+    m_configManager->save();
+}
+
 void MainWindow::onQueueFinished() {
     if (!m_configManager) {
         return;
@@ -958,16 +975,14 @@ void MainWindow::onQueueFinished() {
                                 QSystemTrayIcon::Information, 3000);
     }
 
-    bool exitAfter = m_configManager->get("General", "exit_after", false).toBool();
-    if (exitAfter) {
+    if (m_exitAfter) {
         qInfo() << "Queue finished and 'exit after' is enabled. Waiting 2 seconds before quitting to allow for final file cleanup.";
         QTimer::singleShot(2000, this, [this]() {
             if (!m_configManager || !m_uiBuilder) {
                 return;
             }
 
-            const bool exitStillEnabled = m_configManager->get("General", "exit_after", false).toBool();
-            if (!exitStillEnabled) {
+            if (!m_exitAfter) {
                 qInfo() << "Exit-after timer cancelled because the setting was turned off before shutdown.";
                 return;
             }
@@ -1007,7 +1022,7 @@ bool MainWindow::showMissingBinariesDialog(const QStringList &missingBinaries)
     }
 
     BinariesPage *binariesPage = m_advancedSettingsTab
-        ? m_advancedSettingsTab->findChild<BinariesPage*>()
+        ? m_advancedSettingsTab->binariesPage()
         : nullptr;
 
     MissingBinariesDialog dialog(missingBinaries, m_configManager, binariesPage, this);
@@ -1040,7 +1055,11 @@ void MainWindow::onVideoQualityWarning(const QString &url, const QString &messag
 }
 
 void MainWindow::applyTheme(const QString &themeName) {
-    qApp->setStyle(QStyleFactory::create("Fusion"));
+    // Theme switches only swap the application palette. Installing a fresh style
+    // object forces every widget to be re-polished, so only do it once.
+    if (qApp->style()->name().compare("fusion", Qt::CaseInsensitive) != 0) {
+        qApp->setStyle(QStyleFactory::create("Fusion"));
+    }
 
     bool useDarkTheme = false;
     if (themeName == "Dark") {
@@ -46,6 +46,9 @@ private slots:
     void onDownloadRequested(const QString &url, const QVariantMap &options);
     void onValidationFinished(bool isValid, const QString &error);
     void onQueueFinished();
+    void onSettingChanged(const QString &section, const QString &key, const QVariant &value);
+    void onSettingsReset();
+    void onExitAfterToggled(bool checked);
     void onTrayIconActivated(QSystemTrayIcon::ActivationReason reason);
     void onVideoQualityWarning(const QString &url, const QString &message);
     void applyTheme(const QString &themeName);
@@ -97,6 +100,7 @@ private:
     QVariantMap m_pendingOptions;
     bool m_silentUpdateCheck;
     bool m_nonInteractiveLaunch;
+    bool m_exitAfter = false; // Mirrors General/exit_after, kept current via settingChanged
     QString m_lastAutoPastedUrl; // Track last auto-pasted URL to prevent duplicates
     qint64 m_lastAutoPasteTimestamp; // Timestamp of last auto-paste to enforce cooldown
 };
@@ -21,6 +21,15 @@ const QString DEVELOPER_DISCORD_URL_PART1 = "https://discord.gg/";
 const QString DEVELOPER_DISCORD_URL_PART2 = "NfWaqK";
 const QString DEVELOPER_DISCORD_URL_PART3 = "gYRG";
 
+const QStringList kLanguageChoices = {
+    "🇺🇸 English", "🇪🇸 Spanish", "🇵🇹 Portuguese", "🇷🇺 Russian", "🇩🇪 German", "🇫🇷 French",
+    "🇮🇹 Italian", "🇨🇳 Mandarin", "🇮🇳 Hindi", "🇧🇩 Bengali", "🇯🇵 Japanese", "🇵🇰 Western Punjabi",
+    "🇹🇷 Turkish", "🇻🇳 Vietnamese", "🇭🇰 Yue Chinese", "🇪🇬 Egyptian Arabic", "🇨🇳 Wu Chinese",
+    "🇮🇳 Marathi", "🇮🇳 Telugu", "🇰🇷 Korean", "🇮🇳 Tamil", "🇵🇰 Urdu", "🇮🇩 Indonesian",
+    "🇮🇩 Javanese", "🇮🇷 Iranian Persian", "🇳🇬 Hausa", "🇮🇳 Gujarati", "🇱🇧 Levantine Arabic",
+    "🇮🇳 Bhojpuri"
+};
+
 MainWindowUiBuilder::MainWindowUiBuilder(ConfigManager *configManager, QObject *parent)
     : QObject(parent),
       m_configManager(configManager),
@@ -44,26 +53,13 @@ void MainWindowUiBuilder::build(QMainWindow *mainWindow, QVBoxLayout *mainLayout
 
     QComboBox *languageCombo = new QComboBox(mainWindow);
     languageCombo->setToolTip("Select Application Language");
-    QStringList languagesWithFlags = {
-        "🇺🇸 English", "🇪🇸 Spanish", "🇵🇹 Portuguese", "🇷🇺 Russian", "🇩🇪 German", "🇫🇷 French",
-        "🇮🇹 Italian", "🇨🇳 Mandarin", "🇮🇳 Hindi", "🇧🇩 Bengali", "🇯🇵 Japanese", "🇵🇰 Western Punjabi",
-        "🇹🇷 Turkish", "🇻🇳 Vietnamese", "🇭🇰 Yue Chinese", "🇪🇬 Egyptian Arabic", "🇨🇳 Wu Chinese",
-        "🇮🇳 Marathi", "🇮🇳 Telugu", "🇰🇷 Korean", "🇮🇳 Tamil", "🇵🇰 Urdu", "🇮🇩 Indonesian",
-        "🇮🇩 Javanese", "🇮🇷 Iranian Persian", "🇳🇬 Hausa", "🇮🇳 Gujarati", "🇱🇧 Levantine Arabic",
-        "🇮🇳 Bhojpuri"
-    };
-    languageCombo->addItems(languagesWithFlags);
+    languageCombo->addItems(kLanguageChoices);
 
     QString savedLang = m_configManager->get("General", "language", "🇺🇸 English").toString();
     int index = languageCombo->findText(savedLang);
     if (index >= 0) languageCombo->setCurrentIndex(index);
     m_tabWidget->setCornerWidget(languageCombo, Qt::TopRightCorner);
-    connect(languageCombo, &QComboBox::currentTextChanged, this, [this](const QString &text) {
-        if (m_configManager->get("General", "language", "🇺🇸 English").toString() != text) {
-            m_configManager->set("General", "language", text);
-            QMessageBox::information(nullptr, "Language Changed", "Language changed to " + text + ".\n\nPlease restart the application for changes to take full effect.");
-        }
-    });
+    connect(languageCombo, &QComboBox::currentTextChanged, this, &MainWindowUiBuilder::onLanguageChanged);
 
     m_tabWidget->addTab(startTab, "Start Download");
     m_tabWidget->addTab(activeDownloadsTab, "Active Downloads");
@@ -139,4 +135,12 @@ void MainWindowUiBuilder::build(QMainWindow *mainWindow, QVBoxLayout *mainLayout
     footerContainer->addLayout(footerTopRow);
     footerContainer->addLayout(footerBottomRow);
     mainLayout->addLayout(footerContainer);
+}
+
+void MainWindowUiBuilder::onLanguageChanged(const QString &text)
+{
+    if (m_configManager->get("General", "language", "🇺🇸 English").toString() != text) {
+        m_configManager->set("General", "language", text);
+        QMessageBox::information(nullptr, "Language Changed", "Language changed to " + text + ".\n\nPlease restart the application for changes to take full effect.");
+    }
 }
\ No newline at end of file
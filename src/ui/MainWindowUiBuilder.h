@@ -29,6 +29,8 @@ public:
     QLabel* errorDownloadsLabel() const { return m_errorDownloadsLabel; }
     ToggleSwitch* exitAfterSwitch() const { return m_exitAfterSwitch; }
     QTabWidget* tabWidget() const { return m_tabWidget; }
+private slots:
+    void onLanguageChanged(const QString &text);
 private:
     ConfigManager *m_configManager;
     QTabWidget *m_tabWidget;
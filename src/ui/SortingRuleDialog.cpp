@@ -11,7 +11,7 @@
 #include <QJsonObject>
 #include <QJsonArray>
 #include <QMenu>
-#include <QTextEdit>
+#include <QPlainTextEdit>
 #include <algorithm> // For std::sort
 #include <QStackedWidget>
 #include <QLineEdit>
@@ -21,10 +21,108 @@
 #include <QComboBox>
 #include <QPushButton>
 #include <QRegularExpression>
+#include <QHash>
+#include <QPalette>
+#include <QSet>
+#include <cstddef>
 
 // CONSTANT: Height for condition text entry boxes
 static const int CONDITION_VALUE_INPUT_HEIGHT = 100;
 
+namespace {
+// Internal setting value and the label shown for it, in combo order.
+struct LabelMapping {
+    const char *internal;
+    const char *label;
+};
+
+constexpr LabelMapping kConditionFields[] = {
+    {"uploader", "Uploader"},
+    {"title", "Title"},
+    {"playlist_title", "Playlist Title"},
+    {"duration", "Duration (seconds)"},
+    {"album", "Album"},
+    {"id", "ID"}
+};
+
+constexpr LabelMapping kAppliesToOptions[] = {
+    {"any", "All Downloads"},
+    {"video", "Video Downloads"},
+    {"audio", "Audio Downloads"},
+    {"gallery", "Gallery Downloads"},
+    {"video_playlist", "Video Playlist Downloads"},
+    {"audio_playlist", "Audio Playlist Downloads"}
+};
+
+template <std::size_t N>
+QStringList mappingLabels(const LabelMapping (&mappings)[N]) {
+    QStringList labels;
+    labels.reserve(int(N));
+    for (const LabelMapping &mapping : mappings) {
+        labels.append(QString::fromLatin1(mapping.label));
+    }
+    return labels;
+}
+
+// Case-insensitive lookup from either the internal value or the UI label to
+// the combo row, so restoring a saved rule needs no scan over combo items.
+template <std::size_t N>
+QHash<QString, int> buildMappingIndex(const LabelMapping (&mappings)[N]) {
+    QHash<QString, int> index;
+    for (int i = 0; i < int(N); ++i) {
+        index.insert(QString::fromLatin1(mappings[i].internal).toLower(), i);
+        index.insert(QString::fromLatin1(mappings[i].label).toLower(), i);
+    }
+    return index;
+}
+
+// Combo contents shared by every dialog and condition row.
+const QStringList &conditionFieldLabels() {
+    static const QStringList labels = mappingLabels(kConditionFields);
+    return labels;
+}
+
+const QStringList &appliesToLabels() {
+    static const QStringList labels = mappingLabels(kAppliesToOptions);
+    return labels;
+}
+
+const QStringList kDurationOperators = {"Is", "Greater Than", "Less Than"};
+const QStringList kTextOperators = {"Contains", "Is", "Starts With", "Ends With", "Is One Of"};
+const QStringList kSubfolderTokens = {"{title}", "{uploader}", "{id}", "{album}", "{upload_year}", "{upload_month}", "{upload_day}", "{playlist_title}"};
+
+// Splits an "Is One Of" value list into trimmed, non-empty lines in one pass.
+// Trimming also drops the '\r' left behind by text pasted with Windows line endings.
+QStringList splitValueLines(const QString &text) {
+    QStringList values;
+    for (QStringView line : QStringView(text).split(u'\n')) {
+        const QStringView trimmed = line.trimmed();
+        if (!trimmed.isEmpty()) {
+            values.append(trimmed.toString());
+        }
+    }
+    return values;
+}
+
+int conditionFieldIndex(const QString &field) {
+    static const QHash<QString, int> index = [] {
+        QHash<QString, int> map = buildMappingIndex(kConditionFields);
+        map.insert("playlist", map.value("playlist_title")); // Legacy field name
+        return map;
+    }();
+    return index.value(field.toLower(), -1);
+}
+
+int appliesToIndex(const QString &appliesTo) {
+    static const QHash<QString, int> index = [] {
+        QHash<QString, int> map = buildMappingIndex(kAppliesToOptions);
+        map.insert("all", map.value("any")); // Legacy value
+        return map;
+    }();
+    return index.value(appliesTo.toLower(), -1);
+}
+}
+
 // A simple widget for editing a single condition
 class ConditionWidget : public QWidget {
 public:
@@ -37,7 +135,7 @@ public:
         topLayout->setSpacing(4);
 
         m_fieldCombo = new QComboBox(this);
-        m_fieldCombo->addItems({"Uploader", "Title", "Playlist Title", "Duration (seconds)", "Album", "ID"});
+        m_fieldCombo->addItems(conditionFieldLabels());
         m_fieldCombo->setToolTip("Select the metadata field to examine.");
         m_fieldCombo->setSizeAdjustPolicy(QComboBox::AdjustToContents);
 
@@ -50,8 +148,7 @@ public:
         m_valueInputSingle->setSizePolicy(QSizePolicy::Expanding, QSizePolicy::Fixed);
         m_valueInputSingle->setFixedHeight(CONDITION_VALUE_INPUT_HEIGHT);
         
-        m_valueInputMulti = new QTextEdit(this);
-        m_valueInputMulti->setAcceptRichText(false);
+        m_valueInputMulti = new QPlainTextEdit(this);
         m_valueInputMulti->setFixedHeight(CONDITION_VALUE_INPUT_HEIGHT);
         m_valueInputMulti->setSizePolicy(QSizePolicy::Expanding, QSizePolicy::Fixed);
 
@@ -75,14 +172,9 @@ public:
 
     QVariantMap getCondition() const {
         QVariantMap condition;
-        QString uiField = m_fieldCombo->currentText();
-        QString internalField = uiField.toLower();
-        if (uiField == "Playlist Title") internalField = "playlist_title";
-        else if (uiField == "Duration (seconds)") internalField = "duration";
-        else if (uiField == "Album") internalField = "album";
-        else if (uiField == "ID") internalField = "id";
-        
-        condition["field"] = internalField;
+        const int fieldRow = m_fieldCombo->currentIndex();
+        condition["field"] = fieldRow >= 0 ? QString::fromLatin1(kConditionFields[fieldRow].internal)
+                                            : m_fieldCombo->currentText().toLower();
         condition["operator"] = m_operatorCombo->currentText();
         if (m_operatorCombo->currentText() == "Is One Of") {
             condition["value"] = m_valueInputMulti->toPlainText();
@@ -93,26 +185,12 @@ public:
     }
 
     void setCondition(const QVariantMap &condition) {
-        QString field = condition["field"].toString();
-        
-        // Map internal fields back to UI fields
-        if (field.compare("playlist_title", Qt::CaseInsensitive) == 0 || field.compare("playlist", Qt::CaseInsensitive) == 0) field = "Playlist Title";
-        else if (field.compare("duration", Qt::CaseInsensitive) == 0) field = "Duration (seconds)";
-        else if (field.compare("album", Qt::CaseInsensitive) == 0) field = "Album";
-        else if (field.compare("id", Qt::CaseInsensitive) == 0) field = "ID";
-        else if (field.compare("uploader", Qt::CaseInsensitive) == 0) field = "Uploader";
-        else if (field.compare("title", Qt::CaseInsensitive) == 0) field = "Title";
-        
-        // Fallback case-insensitive match
-        for (int i = 0; i < m_fieldCombo->count(); ++i) {
-            if (m_fieldCombo->itemText(i).compare(field, Qt::CaseInsensitive) == 0) {
-                field = m_fieldCombo->itemText(i);
-                break;
-            }
+        // Accepts internal field names and UI labels alike
+        const int fieldRow = conditionFieldIndex(condition["field"].toString());
+        if (fieldRow >= 0) {
+            m_fieldCombo->setCurrentIndex(fieldRow);
         }
-        
-        m_fieldCombo->setCurrentText(field);
-        onFieldChanged(field); // Set up operators
+        onFieldChanged(m_fieldCombo->currentText()); // Set up operators
 
         QString op = condition["operator"].toString();
         if (op.compare("Equals", Qt::CaseInsensitive) == 0) {
@@ -166,9 +244,9 @@ private slots:
         QString currentOperator = m_operatorCombo->currentText();
         m_operatorCombo->clear();
         if (field == "Duration (seconds)") {
-            m_operatorCombo->addItems({"Is", "Greater Than", "Less Than"});
+            m_operatorCombo->addItems(kDurationOperators);
         } else {
-            m_operatorCombo->addItems({"Contains", "Is", "Starts With", "Ends With", "Is One Of"});
+            m_operatorCombo->addItems(kTextOperators);
         }
         // Try to restore the previously selected operator if it's still valid
         int index = m_operatorCombo->findText(currentOperator);
@@ -213,7 +291,7 @@ private:
     QComboBox *m_operatorCombo;
     QStackedWidget *m_valueStackedWidget;
     QLineEdit *m_valueInputSingle;
-    QTextEdit *m_valueInputMulti;
+    QPlainTextEdit *m_valueInputMulti;
 };
 
 SortingRuleDialog::SortingRuleDialog(QWidget *parent) : QDialog(parent) {
@@ -251,8 +329,7 @@ void SortingRuleDialog::setupUI() {
     m_tokenDropdown = new QComboBox(this);
     m_tokenDropdown->setToolTip("Insert a placeholder into the subfolder pattern.");
     m_tokenDropdown->addItem("Insert Token...");
-    QStringList tokens = {"{title}", "{uploader}", "{id}", "{album}", "{upload_year}", "{upload_month}", "{upload_day}", "{playlist_title}"};
-    m_tokenDropdown->addItems(tokens);
+    m_tokenDropdown->addItems(kSubfolderTokens);
 
     subfolderLayout->addWidget(m_subfolderPatternInput);
     subfolderLayout->addWidget(m_tokenDropdown);
@@ -260,13 +337,13 @@ void SortingRuleDialog::setupUI() {
 
     m_appliesToDropdown = new QComboBox(this);
     m_appliesToDropdown->setToolTip("Choose which types of downloads this rule should apply to.");
-    m_appliesToDropdown->addItems({"All Downloads", "Video Downloads", "Audio Downloads", "Gallery Downloads", "Video Playlist Downloads", "Audio Playlist Downloads"});
+    m_appliesToDropdown->addItems(appliesToLabels());
     formLayout->addRow("Rule Applies to:", m_appliesToDropdown);
 
     mainLayout->addLayout(formLayout);
 
     QHBoxLayout* conditionsHeaderLayout = new QHBoxLayout();
-    QLabel *conditionsHeaderLabel = new QLabel("Conditions (All Must Match):");
+    QLabel *conditionsHeaderLabel = new QLabel("Conditions (All Must Match):", this);
     conditionsHeaderLabel->setToolTip("A list of conditions that must all be true for this sorting rule to trigger.");
     conditionsHeaderLayout->addWidget(conditionsHeaderLabel);
     conditionsHeaderLayout->addStretch();
@@ -313,35 +390,29 @@ void SortingRuleDialog::setRule(const QVariantMap &rule) {
     m_subfolderPatternInput->setText(rule["subfolder_pattern"].toString());
 
     if (rule.contains("applies_to")) {
-        QString appliesTo = rule["applies_to"].toString();
-        
-        if (appliesTo.compare("video", Qt::CaseInsensitive) == 0) appliesTo = "Video Downloads";
-        else if (appliesTo.compare("audio", Qt::CaseInsensitive) == 0) appliesTo = "Audio Downloads";
-        else if (appliesTo.compare("gallery", Qt::CaseInsensitive) == 0) appliesTo = "Gallery Downloads";
-        else if (appliesTo.compare("video_playlist", Qt::CaseInsensitive) == 0) appliesTo = "Video Playlist Downloads";
-        else if (appliesTo.compare("audio_playlist", Qt::CaseInsensitive) == 0) appliesTo = "Audio Playlist Downloads";
-        else if (appliesTo.compare("any", Qt::CaseInsensitive) == 0 || appliesTo.compare("all", Qt::CaseInsensitive) == 0) appliesTo = "All Downloads";
-        
-        for (int i = 0; i < m_appliesToDropdown->count(); ++i) {
-            if (m_appliesToDropdown->itemText(i).compare(appliesTo, Qt::CaseInsensitive) == 0) {
-                appliesTo = m_appliesToDropdown->itemText(i);
-                break;
-            }
+        const int appliesToRow = appliesToIndex(rule["applies_to"].toString());
+        if (appliesToRow >= 0) {
+            m_appliesToDropdown->setCurrentIndex(appliesToRow);
         }
-        m_appliesToDropdown->setCurrentText(appliesTo);
     }
 
+    // Build every condition row before the container lays out or paints, so
+    // rules with many conditions don't relayout the scroll area per row.
+    m_conditionsContainer->setUpdatesEnabled(false);
+
     // Clear existing conditions (remove all but the stretch)
     while (m_conditionsLayout->count() > 1) {
         QLayoutItem *item = m_conditionsLayout->takeAt(0);
         if (item->widget()) item->widget()->deleteLater();
         delete item;
     }
+    m_conditionWidgets.clear();
 
-    QVariantList conditions = rule["conditions"].toList();
+    const QVariantList conditions = rule["conditions"].toList();
     for (const QVariant &condVariant : conditions) {
         addCondition(condVariant.toMap());
     }
+    m_conditionsContainer->setUpdatesEnabled(true);
 }
 
 QVariantMap SortingRuleDialog::getRule() const {
@@ -350,27 +421,14 @@ QVariantMap SortingRuleDialog::getRule() const {
     rule["target_folder"] = QDir::cleanPath(m_targetFolderInput->text());
     rule["subfolder_pattern"] = m_subfolderPatternInput->text();
 
-    QString uiAppliesTo = m_appliesToDropdown->currentText();
-    QString internalAppliesTo = "any";
-    if (uiAppliesTo == "Video Downloads") internalAppliesTo = "video";
-    else if (uiAppliesTo == "Audio Downloads") internalAppliesTo = "audio";
-    else if (uiAppliesTo == "Gallery Downloads") internalAppliesTo = "gallery";
-    else if (uiAppliesTo == "Video Playlist Downloads") internalAppliesTo = "video_playlist";
-    else if (uiAppliesTo == "Audio Playlist Downloads") internalAppliesTo = "audio_playlist";
-    rule["applies_to"] = internalAppliesTo;
+    const int appliesToRow = m_appliesToDropdown->currentIndex();
+    rule["applies_to"] = appliesToRow >= 0 ? QString::fromLatin1(kAppliesToOptions[appliesToRow].internal)
+                                           : QString("any");
 
     QVariantList conditions;
-    // Iterate through layout containers (skip the stretch at the end)
-    for (int i = 0; i < m_conditionsLayout->count() - 1; ++i) {
-        QLayoutItem *item = m_conditionsLayout->itemAt(i);
-        if (auto container = item->widget()) {
-            for (QObject *child : container->children()) {
-                if (auto conditionWidget = dynamic_cast<ConditionWidget*>(child)) {
-                    conditions.append(conditionWidget->getCondition());
-                    break;
-                }
-            }
-        }
+    conditions.reserve(m_conditionWidgets.size());
+    for (const ConditionWidget *conditionWidget : m_conditionWidgets) {
+        conditions.append(conditionWidget->getCondition());
     }
     rule["conditions"] = conditions;
     return rule;
@@ -386,29 +444,34 @@ void SortingRuleDialog::browseTargetFolder() {
 }
 
 void SortingRuleDialog::addCondition(const QVariantMap &condition) {
-    ConditionWidget *conditionWidget = new ConditionWidget(m_conditionsContainer);
+    // Build the row's children directly under their final parent so none of
+    // them has to be reparented when the row is laid out.
+    QWidget *containerWidget = new QWidget(m_conditionsContainer);
+    ConditionWidget *conditionWidget = new ConditionWidget(containerWidget);
     if (!condition.isEmpty()) {
         conditionWidget->setCondition(condition);
     }
 
-    QPushButton *removeButton = new QPushButton("Remove");
-    removeButton->setStyleSheet("color: red;");
+    QPushButton *removeButton = new QPushButton("Remove", containerWidget);
+    // A palette tweak avoids attaching a style sheet to every condition row.
+    QPalette removePalette = removeButton->palette();
+    removePalette.setColor(QPalette::ButtonText, Qt::red);
+    removeButton->setPalette(removePalette);
     removeButton->setToolTip("Remove this condition.");
     removeButton->setSizePolicy(QSizePolicy::Fixed, QSizePolicy::Fixed);
 
-    QHBoxLayout *hbox = new QHBoxLayout();
+    QHBoxLayout *hbox = new QHBoxLayout(containerWidget);
     hbox->setContentsMargins(2, 2, 2, 2);
     hbox->setSpacing(4);
     hbox->addWidget(conditionWidget, 1);
     hbox->addWidget(removeButton);
 
-    QWidget *containerWidget = new QWidget(m_conditionsContainer);
-    containerWidget->setLayout(hbox);
-
     // Insert before the stretch
     m_conditionsLayout->insertWidget(m_conditionsLayout->count() - 1, containerWidget);
+    m_conditionWidgets.append(conditionWidget);
 
-    connect(removeButton, &QPushButton::clicked, this, [this, containerWidget]() {
+    connect(removeButton, &QPushButton::clicked, this, [this, containerWidget, conditionWidget]() {
+        m_conditionWidgets.removeOne(conditionWidget);
         containerWidget->deleteLater();
     });
 }
@@ -428,21 +491,13 @@ void SortingRuleDialog::accept() {
     }
 
     // Sort "Is One Of" values alphabetically
-    for (int i = 0; i < m_conditionsLayout->count() - 1; ++i) {
-        QLayoutItem *item = m_conditionsLayout->itemAt(i);
-        if (auto container = item->widget()) {
-            for (QObject *child : container->children()) {
-                if (auto conditionWidget = dynamic_cast<ConditionWidget*>(child)) {
-                    if (conditionWidget->getOperatorText() == "Is One Of") {
-                        QStringList values = conditionWidget->getValueText().split('\n', Qt::SkipEmptyParts);
-                        std::sort(values.begin(), values.end(), [](const QString &s1, const QString &s2) {
-                            return s1.toLower() < s2.toLower();
-                        });
-                        conditionWidget->setValueText(values.join('\n'));
-                    }
-                    break;
-                }
-            }
+    for (ConditionWidget *conditionWidget : m_conditionWidgets) {
+        if (conditionWidget->getOperatorText() == "Is One Of") {
+            QStringList values = splitValueLines(conditionWidget->getValueText());
+            std::sort(values.begin(), values.end(), [](const QString &s1, const QString &s2) {
+                return s1.compare(s2, Qt::CaseInsensitive) < 0;
+            });
+            conditionWidget->setValueText(values.join('\n'));
         }
     }
 
@@ -8,6 +8,9 @@
 #include <QVariantMap>
 #include <QPushButton>
 #include <QVBoxLayout>
+#include <QList>
+
+class ConditionWidget;
 
 class SortingRuleDialog : public QDialog
 {
@@ -40,6 +43,7 @@ private:
     QWidget *m_conditionsContainer;
     QVBoxLayout *m_conditionsLayout;
     QPushButton *m_addConditionButton;
+    QList<ConditionWidget*> m_conditionWidgets; // In display order
 };
 
 #endif // SORTINGRULEDIALOG_H
@@ -0,0 +1,194 @@
+#include "SortingRulesModel.h"
+#include <QDir>
+
+namespace {
+QString appliesToDisplayText(const QString &appliesTo) {
+    if (appliesTo == "video") return "Video Downloads";
+    if (appliesTo == "audio") return "Audio Downloads";
+    if (appliesTo == "gallery") return "Gallery Downloads";
+    if (appliesTo == "video_playlist") return "Video Playlist Downloads";
+    if (appliesTo == "audio_playlist") return "Audio Playlist Downloads";
+    if (appliesTo == "any" || appliesTo == "all") return "All Downloads";
+    return appliesTo;
+}
+
+QString conditionDisplayText(const QVariantList &conditions) {
+    if (conditions.isEmpty()) {
+        return "No conditions";
+    }
+
+    QVariantMap firstCondition = conditions.first().toMap();
+    QString field = firstCondition["field"].toString();
+    QString op = firstCondition["operator"].toString();
+    QString value = firstCondition["value"].toString();
+
+    QString conditionText;
+    if (op == "Is One Of") {
+        int valueCount = value.split('\n', Qt::SkipEmptyParts).size();
+        conditionText = QString("%1 is one of [%2 values]").arg(field).arg(valueCount);
+    } else {
+        conditionText = QString("%1 %2 \"%3\"").arg(field).arg(op.toLower()).arg(value);
+    }
+
+    if (conditions.size() > 1) {
+        conditionText += QString(" (+%1 more)").arg(conditions.size() - 1);
+    }
+    return conditionText;
+}
+}
+
+SortingRulesModel::SortingRulesModel(QObject *parent)
+    : QAbstractTableModel(parent) {}
+
+int SortingRulesModel::rowCount(const QModelIndex &parent) const {
+    return parent.isValid() ? 0 : m_rules.size();
+}
+
+int SortingRulesModel::columnCount(const QModelIndex &parent) const {
+    return parent.isValid() ? 0 : ColumnCount;
+}
+
+QVariant SortingRulesModel::data(const QModelIndex &index, int role) const {
+    if (!index.isValid() || index.row() >= m_rules.size()) {
+        return QVariant();
+    }
+
+    const QVariantMap &ruleMap = m_rules.at(index.row());
+    if (role == Qt::UserRole) {
+        return ruleMap;
+    }
+    if (role != Qt::DisplayRole) {
+        return QVariant();
+    }
+
+    switch (index.column()) {
+    case PriorityColumn:
+        return QString::number(index.row() + 1);
+    case NameColumn:
+        return ruleMap["name"].toString();
+    case AppliesToColumn:
+        return m_rowText.at(index.row()).appliesTo;
+    case ConditionColumn:
+        return m_rowText.at(index.row()).condition;
+    case TargetPathColumn:
+        return m_rowText.at(index.row()).targetPath;
+    case SubfolderColumn:
+        return ruleMap["subfolder_pattern"].toString();
+    default:
+        return QVariant();
+    }
+}
+
+QVariant SortingRulesModel::headerData(int section, Qt::Orientation orientation, int role) const {
+    if (orientation != Qt::Horizontal || role != Qt::DisplayRole) {
+        return QAbstractTableModel::headerData(section, orientation, role);
+    }
+
+    switch (section) {
+    case PriorityColumn: return "#";
+    case NameColumn: return "Name";
+    case AppliesToColumn: return "Applies To";
+    case ConditionColumn: return "Condition";
+    case TargetPathColumn: return "Target Path";
+    case SubfolderColumn: return "Subfolder";
+    default: return QVariant();
+    }
+}
+
+SortingRulesModel::RowText SortingRulesModel::formatRow(const QVariantMap &rule) {
+    return { appliesToDisplayText(rule.value("applies_to").toString()),
+             conditionDisplayText(rule.value("conditions").toList()),
+             QDir::toNativeSeparators(rule.value("target_folder").toString()) };
+}
+
+QVariantMap SortingRulesModel::rule(int row) const {
+    return (row >= 0 && row < m_rules.size()) ? m_rules.at(row) : QVariantMap();
+}
+
+void SortingRulesModel::setRules(const QList<QVariantMap> &rules) {
+    // One reset instead of a row insert per rule, so the view relayouts once.
+    beginResetModel();
+    m_rules = rules;
+    m_rowText.clear();
+    m_rowText.reserve(m_rules.size());
+    for (const QVariantMap &rule : m_rules) {
+        m_rowText.append(formatRow(rule));
+    }
+    endResetModel();
+}
+
+void SortingRulesModel::appendRule(const QVariantMap &rule) {
+    const int row = m_rules.size();
+    beginInsertRows(QModelIndex(), row, row);
+    m_rules.append(rule);
+    m_rowText.append(formatRow(rule));
+    endInsertRows();
+}
+
+void SortingRulesModel::updateRule(int row, const QVariantMap &rule) {
+    if (row < 0 || row >= m_rules.size()) {
+        return;
+    }
+    const RowText newText = formatRow(rule);
+    const RowText &oldText = m_rowText.at(row);
+    const QVariantMap &oldRule = m_rules.at(row);
+
+    // Only report the span of cells whose text actually changed, so the view
+    // leaves untouched cells alone.
+    const bool changed[ColumnCount] = {
+        false,
+        oldRule.value("name") != rule.value("name"),
+        oldText.appliesTo != newText.appliesTo,
+        oldText.condition != newText.condition,
+        oldText.targetPath != newText.targetPath,
+        oldRule.value("subfolder_pattern") != rule.value("subfolder_pattern")
+    };
+    int firstColumn = -1;
+    int lastColumn = -1;
+    for (int column = 0; column < ColumnCount; ++column) {
+        if (changed[column]) {
+            if (firstColumn < 0) firstColumn = column;
+            lastColumn = column;
+        }
+    }
+
+    m_rules[row] = rule;
+    m_rowText[row] = newText;
+    if (firstColumn >= 0) {
+        emit dataChanged(index(row, firstColumn), index(row, lastColumn), {Qt::DisplayRole});
+    }
+}
+
+void SortingRulesModel::removeRule(int row) {
+    if (row < 0 || row >= m_rules.size()) {
+        return;
+    }
+    beginRemoveRows(QModelIndex(), row, row);
+    m_rules.removeAt(row);
+    m_rowText.removeAt(row);
+    endRemoveRows();
+    // Only the rows that slid up into the gap change priority.
+    renumber(row, m_rules.size() - 1);
+}
+
+bool SortingRulesModel::moveRule(int from, int to) {
+    if (from < 0 || from >= m_rules.size() || to < 0 || to >= m_rules.size() || from == to) {
+        return false;
+    }
+    // Qt expects the destination as the row the item is inserted before.
+    if (!beginMoveRows(QModelIndex(), from, from, QModelIndex(), to > from ? to + 1 : to)) {
+        return false;
+    }
+    m_rules.move(from, to);
+    m_rowText.move(from, to);
+    endMoveRows();
+    renumber(qMin(from, to), qMax(from, to));
+    return true;
+}
+
+void SortingRulesModel::renumber(int firstRow, int lastRow) {
+    if (firstRow > lastRow) {
+        return;
+    }
+    emit dataChanged(index(firstRow, PriorityColumn), index(lastRow, PriorityColumn), {Qt::DisplayRole});
+}
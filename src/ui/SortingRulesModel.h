@@ -0,0 +1,56 @@
+#ifndef SORTINGRULESMODEL_H
+#define SORTINGRULESMODEL_H
+
+#include <QAbstractTableModel>
+#include <QList>
+#include <QVariantMap>
+
+// Table model backing the Sorting tab. Holds the rule maps in priority order and
+// reports changes per row so edits, inserts, deletes and moves never rebuild the
+// whole view.
+class SortingRulesModel : public QAbstractTableModel {
+    Q_OBJECT
+
+public:
+    enum Column {
+        PriorityColumn = 0,
+        NameColumn,
+        AppliesToColumn,
+        ConditionColumn,
+        TargetPathColumn,
+        SubfolderColumn,
+        ColumnCount
+    };
+
+    explicit SortingRulesModel(QObject *parent = nullptr);
+
+    int rowCount(const QModelIndex &parent = QModelIndex()) const override;
+    int columnCount(const QModelIndex &parent = QModelIndex()) const override;
+    QVariant data(const QModelIndex &index, int role = Qt::DisplayRole) const override;
+    QVariant headerData(int section, Qt::Orientation orientation, int role = Qt::DisplayRole) const override;
+
+    const QList<QVariantMap> &rules() const { return m_rules; }
+    QVariantMap rule(int row) const;
+    void setRules(const QList<QVariantMap> &rules);
+    void appendRule(const QVariantMap &rule);
+    void updateRule(int row, const QVariantMap &rule);
+    void removeRule(int row);
+    bool moveRule(int from, int to);
+
+private:
+    // Derived cell text, formatted once when a rule is stored rather than on
+    // every data() call.
+    struct RowText {
+        QString appliesTo;
+        QString condition;
+        QString targetPath;
+    };
+
+    static RowText formatRow(const QVariantMap &rule);
+    void renumber(int firstRow, int lastRow);
+
+    QList<QVariantMap> m_rules;
+    QList<RowText> m_rowText;
+};
+
+#endif // SORTINGRULESMODEL_H
@@ -1,5 +1,6 @@
 #include "SortingTab.h"
 #include "SortingRuleDialog.h"
+#include "SortingRulesModel.h"
 #include <QVBoxLayout>
 #include <QHBoxLayout>
 #include <QMessageBox>
@@ -7,14 +8,36 @@
 #include <QHeaderView>
 #include <QDebug>
 #include <QDir>
-#include <QTableWidget>
+#include <QTableView>
 #include <QPushButton>
+#include <QApplication>
+#include <QShowEvent>
 
 SortingTab::SortingTab(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
+    m_saveTimer = new QTimer(this);
+    m_saveTimer->setSingleShot(true);
+    m_saveTimer->setInterval(250);
+    connect(m_saveTimer, &QTimer::timeout, this, [this]() { writeRules(); });
+    // Flush an edit that is still waiting on the debounce timer before exit.
+    connect(qApp, &QCoreApplication::aboutToQuit, this, [this]() {
+        if (m_saveTimer->isActive()) {
+            m_saveTimer->stop();
+            writeRules();
+        }
+    });
+
     setupUI();
-    loadRules();
-    updatePriorityNumbers();
+    // Rules are read the first time the tab is shown; SortingManager reads them
+    // on its own, so nothing else needs the table filled at startup.
+}
+
+void SortingTab::showEvent(QShowEvent *event) {
+    QWidget::showEvent(event);
+    if (!m_rulesLoaded) {
+        m_rulesLoaded = true;
+        loadRules();
+    }
 }
 
 void SortingTab::setupUI() {
@@ -27,13 +50,18 @@ void SortingTab::setupUI() {
     descriptionLabel->setToolTip("This section allows you to set up rules for automatically sorting your downloaded files into different folders.");
     mainLayout->addWidget(descriptionLabel);
 
-    m_rulesTable = new QTableWidget(this);
+    m_rulesModel = new SortingRulesModel(this);
+    m_rulesTable = new QTableView(this);
     m_rulesTable->setToolTip("This table shows all your active sorting rules. When a download finishes, the app checks these rules from top to bottom.");
-    m_rulesTable->setColumnCount(6);
-    m_rulesTable->setHorizontalHeaderLabels({"#", "Name", "Applies To", "Condition", "Target Path", "Subfolder"});
+    m_rulesTable->setModel(m_rulesModel);
     m_rulesTable->verticalHeader()->setVisible(false);
-    m_rulesTable->horizontalHeader()->setSectionResizeMode(QHeaderView::Stretch);
-    m_rulesTable->horizontalHeader()->setSectionResizeMode(0, QHeaderView::ResizeToContents);
+    QHeaderView *header = m_rulesTable->horizontalHeader();
+    header->setSectionResizeMode(QHeaderView::Stretch);
+    // The priority column only ever shows a short number, so size it once from
+    // the font instead of having the header measure every cell on each change.
+    header->setSectionResizeMode(SortingRulesModel::PriorityColumn, QHeaderView::Fixed);
+    header->resizeSection(SortingRulesModel::PriorityColumn,
+                          header->fontMetrics().horizontalAdvance(QStringLiteral("0000")) + 16);
     m_rulesTable->setSelectionBehavior(QAbstractItemView::SelectRows);
     m_rulesTable->setSelectionMode(QAbstractItemView::SingleSelection);
     m_rulesTable->setEditTriggers(QAbstractItemView::NoEditTriggers);
@@ -66,55 +94,24 @@ void SortingTab::setupUI() {
     connect(m_deleteButton, &QPushButton::clicked, this, &SortingTab::deleteRule);
     connect(m_moveUpButton, &QPushButton::clicked, this, &SortingTab::moveRuleUp);
     connect(m_moveDownButton, &QPushButton::clicked, this, &SortingTab::moveRuleDown);
-    connect(m_rulesTable, &QTableWidget::itemDoubleClicked, this, &SortingTab::editRule);
+    connect(m_rulesTable, &QTableView::doubleClicked, this, &SortingTab::editRule);
 }
 
-void SortingTab::populateRow(int row, const QVariantMap &ruleMap) {
-    QTableWidgetItem *priorityItem = new QTableWidgetItem("");
-    // Store the map directly in the user role
-    priorityItem->setData(Qt::UserRole, ruleMap);
-    m_rulesTable->setItem(row, 0, priorityItem);
-
-    m_rulesTable->setItem(row, 1, new QTableWidgetItem(ruleMap["name"].toString()));
-
-    QString appliesToUI = ruleMap["applies_to"].toString();
-    if (appliesToUI == "video") appliesToUI = "Video Downloads";
-    else if (appliesToUI == "audio") appliesToUI = "Audio Downloads";
-    else if (appliesToUI == "gallery") appliesToUI = "Gallery Downloads";
-    else if (appliesToUI == "video_playlist") appliesToUI = "Video Playlist Downloads";
-    else if (appliesToUI == "audio_playlist") appliesToUI = "Audio Playlist Downloads";
-    else if (appliesToUI == "any" || appliesToUI == "all") appliesToUI = "All Downloads";
-    m_rulesTable->setItem(row, 2, new QTableWidgetItem(appliesToUI));
-
-    QString conditionText = "No conditions";
-    QVariantList conditions = ruleMap["conditions"].toList();
-    if (!conditions.isEmpty()) {
-        QVariantMap firstCondition = conditions.first().toMap();
-        QString field = firstCondition["field"].toString();
-        QString op = firstCondition["operator"].toString();
-        QString value = firstCondition["value"].toString();
-
-        if (op == "Is One Of") {
-            int valueCount = value.split('\n', Qt::SkipEmptyParts).size();
-            conditionText = QString("%1 is one of [%2 values]").arg(field).arg(valueCount);
-        } else {
-            conditionText = QString("%1 %2 \"%3\"").arg(field).arg(op.toLower()).arg(value);
-        }
+int SortingTab::currentRuleRow() const {
+    const QModelIndex current = m_rulesTable->currentIndex();
+    return current.isValid() ? current.row() : -1;
+}
 
-        if (conditions.size() > 1) {
-            conditionText += QString(" (+%1 more)").arg(conditions.size() - 1);
-        }
-    }
-    m_rulesTable->setItem(row, 3, new QTableWidgetItem(conditionText));
-    m_rulesTable->setItem(row, 4, new QTableWidgetItem(QDir::toNativeSeparators(ruleMap["target_folder"].toString())));
-    m_rulesTable->setItem(row, 5, new QTableWidgetItem(ruleMap["subfolder_pattern"].toString()));
+void SortingTab::selectRule(int row) {
+    m_rulesTable->setCurrentIndex(m_rulesModel->index(row, 0));
 }
 
 void SortingTab::loadRules() {
-    m_rulesTable->setRowCount(0);
     int size = m_configManager->get("SortingRules", "size", 0).toInt();
 
     bool rulesPurged = false;
+    QList<QVariantMap> rules;
+    rules.reserve(size);
 
     for (int i = 0; i < size; ++i) {
         QString key = QString("rule_%1").arg(i);
@@ -159,10 +156,10 @@ void SortingTab::loadRules() {
             continue;
         }
 
-        int row = m_rulesTable->rowCount();
-        m_rulesTable->insertRow(row);
-        populateRow(row, ruleMap);
+        rules.append(ruleMap);
     }
+    m_rulesModel->setRules(rules);
+    m_savedRules = rules;
 
     // Check for detached garbage past 'size'
     if (!m_configManager->get("SortingRules", QString("rule_%1").arg(size)).isNull() ||
@@ -172,29 +169,39 @@ void SortingTab::loadRules() {
 
     if (rulesPurged) {
         qInfo() << "Purging invalid/legacy rules from settings.";
-        saveRules();
+        writeRules(true);
     }
 }
 
 void SortingTab::saveRules() {
+    // Restarting the timer folds rapid moves and edits into a single write.
+    m_saveTimer->start();
+}
+
+void SortingTab::writeRules(bool force) {
+    const QList<QVariantMap> &rules = m_rulesModel->rules();
+    if (!force && rules == m_savedRules) {
+        return; // Nothing to rewrite
+    }
+
     int oldSize = m_configManager->get("SortingRules", "size", 0).toInt();
-    int newSize = m_rulesTable->rowCount();
+    int newSize = rules.size();
     
     m_configManager->set("SortingRules", "size", newSize);
     for (int i = 0; i < newSize; ++i) {
-        QVariantMap ruleMap = m_rulesTable->item(i, 0)->data(Qt::UserRole).toMap();
+        const QVariantMap &ruleMap = rules.at(i);
         QString baseKey = QString("rule_%1").arg(i);
         
         // Purge old JSON string key
         m_configManager->remove("SortingRules", baseKey);
         
         // Save strictly in flat properties
-        m_configManager->set("SortingRules", baseKey + "_name", ruleMap["name"]);
-        m_configManager->set("SortingRules", baseKey + "_applies_to", ruleMap["applies_to"]);
-        m_configManager->set("SortingRules", baseKey + "_target_folder", ruleMap["target_folder"]);
-        m_configManager->set("SortingRules", baseKey + "_subfolder_pattern", ruleMap["subfolder_pattern"]);
+        m_configManager->set("SortingRules", baseKey + "_name", ruleMap.value("name"));
+        m_configManager->set("SortingRules", baseKey + "_applies_to", ruleMap.value("applies_to"));
+        m_configManager->set("SortingRules", baseKey + "_target_folder", ruleMap.value("target_folder"));
+        m_configManager->set("SortingRules", baseKey + "_subfolder_pattern", ruleMap.value("subfolder_pattern"));
         
-        QVariantList conditions = ruleMap["conditions"].toList();
+        QVariantList conditions = ruleMap.value("conditions").toList();
         int oldCondSize = m_configManager->get("SortingRules", baseKey + "_conditions_size", 0).toInt();
         m_configManager->set("SortingRules", baseKey + "_conditions_size", conditions.size());
         
@@ -237,32 +244,28 @@ void SortingTab::saveRules() {
     }
     
     m_configManager->save();
+    m_savedRules = rules;
 }
 
 void SortingTab::addRule() {
     SortingRuleDialog dialog(this);
     if (dialog.exec() == QDialog::Accepted) {
-        QVariantMap rule = dialog.getRule();
-        int row = m_rulesTable->rowCount();
-        m_rulesTable->insertRow(row);
-        populateRow(row, rule);
-        updatePriorityNumbers();
+        m_rulesModel->appendRule(dialog.getRule());
         saveRules();
     }
 }
 
 void SortingTab::editRule() {
-    int currentRow = m_rulesTable->currentRow();
+    int currentRow = currentRuleRow();
     if (currentRow >= 0) {
-        QVariantMap originalRule = m_rulesTable->item(currentRow, 0)->data(Qt::UserRole).toMap();
+        QVariantMap originalRule = m_rulesModel->rule(currentRow);
         SortingRuleDialog dialog(originalRule, this);
 
         if (dialog.exec() == QDialog::Accepted) {
             QVariantMap newRule = dialog.getRule();
             // Only update and save if the rule has actually changed.
             if (originalRule != newRule) {
-                populateRow(currentRow, newRule);
-                updatePriorityNumbers();
+                m_rulesModel->updateRule(currentRow, newRule);
                 saveRules();
                 qDebug() << "Sorting rule changed, saving to disk.";
             } else {
@@ -275,11 +278,10 @@ void SortingTab::editRule() {
 }
 
 void SortingTab::deleteRule() {
-    int currentRow = m_rulesTable->currentRow();
+    int currentRow = currentRuleRow();
     if (currentRow >= 0) {
         if (QMessageBox::question(this, "Delete Rule", "Are you sure you want to remove this rule?", QMessageBox::Yes|QMessageBox::No) == QMessageBox::Yes) {
-            m_rulesTable->removeRow(currentRow);
-            updatePriorityNumbers();
+            m_rulesModel->removeRule(currentRow);
             saveRules();
         }
     } else {
@@ -288,16 +290,10 @@ void SortingTab::deleteRule() {
 }
 
 void SortingTab::moveRuleUp() {
-    int currentRow = m_rulesTable->currentRow();
+    int currentRow = currentRuleRow();
     if (currentRow > 0) {
-        QVariantMap currentRule = m_rulesTable->item(currentRow, 0)->data(Qt::UserRole).toMap();
-        QVariantMap aboveRule = m_rulesTable->item(currentRow - 1, 0)->data(Qt::UserRole).toMap();
-
-        populateRow(currentRow, aboveRule);
-        populateRow(currentRow - 1, currentRule);
-
-        updatePriorityNumbers();
-        m_rulesTable->setCurrentCell(currentRow - 1, 0);
+        m_rulesModel->moveRule(currentRow, currentRow - 1);
+        selectRule(currentRow - 1);
         saveRules();
     } else if (currentRow == -1) {
         QMessageBox::warning(this, "Move Rule", "Please select a rule to move.");
@@ -305,29 +301,12 @@ void SortingTab::moveRuleUp() {
 }
 
 void SortingTab::moveRuleDown() {
-    int currentRow = m_rulesTable->currentRow();
-    if (currentRow >= 0 && currentRow < m_rulesTable->rowCount() - 1) {
-        QVariantMap currentRule = m_rulesTable->item(currentRow, 0)->data(Qt::UserRole).toMap();
-        QVariantMap belowRule = m_rulesTable->item(currentRow + 1, 0)->data(Qt::UserRole).toMap();
-
-        populateRow(currentRow, belowRule);
-        populateRow(currentRow + 1, currentRule);
-
-        updatePriorityNumbers();
-        m_rulesTable->setCurrentCell(currentRow + 1, 0);
+    int currentRow = currentRuleRow();
+    if (currentRow >= 0 && currentRow < m_rulesModel->rowCount() - 1) {
+        m_rulesModel->moveRule(currentRow, currentRow + 1);
+        selectRule(currentRow + 1);
         saveRules();
     } else if (currentRow == -1) {
         QMessageBox::warning(this, "Move Rule", "Please select a rule to move.");
     }
 }
-
-void SortingTab::updatePriorityNumbers() {
-    for (int i = 0; i < m_rulesTable->rowCount(); ++i) {
-        QTableWidgetItem *item = m_rulesTable->item(i, 0);
-        if (item) {
-            item->setText(QString::number(i + 1));
-        } else {
-            m_rulesTable->setItem(i, 0, new QTableWidgetItem(QString::number(i + 1)));
-        }
-    }
-}
@@ -2,17 +2,24 @@
 #define SORTINGTAB_H
 
 #include <QWidget>
-#include <QTableWidget> // Changed from QListWidget
+#include <QTableView>
 #include <QPushButton>
+#include <QTimer>
 #include "core/ConfigManager.h"
 #include "core/SortingManager.h"
 
+class SortingRulesModel;
+class QShowEvent;
+
 class SortingTab : public QWidget {
     Q_OBJECT
 
 public:
     explicit SortingTab(ConfigManager *configManager, QWidget *parent = nullptr);
 
+protected:
+    void showEvent(QShowEvent *event) override;
+
 private slots:
     void addRule();
     void editRule();
@@ -23,14 +30,19 @@ private slots:
 private:
     void setupUI();
     void loadRules();
-    void saveRules(); // This might need to be adjusted or removed if rules are saved differently
-    void updatePriorityNumbers(); // New helper function
-    void populateRow(int row, const QVariantMap &rule); // New helper to populate a row from a rule map
+    void saveRules(); // Coalesces bursts of edits into one write
+    void writeRules(bool force = false); // Skips the write when nothing changed unless forced
+    int currentRuleRow() const;
+    void selectRule(int row);
 
     ConfigManager *m_configManager;
     SortingManager *m_sortingManager;
 
-    QTableWidget *m_rulesTable; // Changed from QListWidget
+    QTableView *m_rulesTable;
+    SortingRulesModel *m_rulesModel;
+    QList<QVariantMap> m_savedRules; // Rules as last written to settings
+    QTimer *m_saveTimer;
+    bool m_rulesLoaded = false;
     QPushButton *m_addButton;
     QPushButton *m_editButton;
     QPushButton *m_deleteButton;
@@ -16,6 +16,7 @@
 #include <QClipboard>
 #include <QGuiApplication>
 #include <QFocusEvent>
+#include <QShowEvent>
 #include <QEvent>
 #include <QJsonArray>
 #include <QSignalBlocker>
@@ -23,6 +24,7 @@
 #include <QFile>
 #include <QStandardItemModel>
 #include <QPushButton>
+#include <QComboBox>
 #include <QDebug> // Include QDebug for debugging
 #include <QPalette>
 #include "start_tab/StartTabUrlHandler.h"
@@ -71,9 +73,18 @@ StartTab::StartTab(ConfigManager *configManager, ExtractorJsonParser *extractorJ
     } else {
         qCritical() << "CRITICAL ERROR: m_urlInput is null in StartTab constructor after setupUI!";
     }
-    m_downloadActions->updateDynamicUI(); // Initial call to set up dynamic UI
+    // The first dynamic-UI and command-preview refresh resolves every binary and
+    // builds the full argument list; it runs on first show instead of during
+    // MainWindow construction.
+}
 
-    updateCommandPreview(); // Call after UI is built and initial settings loaded
+void StartTab::showEvent(QShowEvent *event) {
+    QWidget::showEvent(event);
+    if (!m_initialRefreshDone) {
+        m_initialRefreshDone = true;
+        m_downloadActions->updateDynamicUI(); // Initial call to set up dynamic UI
+        updateCommandPreview();
+    }
 }
 
 StartTab::~StartTab() {
@@ -111,53 +122,49 @@ void StartTab::setupUI() {
     m_uiBuilder->build(this, mainLayout); // Pass 'this' as parentWidget
 
     if (QPushButton *supportedSitesBtn = findChild<QPushButton*>("supportedSitesBtn")) {
-        connect(supportedSitesBtn, &QPushButton::clicked, this, [this]() {
-            SupportedSitesDialog dialog(this);
-            dialog.exec();
-        });
+        connect(supportedSitesBtn, &QPushButton::clicked, this, &StartTab::onSupportedSitesClicked);
     }
 
     // Wire up operational controls to save instantly to ConfigManager
     if (m_uiBuilder->maxConcurrentCombo()) {
-        connect(m_uiBuilder->maxConcurrentCombo(), &QComboBox::currentTextChanged, this, [this](const QString &text) {
-            m_configManager->set("General", "max_threads", text);
-            m_configManager->save();
-        });
+        connect(m_uiBuilder->maxConcurrentCombo(), &QComboBox::currentTextChanged, this, &StartTab::onMaxConcurrentChanged);
     }
     if (m_uiBuilder->playlistLogicCombo()) {
-        connect(m_uiBuilder->playlistLogicCombo(), &QComboBox::currentTextChanged, this, [this](const QString &text) {
-            m_configManager->set("General", "playlist_logic", text);
-            m_configManager->save();
-        });
+        connect(m_uiBuilder->playlistLogicCombo(), &QComboBox::currentTextChanged, this, &StartTab::onPlaylistLogicChanged);
     }
     if (m_uiBuilder->rateLimitCombo()) {
-        connect(m_uiBuilder->rateLimitCombo(), &QComboBox::currentTextChanged, this, [this](const QString &text) {
-            m_configManager->set("General", "rate_limit", text);
-            m_configManager->save();
-        });
+        connect(m_uiBuilder->rateLimitCombo(), &QComboBox::currentTextChanged, this, &StartTab::onRateLimitChanged);
     }
     if (m_uiBuilder->overrideDuplicateCheck()) {
-        connect(m_uiBuilder->overrideDuplicateCheck(), &ToggleSwitch::toggled, this, [this](bool checked) {
-            m_configManager->set("General", "override_archive", checked);
-            m_configManager->save();
-        });
+        connect(m_uiBuilder->overrideDuplicateCheck(), &ToggleSwitch::toggled, this, &StartTab::onOverrideArchiveToggled);
     }
 
     setLayout(mainLayout); // Set the layout for the StartTab widget
 }
 
-void StartTab::applyCommandPreviewStyleSheet() {
+void StartTab::onSupportedSitesClicked() {
+    SupportedSitesDialog dialog(this);
+    dialog.exec();
 }
 
-void StartTab::applyUrlInputStyleSheet() {
+void StartTab::onMaxConcurrentChanged(const QString &text) {
+    m_configManager->set("General", "max_threads", text);
+    m_configManager->scheduleSave();
 }
 
-void StartTab::changeEvent(QEvent *event) {
-    if (event && event->type() == QEvent::PaletteChange) {
-        applyUrlInputStyleSheet();
-        applyCommandPreviewStyleSheet(); // Re-apply command preview style on theme change
-    }
-    QWidget::changeEvent(event);
+void StartTab::onPlaylistLogicChanged(const QString &text) {
+    m_configManager->set("General", "playlist_logic", text);
+    m_configManager->scheduleSave();
+}
+
+void StartTab::onRateLimitChanged(const QString &text) {
+    m_configManager->set("General", "rate_limit", text);
+    m_configManager->scheduleSave();
+}
+
+void StartTab::onOverrideArchiveToggled(bool checked) {
+    m_configManager->set("General", "override_archive", checked);
+    m_configManager->scheduleSave();
 }
 
 void StartTab::loadSettings() { // Use m_uiBuilder members
@@ -166,14 +173,15 @@ void StartTab::loadSettings() { // Use m_uiBuilder members
     QSignalBlocker b3(m_uiBuilder->rateLimitCombo());
     QSignalBlocker b4(m_uiBuilder->overrideDuplicateCheck());
 
+    const QVariantMap general = m_configManager->getSection("General");
     if (m_uiBuilder->playlistLogicCombo())
-        m_uiBuilder->playlistLogicCombo()->setCurrentText(m_configManager->get("General", "playlist_logic", "Ask").toString());
+        m_uiBuilder->playlistLogicCombo()->setCurrentText(general.value("playlist_logic", "Ask").toString());
     if (m_uiBuilder->maxConcurrentCombo())
-        m_uiBuilder->maxConcurrentCombo()->setCurrentText(m_configManager->get("General", "max_threads", "4").toString());
+        m_uiBuilder->maxConcurrentCombo()->setCurrentText(general.value("max_threads", "4").toString());
     if (m_uiBuilder->rateLimitCombo())
-        m_uiBuilder->rateLimitCombo()->setCurrentText(m_configManager->get("General", "rate_limit", "Unlimited").toString());
+        m_uiBuilder->rateLimitCombo()->setCurrentText(general.value("rate_limit", "Unlimited").toString());
     if (m_uiBuilder->overrideDuplicateCheck())
-        m_uiBuilder->overrideDuplicateCheck()->setChecked(m_configManager->get("General", "override_archive", false).toBool());
+        m_uiBuilder->overrideDuplicateCheck()->setChecked(general.value("override_archive", false).toBool());
 
 }
 
@@ -183,6 +191,9 @@ bool StartTab::eventFilter(QObject *obj, QEvent *event) {
 
 void StartTab::updateCommandPreview()
 {
+    if (!m_initialRefreshDone) {
+        return; // showEvent performs the first refresh
+    }
     m_commandPreviewUpdater->updateCommandPreview();
 }
 
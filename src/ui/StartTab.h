@@ -2,14 +2,8 @@
 #define STARTTAB_H
 
 #include <QWidget>
-#include <QTextEdit>
-#include <QComboBox>
-#include <QPushButton>
 #include <QVariantMap>
 #include <QProcess>
-#include <QSpinBox>
-#include <QGroupBox>
-#include <QMessageBox>
 #include "core/ConfigManager.h"
 #include "utils/ExtractorJsonParser.h"
 #include "core/YtDlpArgsBuilder.h"
@@ -17,6 +11,7 @@
 
 class QEvent;
 class QFocusEvent;
+class QShowEvent;
 class ToggleSwitch;
 class StartTabUiBuilder;
 class StartTabUrlHandler;
@@ -35,7 +30,7 @@ public:
 protected:
     void focusInEvent(QFocusEvent *event) override;
     bool eventFilter(QObject *obj, QEvent *event) override;
-    void changeEvent(QEvent *event) override;
+    void showEvent(QShowEvent *event) override;
 
 signals:
     void downloadRequested(const QString &url, const QVariantMap &options);
@@ -50,18 +45,16 @@ public slots: // Changed from private slots:
     void onDuplicateDownloadDetected(const QString &url, const QString &reason);
     void updateDynamicUI();
 
+private slots:
+    void onSupportedSitesClicked();
+    void onMaxConcurrentChanged(const QString &text);
+    void onPlaylistLogicChanged(const QString &text);
+    void onRateLimitChanged(const QString &text);
+    void onOverrideArchiveToggled(bool checked);
+
 private:
     void setupUI();
     void loadSettings();
-    void applyUrlInputStyleSheet();
-    void applyCommandPreviewStyleSheet(); // Added this line
-
-    enum class ExtractorSupport {
-        None,
-        YtDlpOnly,
-        GalleryDlOnly,
-        Both
-    };
 
     ConfigManager *m_configManager;
     ExtractorJsonParser *m_extractorJsonParser;
@@ -73,8 +66,7 @@ private:
     StartTabDownloadActions *m_downloadActions;
     StartTabCommandPreviewUpdater *m_commandPreviewUpdater;
 
-    QMessageBox *m_typeSelectionDialog = nullptr;
-    QString m_lastAutoSwitchedUrl;
+    bool m_initialRefreshDone = false;
 };
 
 #endif // STARTTAB_H
@@ -14,6 +14,28 @@
 #include <QTextEdit>
 #include <QHBoxLayout>
 #include <QVBoxLayout>
+#include <QStandardItemModel>
+
+namespace {
+struct DownloadTypeOption {
+    const char *type;
+    const char *label;
+    const char *toolTip;
+};
+
+constexpr DownloadTypeOption kDownloadTypeOptions[] = {
+    {"video", "Video", nullptr},
+    {"audio", "Audio Only", nullptr},
+    {"gallery", "Gallery", nullptr},
+    {"formats", "View Video/Audio Formats", "Uses yt-dlp to list available video and audio formats. Not supported for galleries."}
+};
+
+// Settings-row choices. Fixed for the lifetime of the app, so every build
+// shares the same implicitly shared lists.
+const QStringList kPlaylistLogicChoices = {"Ask", "Download All (no prompt)", "Download Single (ignore playlist)"};
+const QStringList kMaxConcurrentChoices = {"1", "2", "3", "4", "5", "6", "7", "8", "1 (short sleep)", "1 (long sleep)"};
+const QStringList kRateLimitChoices = {"Unlimited", "500 KB/s", "1 MB/s", "2 MB/s", "5 MB/s", "10 MB/s"};
+}
 
 StartTabUiBuilder::StartTabUiBuilder(ConfigManager *configManager, QObject *parent)
     : QObject(parent), m_configManager(configManager),
@@ -72,7 +94,6 @@ void StartTabUiBuilder::build(QWidget *parentWidget, QVBoxLayout *mainLayout)
     m_urlInput->setPlaceholderText("Paste one or more media URLs (one per line)...");
     m_urlInput->setToolTip("Paste the web address (URL) of the video or audio you want to download here. You can paste multiple links, just put each one on a new line.");
     m_urlInput->setMinimumHeight(100);
-    applyUrlInputStyleSheet(m_urlInput);
     inputSectionLayout->addWidget(m_urlInput, 70);
 
     QVBoxLayout *actionColumnLayout = new QVBoxLayout();
@@ -90,12 +111,26 @@ void StartTabUiBuilder::build(QWidget *parentWidget, QVBoxLayout *mainLayout)
     downloadTypeLabel->setToolTip("Select the type of download.");
     actionColumnLayout->addWidget(downloadTypeLabel);
 
+    // Assemble the rows in a detached model and hand it over in one step rather
+    // than inserting (and signalling) one item at a time.
     m_downloadTypeCombo = new QComboBox(parentWidget);
-    m_downloadTypeCombo->addItem("Video", "video");
-    m_downloadTypeCombo->addItem("Audio Only", "audio");
-    m_downloadTypeCombo->addItem("Gallery", "gallery");
-    m_downloadTypeCombo->addItem("View Video/Audio Formats", "formats");
-    m_downloadTypeCombo->setItemData(3, "Uses yt-dlp to list available video and audio formats. Not supported for galleries.", Qt::ToolTipRole);
+    QStandardItemModel *downloadTypeModel = new QStandardItemModel(m_downloadTypeCombo);
+    QList<QStandardItem*> downloadTypeItems;
+    for (const DownloadTypeOption &option : kDownloadTypeOptions) {
+        QStandardItem *item = new QStandardItem(QString::fromUtf8(option.label));
+        item->setData(QString::fromLatin1(option.type), Qt::UserRole);
+        if (option.toolTip) {
+            item->setToolTip(QString::fromUtf8(option.toolTip));
+        }
+        m_downloadTypeIndexes.insert(QString::fromLatin1(option.type), downloadTypeItems.size());
+        downloadTypeItems.append(item);
+    }
+    downloadTypeModel->appendColumn(downloadTypeItems);
+    m_downloadTypeCombo->setModel(downloadTypeModel);
+    // Item texts gain a "(missing binaries)" suffix at runtime; a fixed content
+    // length keeps that from re-measuring and resizing the action column.
+    m_downloadTypeCombo->setMinimumContentsLength(16);
+    m_downloadTypeCombo->setSizeAdjustPolicy(QComboBox::AdjustToMinimumContentsLengthWithIcon);
     m_downloadTypeCombo->setToolTip("Select the type of download.");
     actionColumnLayout->addWidget(m_downloadTypeCombo);
 
@@ -107,31 +142,30 @@ void StartTabUiBuilder::build(QWidget *parentWidget, QVBoxLayout *mainLayout)
 
     QHBoxLayout *settingsLayout = new QHBoxLayout();
 
-    QLabel *playlistLabel = new QLabel("Playlist Logic:", parentWidget);
-    settingsLayout->addWidget(playlistLabel);
-    m_playlistLogicCombo = new QComboBox(parentWidget);
-    m_playlistLogicCombo->addItems({"Ask", "Download All (no prompt)", "Download Single (ignore playlist)"});
-    m_playlistLogicCombo->setSizePolicy(QSizePolicy::MinimumExpanding, QSizePolicy::Fixed);
-    m_playlistLogicCombo->setMinimumContentsLength(10);
-    m_playlistLogicCombo->setSizeAdjustPolicy(QComboBox::AdjustToMinimumContentsLengthWithIcon);
-    settingsLayout->addWidget(m_playlistLogicCombo);
-
-    QLabel *concurrentLabel = new QLabel("Max Concurrent:", parentWidget);
-    settingsLayout->addWidget(concurrentLabel);
-    m_maxConcurrentCombo = new QComboBox(parentWidget);
-    m_maxConcurrentCombo->addItems({"1", "2", "3", "4", "5", "6", "7", "8", "1 (short sleep)", "1 (long sleep)"});
-    m_maxConcurrentCombo->setSizePolicy(QSizePolicy::MinimumExpanding, QSizePolicy::Fixed);
-    settingsLayout->addWidget(m_maxConcurrentCombo);
-
-    QLabel *rateLabel = new QLabel("Rate Limit:", parentWidget);
-    settingsLayout->addWidget(rateLabel);
-    m_rateLimitCombo = new QComboBox(parentWidget);
-    m_rateLimitCombo->addItems({"Unlimited", "500 KB/s", "1 MB/s", "2 MB/s", "5 MB/s", "10 MB/s"});
-    m_rateLimitCombo->setSizePolicy(QSizePolicy::MinimumExpanding, QSizePolicy::Fixed);
-    settingsLayout->addWidget(m_rateLimitCombo);
-
-    QLabel *overrideLabel = new QLabel("Override Archive:", parentWidget);
-    settingsLayout->addWidget(overrideLabel);
+    // Settings-row captions never need to grow, so they share one fixed policy.
+    auto addSettingLabel = [parentWidget, settingsLayout](const QString &text) {
+        QLabel *label = new QLabel(text, parentWidget);
+        label->setSizePolicy(QSizePolicy::Fixed, QSizePolicy::Fixed);
+        settingsLayout->addWidget(label);
+    };
+    // Size combos from a fixed character count rather than measuring every item;
+    // MinimumExpanding still lets them widen when the row has room.
+    auto addSettingCombo = [parentWidget, settingsLayout, &addSettingLabel](const QString &labelText, const QStringList &items, int minimumContentsLength) {
+        addSettingLabel(labelText);
+        QComboBox *combo = new QComboBox(parentWidget);
+        combo->addItems(items);
+        combo->setSizePolicy(QSizePolicy::MinimumExpanding, QSizePolicy::Fixed);
+        combo->setMinimumContentsLength(minimumContentsLength);
+        combo->setSizeAdjustPolicy(QComboBox::AdjustToMinimumContentsLengthWithIcon);
+        settingsLayout->addWidget(combo);
+        return combo;
+    };
+
+    m_playlistLogicCombo = addSettingCombo("Playlist Logic:", kPlaylistLogicChoices, 10);
+    m_maxConcurrentCombo = addSettingCombo("Max Concurrent:", kMaxConcurrentChoices, 8);
+    m_rateLimitCombo = addSettingCombo("Rate Limit:", kRateLimitChoices, 9);
+
+    addSettingLabel("Override Archive:");
     m_overrideDuplicateCheck = new ToggleSwitch(parentWidget);
     settingsLayout->addWidget(m_overrideDuplicateCheck);
 
@@ -145,8 +179,3 @@ void StartTabUiBuilder::build(QWidget *parentWidget, QVBoxLayout *mainLayout)
     m_commandPreview->setMaximumHeight(80);
     mainLayout->addWidget(m_commandPreview);
 }
-
-void StartTabUiBuilder::applyUrlInputStyleSheet(QTextEdit *urlInput)
-{
-    // Implement style sheet logic here, or leave empty if handled by global themes
-}
\ No newline at end of file
@@ -8,6 +8,7 @@
 #include <QHBoxLayout>
 #include <QVBoxLayout>
 #include <QGridLayout>
+#include <QHash>
 
 class ConfigManager;
 class ToggleSwitch;
@@ -18,11 +19,10 @@ class StartTabUiBuilder : public QObject
 public:
     explicit StartTabUiBuilder(ConfigManager *configManager, QObject *parent = nullptr);
     void build(QWidget *parentWidget, QVBoxLayout *mainLayout);
-    void applyCommandPreviewStyleSheet(QTextEdit* commandPreview);
-    void applyUrlInputStyleSheet(QTextEdit* urlInput);
     QTextEdit* urlInput() const { return m_urlInput; }
     QPushButton* downloadButton() const { return m_downloadButton; }
     QComboBox* downloadTypeCombo() const { return m_downloadTypeCombo; }
+    int downloadTypeIndex(const QString &type) const { return m_downloadTypeIndexes.value(type, -1); }
     QComboBox* playlistLogicCombo() const { return m_playlistLogicCombo; }
     QComboBox* maxConcurrentCombo() const { return m_maxConcurrentCombo; }
     QComboBox* rateLimitCombo() const { return m_rateLimitCombo; }
@@ -34,6 +34,7 @@ private:
     QTextEdit *m_urlInput;
     QPushButton *m_downloadButton;
     QComboBox *m_downloadTypeCombo;
+    QHash<QString, int> m_downloadTypeIndexes; // Item data -> row; the rows never change
     QComboBox *m_playlistLogicCombo;
     QComboBox *m_maxConcurrentCombo;
     QComboBox *m_rateLimitCombo;
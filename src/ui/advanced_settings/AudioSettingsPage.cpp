@@ -6,6 +6,36 @@
 #include <QLabel>
 #include <QComboBox>
 #include <QSignalBlocker>
+#include <QStringListModel>
+
+namespace {
+const QStringList kAudioQualityChoices = {"Select at Runtime", "best", "320k", "256k", "192k", "128k", "96k", "64k", "32k", "worst"};
+const QStringList kAudioCodecChoices = {"Default", "Opus", "AAC", "Vorbis", "MP3", "FLAC", "WAV", "ALAC", "AC3", "EAC3", "DTS", "PCM"};
+
+// Extension choices per audio codec. Kept as shared constants so a rebuild
+// hands the combo's model an implicitly shared list instead of new strings.
+const QStringList &audioExtensionsForCodec(const QString &codec) {
+    static const QStringList kAll = {"mp3", "m4a", "opus", "wav", "flac"};
+    static const QStringList kAac = {"m4a", "aac"};
+    static const QStringList kOpus = {"opus"};
+    static const QStringList kVorbis = {"ogg"};
+    static const QStringList kMp3 = {"mp3"};
+    static const QStringList kFlac = {"flac"};
+    static const QStringList kWav = {"wav"};
+    static const QStringList kAlac = {"m4a", "alac"};
+    static const QStringList kSurround = {"ac3", "eac3", "dts"};
+
+    if (codec == "AAC") return kAac;
+    if (codec == "Opus") return kOpus;
+    if (codec == "Vorbis") return kVorbis;
+    if (codec == "MP3") return kMp3;
+    if (codec == "FLAC") return kFlac;
+    if (codec == "WAV" || codec == "PCM") return kWav;
+    if (codec == "ALAC") return kAlac;
+    if (codec == "AC3" || codec == "EAC3" || codec == "DTS") return kSurround;
+    return kAll;
+}
+}
 
 AudioSettingsPage::AudioSettingsPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
@@ -18,7 +48,7 @@ AudioSettingsPage::AudioSettingsPage(ConfigManager *configManager, QWidget *pare
 
     m_audioQualityCombo = new QComboBox(this);
     m_audioQualityCombo->setToolTip("Pick the default audio quality. Choose 'Select at Runtime' to hide the rest of these defaults and pick exact formats when you queue a download.");
-    m_audioQualityCombo->addItems({"Select at Runtime", "best", "320k", "256k", "192k", "128k", "96k", "64k", "32k", "worst"});
+    m_audioQualityCombo->addItems(kAudioQualityChoices);
     QLabel *qualityLabel = new QLabel("Quality:", this);
     qualityLabel->setToolTip(m_audioQualityCombo->toolTip());
     audioLayout->addRow(qualityLabel, m_audioQualityCombo);
@@ -27,14 +57,15 @@ AudioSettingsPage::AudioSettingsPage(ConfigManager *configManager, QWidget *pare
     m_audioCodecLabel->setToolTip("Choose the default audio codec used when runtime selection is off.");
     m_audioCodecCombo = new QComboBox(this);
     m_audioCodecCombo->setToolTip("Choose the audio format (codec). Opus is modern and efficient, MP3 is very common, FLAC is for lossless quality.");
-    m_audioCodecCombo->addItems({"Default", "Opus", "AAC", "Vorbis", "MP3", "FLAC", "WAV", "ALAC", "AC3", "EAC3", "DTS", "PCM"});
+    m_audioCodecCombo->addItems(kAudioCodecChoices);
     audioLayout->addRow(m_audioCodecLabel, m_audioCodecCombo);
 
     m_audioExtLabel = new QLabel("Extension:", this);
     m_audioExtLabel->setToolTip("Select the default file extension used when runtime selection is off.");
     m_audioExtCombo = new QComboBox(this);
     m_audioExtCombo->setToolTip("Select the file type for your audio... This changes automatically based on the audio codec.");
-    m_audioExtCombo->addItems({"mp3", "m4a", "opus", "wav", "flac"});
+    m_audioExtModel = new QStringListModel(audioExtensionsForCodec(QString()), m_audioExtCombo);
+    m_audioExtCombo->setModel(m_audioExtModel);
     audioLayout->addRow(m_audioExtLabel, m_audioExtCombo);
 
     m_runtimeHintLabel = new QLabel("Runtime selection mode is enabled. Quality, codec, extension, and stream choices will be picked from the available formats when you queue a download.", this);
@@ -67,13 +98,14 @@ void AudioSettingsPage::onAudioCodecChanged(const QString &text) { m_configManag
 void AudioSettingsPage::onAudioExtChanged(const QString &text) { m_configManager->set("Audio", "audio_extension", text); }
 
 void AudioSettingsPage::handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value) {
+    // Changes made on this page arrive here too, when setCurrentText() is a
+    // no-op. For outside changes the combo's own change handler rebuilds the
+    // extension combo, so this handler does not rebuild them a second time.
     if (section == "Audio") {
         if (key == "quality" || key == "audio_quality") {
             m_audioQualityCombo->setCurrentText(value.toString());
-            updateAudioOptions();
         } else if (key == "codec" || key == "audio_codec") {
             m_audioCodecCombo->setCurrentText(value.toString());
-            updateAudioOptions();
         } else if (key == "extension" || key == "audio_extension") {
             m_audioExtCombo->setCurrentText(value.toString());
         }
@@ -102,19 +134,14 @@ void AudioSettingsPage::updateAudioOptions() {
     m_audioExtCombo->setVisible(!isDefaultCodec);
     if (isDefaultCodec) return;
 
+    // Rebuild silently: the model reset would otherwise report transient
+    // values (including an empty string) to onAudioExtChanged, which persists them.
     QString currentExt = m_audioExtCombo->currentText();
-    m_audioExtCombo->clear();
-    
-    if (selectedAudioCodec == "AAC") m_audioExtCombo->addItems({"m4a", "aac"});
-    else if (selectedAudioCodec == "Opus") m_audioExtCombo->addItem("opus");
-    else if (selectedAudioCodec == "Vorbis") m_audioExtCombo->addItem("ogg");
-    else if (selectedAudioCodec == "MP3") m_audioExtCombo->addItem("mp3");
-    else if (selectedAudioCodec == "FLAC") m_audioExtCombo->addItem("flac");
-    else if (selectedAudioCodec == "WAV" || selectedAudioCodec == "PCM") m_audioExtCombo->addItem("wav");
-    else if (selectedAudioCodec == "ALAC") m_audioExtCombo->addItems({"m4a", "alac"});
-    else if (selectedAudioCodec == "AC3" || selectedAudioCodec == "EAC3" || selectedAudioCodec == "DTS") m_audioExtCombo->addItems({"ac3", "eac3", "dts"});
-    else m_audioExtCombo->addItems({"mp3", "m4a", "opus", "wav", "flac"});
-
-    if (m_audioExtCombo->findText(currentExt) != -1) m_audioExtCombo->setCurrentText(currentExt);
-    else m_audioExtCombo->setCurrentIndex(0);
+    QSignalBlocker extBlocker(m_audioExtCombo);
+    const QStringList &extensions = audioExtensionsForCodec(selectedAudioCodec);
+    m_audioExtModel->setStringList(extensions);
+    // The row is known from the list just installed; no need to scan the model.
+    m_audioExtCombo->setCurrentIndex(qMax(0, extensions.indexOf(currentExt)));
+    extBlocker.unblock();
+    if (!m_audioExtCombo->signalsBlocked() && m_audioExtCombo->currentText() != currentExt) onAudioExtChanged(m_audioExtCombo->currentText());
 }
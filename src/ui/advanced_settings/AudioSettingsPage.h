@@ -5,6 +5,7 @@
 class ConfigManager;
 class QComboBox;
 class QLabel;
+class QStringListModel;
 
 class AudioSettingsPage : public QWidget {
     Q_OBJECT
@@ -26,5 +27,6 @@ private:
     QComboBox *m_audioCodecCombo;
     QLabel *m_audioExtLabel;
     QComboBox *m_audioExtCombo;
+    QStringListModel *m_audioExtModel;
     QLabel *m_runtimeHintLabel;
 };
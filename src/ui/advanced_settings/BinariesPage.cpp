@@ -10,6 +10,7 @@
 #include <QDir>
 #include <QFileDialog>
 #include <QFileInfo>
+#include <QFontDatabase>
 #include <QFormLayout>
 #include <QGroupBox>
 #include <QHBoxLayout>
@@ -23,7 +24,7 @@
 #include <QStandardPaths>
 #include <QUrl>
 #include <QVBoxLayout>
-#include <QTextEdit>
+#include <QPlainTextEdit>
 #include <QTextCursor>
 #include <QTimer>
 
@@ -274,9 +275,12 @@ void BinariesPage::setupRow(QVBoxLayout *layout,
                 progressDialog.resize(600, 400);
 
                 QVBoxLayout *pLayout = new QVBoxLayout(&progressDialog);
-                QTextEdit *outputEdit = new QTextEdit(&progressDialog);
+                QPlainTextEdit *outputEdit = new QPlainTextEdit(&progressDialog);
                 outputEdit->setReadOnly(true);
-                outputEdit->setFontFamily("Courier New");
+                // Output is appended chunk by chunk; a read-only log has no use
+                // for an undo entry per chunk.
+                outputEdit->setUndoRedoEnabled(false);
+                outputEdit->setFont(QFontDatabase::systemFont(QFontDatabase::FixedFont));
                 pLayout->addWidget(outputEdit);
 
                 QDialogButtonBox *pButtons = new QDialogButtonBox(QDialogButtonBox::Close, &progressDialog);
@@ -486,9 +490,10 @@ void BinariesPage::installBinaryFor(const QString &binaryName) {
         progressDialog.resize(600, 400);
 
         QVBoxLayout *pLayout = new QVBoxLayout(&progressDialog);
-        QTextEdit *outputEdit = new QTextEdit(&progressDialog);
+        QPlainTextEdit *outputEdit = new QPlainTextEdit(&progressDialog);
         outputEdit->setReadOnly(true);
-        outputEdit->setFontFamily("Courier New");
+        outputEdit->setUndoRedoEnabled(false);
+        outputEdit->setFont(QFontDatabase::systemFont(QFontDatabase::FixedFont));
         pLayout->addWidget(outputEdit);
 
         QDialogButtonBox *pButtons = new QDialogButtonBox(QDialogButtonBox::Close, &progressDialog);
@@ -11,6 +11,24 @@
 #include <QComboBox>
 #include <QCheckBox>
 #include <QSignalBlocker>
+#include <QHash>
+
+namespace {
+const QStringList kThemeNames = {"System", "Light", "Dark"};
+
+// Theme name -> combo row, built once so restoring the saved theme is a hash
+// lookup instead of a findText() scan over the combo model.
+int themeIndex(const QString &theme) {
+    static const QHash<QString, int> index = [] {
+        QHash<QString, int> map;
+        for (int i = 0; i < kThemeNames.size(); ++i) {
+            map.insert(kThemeNames.at(i), i);
+        }
+        return map;
+    }();
+    return index.value(theme, -1);
+}
+}
 
 ConfigurationPage::ConfigurationPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
@@ -21,36 +39,45 @@ ConfigurationPage::ConfigurationPage(ConfigManager *configManager, QWidget *pare
     configGroup->setToolTip("General application settings including download locations and theme.");
     QFormLayout *configLayout = new QFormLayout(configGroup);
 
-    m_completedDirInput = new QLineEdit(this);
-    m_completedDirInput->setReadOnly(true);
-    m_completedDirInput->setToolTip("This is where your finished downloads will be saved. Click 'Browse' to change it.");
-    m_browseCompletedBtn = new QPushButton("Browse...", this);
-    m_browseCompletedBtn->setToolTip("Click to choose a different folder for your completed downloads.");
-    QHBoxLayout *completedLayout = new QHBoxLayout();
-    completedLayout->addWidget(m_completedDirInput);
-    completedLayout->addWidget(m_browseCompletedBtn);
-    QLabel *completedLabel = new QLabel("Output folder:", this);
-    completedLabel->setToolTip(m_completedDirInput->toolTip());
-    configLayout->addRow(completedLabel, completedLayout);
-
-    m_tempDirInput = new QLineEdit(this);
-    m_tempDirInput->setReadOnly(true);
-    m_tempDirInput->setToolTip("This is a temporary folder used during downloads. You usually don't need to change this.");
-    m_browseTempBtn = new QPushButton("Browse...", this);
-    m_browseTempBtn->setToolTip("Click to choose a different temporary folder for downloads.");
-    QHBoxLayout *tempLayout = new QHBoxLayout();
-    tempLayout->addWidget(m_tempDirInput);
-    tempLayout->addWidget(m_browseTempBtn);
-    QLabel *tempLabel = new QLabel("Temporary folder:", this);
-    tempLabel->setToolTip(m_tempDirInput->toolTip());
-    configLayout->addRow(tempLabel, tempLayout);
+    // Row labels reuse the tooltip of the control they describe, so each hint
+    // text is written once.
+    auto addFormRow = [&](const QString &labelText, QWidget *tooltipSource, auto *field) {
+        QLabel *label = new QLabel(labelText, this);
+        label->setToolTip(tooltipSource->toolTip());
+        configLayout->addRow(label, field);
+    };
+
+    // Folder rows are a read-only path field with a Browse button beside it.
+    auto createFolderRow = [this](QLineEdit *&input, QPushButton *&browseButton,
+                                  const QString &inputTip, const QString &buttonTip) {
+        input = new QLineEdit(this);
+        input->setReadOnly(true);
+        input->setToolTip(inputTip);
+        browseButton = new QPushButton("Browse...", this);
+        browseButton->setToolTip(buttonTip);
+        QHBoxLayout *rowLayout = new QHBoxLayout();
+        rowLayout->setContentsMargins(0, 0, 0, 0);
+        rowLayout->addWidget(input, 1);
+        rowLayout->addWidget(browseButton);
+        return rowLayout;
+    };
+
+    QHBoxLayout *completedLayout = createFolderRow(m_completedDirInput, m_browseCompletedBtn,
+        "This is where your finished downloads will be saved. Click 'Browse' to change it.",
+        "Click to choose a different folder for your completed downloads.");
+    addFormRow("Output folder:", m_completedDirInput, completedLayout);
+
+    QHBoxLayout *tempLayout = createFolderRow(m_tempDirInput, m_browseTempBtn,
+        "This is a temporary folder used during downloads. You usually don't need to change this.",
+        "Click to choose a different temporary folder for downloads.");
+    addFormRow("Temporary folder:", m_tempDirInput, tempLayout);
 
     m_themeCombo = new QComboBox(this);
     m_themeCombo->setToolTip("Choose the visual style of the application: 'System' (matches your computer's setting), 'Light', or 'Dark'.");
-    m_themeCombo->addItems({"System", "Light", "Dark"});
-    QLabel *themeLabel = new QLabel("Theme:", this);
-    themeLabel->setToolTip(m_themeCombo->toolTip());
-    configLayout->addRow(themeLabel, m_themeCombo);
+    m_themeCombo->addItems(kThemeNames);
+    m_themeCombo->setMinimumContentsLength(8);
+    m_themeCombo->setSizeAdjustPolicy(QComboBox::AdjustToMinimumContentsLengthWithIcon);
+    addFormRow("Theme:", m_themeCombo, m_themeCombo);
 
     m_enableApiServerCheck = new QCheckBox("Enable Local API Server", this);
     m_enableApiServerCheck->setToolTip("Allows external applications (like a local Discord bot) to send download links directly to this app via port 8765.");
@@ -62,7 +89,7 @@ ConfigurationPage::ConfigurationPage(ConfigManager *configManager, QWidget *pare
     connect(m_browseCompletedBtn, &QPushButton::clicked, this, &ConfigurationPage::selectCompletedDir);
     connect(m_browseTempBtn, &QPushButton::clicked, this, &ConfigurationPage::selectTempDir);
     connect(m_themeCombo, &QComboBox::currentTextChanged, this, &ConfigurationPage::onThemeChanged);
-    connect(m_enableApiServerCheck, &QCheckBox::stateChanged, this, &ConfigurationPage::onEnableApiServerToggled);
+    connect(m_enableApiServerCheck, &QCheckBox::toggled, this, &ConfigurationPage::onEnableApiServerToggled);
     connect(m_configManager, &ConfigManager::settingChanged, this, &ConfigurationPage::handleConfigSettingChanged);
 }
 
@@ -74,7 +101,10 @@ void ConfigurationPage::loadSettings() {
 
     m_completedDirInput->setText(m_configManager->get("Paths", "completed_downloads_directory").toString());
     m_tempDirInput->setText(m_configManager->get("Paths", "temporary_downloads_directory").toString());
-    m_themeCombo->setCurrentText(m_configManager->get("General", "theme", "System").toString());
+    const int themeRow = themeIndex(m_configManager->get("General", "theme", "System").toString());
+    if (themeRow >= 0) {
+        m_themeCombo->setCurrentIndex(themeRow);
+    }
     m_enableApiServerCheck->setChecked(m_configManager->get("General", "enable_local_api", false).toBool());
 }
 
@@ -96,12 +126,12 @@ void ConfigurationPage::selectTempDir() {
 
 void ConfigurationPage::onThemeChanged(const QString &text) {
     m_configManager->set("General", "theme", text);
-    m_configManager->save();
+    m_configManager->scheduleSave();
     emit themeChanged(text);
 }
 
-void ConfigurationPage::onEnableApiServerToggled(int state) {
-    m_configManager->set("General", "enable_local_api", state == Qt::Checked);
+void ConfigurationPage::onEnableApiServerToggled(bool checked) {
+    m_configManager->set("General", "enable_local_api", checked);
     m_configManager->save();
 }
 
@@ -110,9 +140,11 @@ void ConfigurationPage::handleConfigSettingChanged(const QString &section, const
         if (key == "completed_downloads_directory") m_completedDirInput->setText(value.toString());
         else if (key == "temporary_downloads_directory") m_tempDirInput->setText(value.toString());
     } else if (section == "General" && key == "theme") {
-        disconnect(m_themeCombo, &QComboBox::currentTextChanged, this, &ConfigurationPage::onThemeChanged);
-        m_themeCombo->setCurrentText(value.toString());
-        connect(m_themeCombo, &QComboBox::currentTextChanged, this, &ConfigurationPage::onThemeChanged);
+        const int themeRow = themeIndex(value.toString());
+        if (themeRow >= 0) {
+            QSignalBlocker b(m_themeCombo);
+            m_themeCombo->setCurrentIndex(themeRow);
+        }
     }
     else if (section == "General" && key == "enable_local_api") {
         QSignalBlocker b(m_enableApiServerCheck);
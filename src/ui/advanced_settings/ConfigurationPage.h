@@ -24,7 +24,7 @@ private slots:
     void selectTempDir();
     void onThemeChanged(const QString &text);
     void handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value);
-    void onEnableApiServerToggled(int state);
+    void onEnableApiServerToggled(bool checked);
 
 private:
     ConfigManager *m_configManager;
@@ -37,6 +37,31 @@ QString requiredFfmpegEncoder(const QString &id)
     if (id == "videotoolbox_h264") return "h264_videotoolbox";
     return QString();
 }
+
+// The GPU listing is read straight from the tool rather than through a shell
+// pipeline, so keep only the lines grep used to select.
+QString displayAdapterLines(const QString &output)
+{
+#if defined(Q_OS_WIN)
+    return output;
+#else
+#if defined(Q_OS_MACOS)
+    const QStringList needles = {"Chipset Model"};
+#else
+    const QStringList needles = {"vga", "3d", "display"};
+#endif
+    QStringList lines;
+    for (const QString &line : output.split('\n')) {
+        for (const QString &needle : needles) {
+            if (line.contains(needle, Qt::CaseInsensitive)) {
+                lines << line;
+                break;
+            }
+        }
+    }
+    return lines.join('\n');
+#endif
+}
 }
 
 DownloadOptionsPage::DownloadOptionsPage(ConfigManager *configManager, QWidget *parent)
@@ -160,9 +185,7 @@ DownloadOptionsPage::DownloadOptionsPage(ConfigManager *configManager, QWidget *
     connect(m_autoPasteModeCombo, QOverload<int>::of(&QComboBox::currentIndexChanged), this, &DownloadOptionsPage::onAutoPasteModeChanged);
     connect(m_singleLineCommandPreviewCheck, &ToggleSwitch::toggled, this, &DownloadOptionsPage::onSingleLineCommandPreviewToggled);
     connect(m_restrictFilenamesCheck, &ToggleSwitch::toggled, this, &DownloadOptionsPage::onRestrictFilenamesToggled);
-    connect(m_prefixPlaylistIndicesCheck, &ToggleSwitch::toggled, this, [this](bool c) {
-        m_configManager->set("DownloadOptions", "prefix_playlist_indices", c);
-    });
+    connect(m_prefixPlaylistIndicesCheck, &ToggleSwitch::toggled, this, &DownloadOptionsPage::onPrefixPlaylistIndicesToggled);
     connect(m_autoClearCompletedCheck, &ToggleSwitch::toggled, this, &DownloadOptionsPage::onAutoClearCompletedToggled);
     connect(m_geoProxyInput, &QLineEdit::editingFinished, this, &DownloadOptionsPage::onGeoProxyChanged);
     connect(m_configManager, &ConfigManager::settingChanged, this, &DownloadOptionsPage::handleConfigSettingChanged);
@@ -234,9 +257,7 @@ void DownloadOptionsPage::loadSettings() {
     m_splitChaptersCheck->setChecked(m_configManager->get("DownloadOptions", "split_chapters", false).toBool());
     m_downloadSectionsCheck->setChecked(m_configManager->get("DownloadOptions", "download_sections_enabled", false).toBool());
     const QString cutEncoder = m_configManager->get("DownloadOptions", "ffmpeg_cut_encoder", "cpu").toString();
-    int cutEncoderIndex = m_ffmpegCutEncoderCombo->findData(cutEncoder);
-    if (cutEncoderIndex < 0) cutEncoderIndex = 0;
-    m_ffmpegCutEncoderCombo->setCurrentIndex(cutEncoderIndex);
+    m_ffmpegCutEncoderCombo->setCurrentIndex(qMax(0, cutEncoderIndex(cutEncoder)));
     m_ffmpegCutCustomArgsInput->setText(m_configManager->get("DownloadOptions", "ffmpeg_cut_custom_args", "").toString());
     m_ffmpegCutCustomArgsInput->setEnabled(m_ffmpegCutEncoderCombo->currentData().toString() == "custom");
     m_autoClearCompletedCheck->setChecked(m_configManager->get("DownloadOptions", "auto_clear_completed", false).toBool());
@@ -265,27 +286,34 @@ void DownloadOptionsPage::onFfmpegCutCustomArgsChanged() { m_configManager->set(
 void DownloadOptionsPage::onAutoPasteModeChanged(int index) { m_configManager->set("General", "auto_paste_mode", index); }
 void DownloadOptionsPage::onSingleLineCommandPreviewToggled(bool c) { m_configManager->set("General", "single_line_preview", c); }
 void DownloadOptionsPage::onRestrictFilenamesToggled(bool c) { m_configManager->set("General", "restrict_filenames", c); }
+void DownloadOptionsPage::onPrefixPlaylistIndicesToggled(bool c) { m_configManager->set("DownloadOptions", "prefix_playlist_indices", c); }
 void DownloadOptionsPage::onAutoClearCompletedToggled(bool c) { m_configManager->set("DownloadOptions", "auto_clear_completed", c); }
 void DownloadOptionsPage::onGeoProxyChanged() { m_configManager->set("DownloadOptions", "geo_verification_proxy", m_geoProxyInput->text()); }
 
+int DownloadOptionsPage::cutEncoderIndex(const QString &encoderId) const {
+    return m_cutEncoderIndexes.value(encoderId, -1);
+}
+
 void DownloadOptionsPage::populateFfmpegCutEncoderCombo(const QStringList &visibleEncoderIds) {
     const QString selectedEncoder = m_ffmpegCutEncoderCombo
         ? m_ffmpegCutEncoderCombo->currentData().toString()
         : m_configManager->get("DownloadOptions", "ffmpeg_cut_encoder", "cpu").toString();
     QSignalBlocker blocker(m_ffmpegCutEncoderCombo);
     m_ffmpegCutEncoderCombo->clear();
+    m_cutEncoderIndexes.clear();
 
     for (const CutEncoderOption &option : kCutEncoderOptions) {
         const QString id = QString::fromLatin1(option.id);
         const bool alwaysVisible = (id == "cpu" || id == "custom");
         if (alwaysVisible || visibleEncoderIds.contains(id)) {
+            m_cutEncoderIndexes.insert(id, m_ffmpegCutEncoderCombo->count());
             m_ffmpegCutEncoderCombo->addItem(QString::fromLatin1(option.label), id);
         }
     }
 
-    int index = m_ffmpegCutEncoderCombo->findData(selectedEncoder);
+    int index = cutEncoderIndex(selectedEncoder);
     if (index < 0) {
-        index = m_ffmpegCutEncoderCombo->findData("cpu");
+        index = cutEncoderIndex("cpu");
         if (selectedEncoder != "cpu" && !selectedEncoder.isEmpty()) {
             m_configManager->set("DownloadOptions", "ffmpeg_cut_encoder", "cpu");
         }
@@ -312,9 +340,9 @@ void DownloadOptionsPage::startHardwareEncoderProbe() {
 #if defined(Q_OS_WIN)
     m_gpuProbe->start("powershell", {"-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name"});
 #elif defined(Q_OS_MACOS)
-    m_gpuProbe->start("sh", {"-c", "system_profiler SPDisplaysDataType 2>/dev/null | grep 'Chipset Model'"});
+    m_gpuProbe->start("system_profiler", {"SPDisplaysDataType"});
 #else
-    m_gpuProbe->start("sh", {"-c", "lspci 2>/dev/null | grep -Ei 'vga|3d|display'"});
+    m_gpuProbe->start("lspci", {});
 #endif
 }
 
@@ -324,7 +352,7 @@ void DownloadOptionsPage::maybeApplyHardwareEncoderProbe() {
     }
 
     const QString encoderOutput = m_ffmpegEncoderProbeOutput.toLower();
-    const QString gpuOutput = m_gpuProbeOutput.toLower();
+    const QString gpuOutput = displayAdapterLines(m_gpuProbeOutput).toLower();
     QStringList visibleEncoders;
 
     const auto ffmpegHasEncoder = [&](const QString &id) {
@@ -368,9 +396,7 @@ void DownloadOptionsPage::handleConfigSettingChanged(const QString &section, con
         else if (key == "download_sections_enabled") m_downloadSectionsCheck->setChecked(value.toBool());
         else if (key == "ffmpeg_cut_encoder") {
             const QString encoder = value.toString();
-            int index = m_ffmpegCutEncoderCombo->findData(encoder);
-            if (index < 0) index = 0;
-            m_ffmpegCutEncoderCombo->setCurrentIndex(index);
+            m_ffmpegCutEncoderCombo->setCurrentIndex(qMax(0, cutEncoderIndex(encoder)));
             m_ffmpegCutCustomArgsInput->setEnabled(m_ffmpegCutEncoderCombo->currentData().toString() == "custom");
         }
         else if (key == "ffmpeg_cut_custom_args") m_ffmpegCutCustomArgsInput->setText(value.toString());
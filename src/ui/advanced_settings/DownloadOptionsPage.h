@@ -1,6 +1,7 @@
 #pragma once
 #include <QWidget>
 #include <QVariant>
+#include <QHash>
 
 class ConfigManager;
 class ToggleSwitch;
@@ -26,16 +27,19 @@ private slots:
     void onSingleLineCommandPreviewToggled(bool checked);
     void onRestrictFilenamesToggled(bool checked);
     void onGeoProxyChanged();
+    void onPrefixPlaylistIndicesToggled(bool checked);
     void onAutoClearCompletedToggled(bool checked);
     void handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value);
 private:
     void populateFfmpegCutEncoderCombo(const QStringList &visibleEncoderIds = {});
     void startHardwareEncoderProbe();
     void maybeApplyHardwareEncoderProbe();
+    int cutEncoderIndex(const QString &encoderId) const;
     ConfigManager *m_configManager;
     QComboBox *m_externalDownloaderCombo;
     ToggleSwitch *m_sponsorBlockCheck, *m_embedChaptersCheck, *m_splitChaptersCheck, *m_downloadSectionsCheck, *m_singleLineCommandPreviewCheck, *m_restrictFilenamesCheck, *m_prefixPlaylistIndicesCheck, *m_autoClearCompletedCheck;
     QComboBox *m_ffmpegCutEncoderCombo;
+    QHash<QString, int> m_cutEncoderIndexes; // Encoder id -> combo row, rebuilt with the combo
     QLineEdit *m_ffmpegCutCustomArgsInput;
     QComboBox *m_autoPasteModeCombo;
     QLineEdit *m_geoProxyInput;
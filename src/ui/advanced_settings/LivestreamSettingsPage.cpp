@@ -10,6 +10,12 @@
 #include <QGroupBox>
 #include <QSignalBlocker>
 
+namespace {
+const QStringList kDownloadAsChoices = {"MPEG-TS", "MKV"};
+const QStringList kLivestreamQualityChoices = {"best", "1080p", "720p", "480p", "360p", "worst"};
+const QStringList kConvertToChoices = {"None", "mp4", "mkv", "flv", "webm", "avi", "mov"};
+}
+
 LivestreamSettingsPage::LivestreamSettingsPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
     setupUI();
@@ -72,21 +78,21 @@ void LivestreamSettingsPage::setupUI() {
     formLayout->addRow(usePartLabel, m_usePartCheck);
 
     m_downloadAsCombo = new QComboBox(this);
-    m_downloadAsCombo->addItems({"MPEG-TS", "MKV"});
+    m_downloadAsCombo->addItems(kDownloadAsChoices);
     m_downloadAsCombo->setToolTip("Preferred container format for downloading the livestream.");
     QLabel *downloadAsLabel = new QLabel("Download As:", this);
     downloadAsLabel->setToolTip(m_downloadAsCombo->toolTip());
     formLayout->addRow(downloadAsLabel, m_downloadAsCombo);
 
     m_qualityCombo = new QComboBox(this);
-    m_qualityCombo->addItems({"best", "1080p", "720p", "480p", "360p", "worst"});
+    m_qualityCombo->addItems(kLivestreamQualityChoices);
     m_qualityCombo->setToolTip("Target resolution for the livestream.");
     QLabel *qualityLabel = new QLabel("Quality:", this);
     qualityLabel->setToolTip(m_qualityCombo->toolTip());
     formLayout->addRow(qualityLabel, m_qualityCombo);
 
     m_convertToCombo = new QComboBox(this);
-    m_convertToCombo->addItems({"None", "mp4", "mkv", "flv", "webm", "avi", "mov"});
+    m_convertToCombo->addItems(kConvertToChoices);
     m_convertToCombo->setToolTip("Automatically convert the livestream to this format using FFmpeg after the download finishes.");
     QLabel *convertToLabel = new QLabel("Convert To:", this);
     convertToLabel->setToolTip(m_convertToCombo->toolTip());
@@ -97,11 +103,7 @@ void LivestreamSettingsPage::setupUI() {
 
     // Connect signals for auto-saving
     connect(m_liveFromStartCheck, &ToggleSwitch::toggled, this, &LivestreamSettingsPage::saveSettings);
-    connect(m_waitForVideoCheck, &ToggleSwitch::toggled, this, [this](bool checked) {
-        m_waitMinSpin->setEnabled(checked);
-        m_waitMaxSpin->setEnabled(checked);
-        saveSettings();
-    });
+    connect(m_waitForVideoCheck, &ToggleSwitch::toggled, this, &LivestreamSettingsPage::onWaitForVideoToggled);
     connect(m_waitMinSpin, QOverload<int>::of(&QSpinBox::valueChanged), this, &LivestreamSettingsPage::saveSettings);
     connect(m_waitMaxSpin, QOverload<int>::of(&QSpinBox::valueChanged), this, &LivestreamSettingsPage::saveSettings);
     connect(m_usePartCheck, &ToggleSwitch::toggled, this, &LivestreamSettingsPage::saveSettings);
@@ -146,6 +148,12 @@ void LivestreamSettingsPage::saveSettings() {
     m_configManager->set("Livestream", "convert_to", m_convertToCombo->currentText());
 }
 
+void LivestreamSettingsPage::onWaitForVideoToggled(bool checked) {
+    m_waitMinSpin->setEnabled(checked);
+    m_waitMaxSpin->setEnabled(checked);
+    saveSettings();
+}
+
 void LivestreamSettingsPage::handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value) {
     if (section == "Livestream") {
         QSignalBlocker b1(m_liveFromStartCheck);
@@ -20,6 +20,7 @@ public slots:
 
 private slots:
     void saveSettings();
+    void onWaitForVideoToggled(bool checked);
     void handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value);
 
 private:
@@ -8,6 +8,10 @@
 #include <QLabel>
 #include <QSignalBlocker>
 
+namespace {
+const QStringList kConvertThumbnailChoices = {"None", "jpg", "png"};
+}
+
 MetadataPage::MetadataPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
     QVBoxLayout *layout = new QVBoxLayout(this);
@@ -30,7 +34,7 @@ MetadataPage::MetadataPage(ConfigManager *configManager, QWidget *parent)
     m_forcePlaylistAsAlbumSwitch = new ToggleSwitch(this);
     m_convertThumbnailsCombo = new QComboBox(this);
     m_convertThumbnailsCombo->setToolTip("Convert the downloaded thumbnail to a specific image format.");
-    m_convertThumbnailsCombo->addItems({"None", "jpg", "png"});
+    m_convertThumbnailsCombo->addItems(kConvertThumbnailChoices);
 
     m_forcePlaylistAsAlbumSwitch->setToolTip("When enabled for audio playlist downloads, this forces the 'album' metadata tag\n"
                                              "to be the playlist's title and sets the 'album_artist' tag to 'Various Artists'.\n\n"
@@ -72,13 +76,14 @@ void MetadataPage::loadSettings() {
     QSignalBlocker b6(m_generateFolderJpgCheck);
     QSignalBlocker b7(m_forcePlaylistAsAlbumSwitch);
 
-    m_embedMetadataCheck->setChecked(m_configManager->get("Metadata", "embed_metadata", true).toBool());
-    m_embedThumbnailCheck->setChecked(m_configManager->get("Metadata", "embed_thumbnail", true).toBool());
-    m_highQualityThumbnailCheck->setChecked(m_configManager->get("Metadata", "high_quality_thumbnail", true).toBool());
-    m_cropThumbnailCheck->setChecked(m_configManager->get("Metadata", "crop_artwork_to_square", true).toBool());
-    m_generateFolderJpgCheck->setChecked(m_configManager->get("Metadata", "generate_folder_jpg", false).toBool());
-    m_forcePlaylistAsAlbumSwitch->setChecked(m_configManager->get("Metadata", "force_playlist_as_album", false).toBool());
-    m_convertThumbnailsCombo->setCurrentText(m_configManager->get("Metadata", "convert_thumbnail_to", "jpg").toString());
+    const QVariantMap metadata = m_configManager->getSection("Metadata");
+    m_embedMetadataCheck->setChecked(metadata.value("embed_metadata", true).toBool());
+    m_embedThumbnailCheck->setChecked(metadata.value("embed_thumbnail", true).toBool());
+    m_highQualityThumbnailCheck->setChecked(metadata.value("high_quality_thumbnail", true).toBool());
+    m_cropThumbnailCheck->setChecked(metadata.value("crop_artwork_to_square", true).toBool());
+    m_generateFolderJpgCheck->setChecked(metadata.value("generate_folder_jpg", false).toBool());
+    m_forcePlaylistAsAlbumSwitch->setChecked(metadata.value("force_playlist_as_album", false).toBool());
+    m_convertThumbnailsCombo->setCurrentText(metadata.value("convert_thumbnail_to", "jpg").toString());
 }
 void MetadataPage::onEmbedMetadataToggled(bool c) { m_configManager->set("Metadata", "embed_metadata", c); }
 void MetadataPage::onEmbedThumbnailToggled(bool c) { m_configManager->set("Metadata", "embed_thumbnail", c); }
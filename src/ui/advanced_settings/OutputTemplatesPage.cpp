@@ -11,22 +11,42 @@
 #include <QMessageBox>
 #include <QProcess>
 #include <QSignalBlocker>
+#include <QTimer>
 #include "core/ProcessUtils.h"
 
+namespace {
+// Token lists are fixed, so keep one shared copy for the combos and the
+// insert handlers instead of rebuilding them per page.
+const QStringList kYtDlpTemplateTokens = {
+    "%(title)s", "%(uploader)s", "%(upload_date>%Y-%m-%d)s", "%(id)s", "%(ext)s",
+    "%(playlist_index)s", "%(playlist_title)s", "%(channel)s", "%(channel_id)s",
+    "%(duration)s", "%(view_count)s", "%(like_count)s", "%(comment_count)s",
+    "%(age_limit)s", "%(genre)s", "%(format_id)s", "%(format)s", "%(format_note)s",
+    "%(resolution)s", "%(width)s", "%(height)s", "%(fps)s", "%(vcodec)s", "%(acodec)s",
+    "%(abr)s", "%(vbr)s", "%(tbr)s", "%(filesize)s", "%(epoch)s", "%(autonumber)s"
+};
+
+const QStringList kGalleryDlTemplateTokens = {
+    "{category}", "{subcategory}", "{id}", "{filename}", "{extension}",
+    "{title}", "{description}", "{date}", "{date:%Y-%m-%d}",
+    "{user[username]}", "{user[name]}", "{user[id]}",
+    "{author[name]}", "{author[url]}", "{author[id]}",
+    "{url}", "{shortcode}", "{num}", "{count}",
+    "{width}", "{height}", "{size}", "{width}x{height}",
+    "{post[title]}", "{post[id]}", "{post[num]}", "{post[count]}",
+    "{media[num]}", "{media[count]}",
+    "{category}/{id}_{filename}.{extension}"
+};
+
+// yt-dlp only parses the template here, so an answer should come quickly.
+constexpr int kTemplateCheckTimeoutMs = 2000;
+}
+
 OutputTemplatesPage::OutputTemplatesPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
     QVBoxLayout *layout = new QVBoxLayout(this);
     layout->setContentsMargins(0, 0, 0, 0);
 
-    QStringList ytDlpTokens = {
-        "%(title)s", "%(uploader)s", "%(upload_date>%Y-%m-%d)s", "%(id)s", "%(ext)s",
-        "%(playlist_index)s", "%(playlist_title)s", "%(channel)s", "%(channel_id)s",
-        "%(duration)s", "%(view_count)s", "%(like_count)s", "%(comment_count)s",
-        "%(age_limit)s", "%(genre)s", "%(format_id)s", "%(format)s", "%(format_note)s",
-        "%(resolution)s", "%(width)s", "%(height)s", "%(fps)s", "%(vcodec)s", "%(acodec)s",
-        "%(abr)s", "%(vbr)s", "%(tbr)s", "%(filesize)s", "%(epoch)s", "%(autonumber)s"
-    };
-
     QGroupBox *ytDlpGroup = new QGroupBox("yt-dlp Filename Templates", this);
     ytDlpGroup->setToolTip("Define custom filename patterns for video and audio downloads using yt-dlp templates.");
     QGridLayout *ytDlpLayout = new QGridLayout(ytDlpGroup);
@@ -42,7 +62,7 @@ OutputTemplatesPage::OutputTemplatesPage(ConfigManager *configManager, QWidget *
     m_videoTemplateTokensCombo->addItem("Insert token...", "");
     m_videoTemplateTokensCombo->setMaximumWidth(180);
     m_videoTemplateTokensCombo->setToolTip("Insert a yt-dlp metadata token into the video template.");
-    m_videoTemplateTokensCombo->addItems(ytDlpTokens);
+    m_videoTemplateTokensCombo->addItems(kYtDlpTemplateTokens);
     ytDlpLayout->addWidget(m_videoTemplateTokensCombo, 0, 2);
     m_saveVideoTemplateButton = new QPushButton("Save", this);
     m_saveVideoTemplateButton->setToolTip("Save and validate the video template.");
@@ -62,7 +82,7 @@ OutputTemplatesPage::OutputTemplatesPage(ConfigManager *configManager, QWidget *
     m_audioTemplateTokensCombo->addItem("Insert token...", "");
     m_audioTemplateTokensCombo->setMaximumWidth(180);
     m_audioTemplateTokensCombo->setToolTip("Insert a yt-dlp metadata token into the audio template.");
-    m_audioTemplateTokensCombo->addItems(ytDlpTokens);
+    m_audioTemplateTokensCombo->addItems(kYtDlpTemplateTokens);
     ytDlpLayout->addWidget(m_audioTemplateTokensCombo, 1, 2);
     m_saveAudioTemplateButton = new QPushButton("Save", this);
     m_saveAudioTemplateButton->setToolTip("Save and validate the audio template.");
@@ -86,17 +106,7 @@ OutputTemplatesPage::OutputTemplatesPage(ConfigManager *configManager, QWidget *
     m_galleryDlTemplateTokensCombo->addItem("Insert token...", "");
     m_galleryDlTemplateTokensCombo->setMaximumWidth(180);
     m_galleryDlTemplateTokensCombo->setToolTip("Insert a gallery-dl metadata token into the gallery template.");
-    m_galleryDlTemplateTokensCombo->addItems({
-        "{category}", "{subcategory}", "{id}", "{filename}", "{extension}",
-        "{title}", "{description}", "{date}", "{date:%Y-%m-%d}",
-        "{user[username]}", "{user[name]}", "{user[id]}",
-        "{author[name]}", "{author[url]}", "{author[id]}",
-        "{url}", "{shortcode}", "{num}", "{count}",
-        "{width}", "{height}", "{size}", "{width}x{height}",
-        "{post[title]}", "{post[id]}", "{post[num]}", "{post[count]}",
-        "{media[num]}", "{media[count]}",
-        "{category}/{id}_{filename}.{extension}"
-    });
+    m_galleryDlTemplateTokensCombo->addItems(kGalleryDlTemplateTokens);
     galleryDlControlsLayout->addWidget(m_galleryDlTemplateTokensCombo, 0); // No stretch
     m_saveGalleryDlTemplateButton = new QPushButton("Save", this);
     m_saveGalleryDlTemplateButton->setToolTip("Save the gallery template.");
@@ -136,55 +146,62 @@ void OutputTemplatesPage::loadSettings() {
     QSignalBlocker b2(m_audioOutputTemplateInput);
     QSignalBlocker b3(m_galleryDlOutputTemplateInput);
 
-    QString videoTpl = m_configManager->get("General", "output_template_video").toString();
-    if (videoTpl.isEmpty()) videoTpl = m_configManager->get("General", "output_template").toString();
+    const QVariantMap general = m_configManager->getSection("General");
+    QString videoTpl = general.value("output_template_video").toString();
+    if (videoTpl.isEmpty()) videoTpl = general.value("output_template").toString();
     m_videoOutputTemplateInput->setText(videoTpl);
 
-    QString audioTpl = m_configManager->get("General", "output_template_audio").toString();
-    if (audioTpl.isEmpty()) audioTpl = m_configManager->get("General", "output_template").toString();
+    QString audioTpl = general.value("output_template_audio").toString();
+    if (audioTpl.isEmpty()) audioTpl = general.value("output_template").toString();
     m_audioOutputTemplateInput->setText(audioTpl);
 
-    m_galleryDlOutputTemplateInput->setText(m_configManager->get("General", "gallery_output_template").toString());
+    m_galleryDlOutputTemplateInput->setText(general.value("gallery_output_template").toString());
 }
 
 void OutputTemplatesPage::validateAndSaveVideoTemplate() {
     QString templateStr = m_videoOutputTemplateInput->text();
     if (templateStr.isEmpty()) { QMessageBox::warning(this, "Invalid Template", "Template cannot be empty."); return; }
-
-    QProcess process;
-    ProcessUtils::setProcessEnvironment(process);
-    process.start(ProcessUtils::findBinary("yt-dlp", m_configManager).path, QStringList() << "-o" << templateStr << "dummy:");
-    if (!process.waitForFinished(2000)) {
-        ProcessUtils::terminateProcessTree(&process);
-    }
-    QString err = process.readAllStandardError();
-    if (err.contains("error:", Qt::CaseInsensitive) && (err.contains("template", Qt::CaseInsensitive) || err.contains("missing", Qt::CaseInsensitive))) {
-        QMessageBox::warning(this, "Invalid Template", "yt-dlp rejected the template:\n" + err.trimmed());
-        return;
-    }
-
-    m_configManager->set("General", "output_template_video", templateStr);
-    QMessageBox::information(this, "Saved", "Video output filename pattern saved.");
+    validateAndSaveYtDlpTemplate(templateStr, "output_template_video", "Video output filename pattern saved.", m_saveVideoTemplateButton);
 }
 
 void OutputTemplatesPage::validateAndSaveAudioTemplate() {
     QString templateStr = m_audioOutputTemplateInput->text();
     if (templateStr.isEmpty()) { QMessageBox::warning(this, "Invalid Template", "Template cannot be empty."); return; }
+    validateAndSaveYtDlpTemplate(templateStr, "output_template_audio", "Audio output filename pattern saved.", m_saveAudioTemplateButton);
+}
+
+void OutputTemplatesPage::validateAndSaveYtDlpTemplate(const QString &templateStr, const QString &key, const QString &savedMessage, QPushButton *saveButton) {
+    // Let yt-dlp parse the template without blocking the event loop; the save
+    // button stays disabled until it answers.
+    saveButton->setEnabled(false);
+    QProcess *process = new QProcess(this);
+    ProcessUtils::setProcessEnvironment(*process);
+
+    auto finish = [this, process, templateStr, key, savedMessage, saveButton]() {
+        saveButton->setEnabled(true);
+        const QString err = process->readAllStandardError();
+        process->deleteLater();
+        if (err.contains("error:", Qt::CaseInsensitive) && (err.contains("template", Qt::CaseInsensitive) || err.contains("missing", Qt::CaseInsensitive))) {
+            QMessageBox::warning(this, "Invalid Template", "yt-dlp rejected the template:\n" + err.trimmed());
+            return;
+        }
+        m_configManager->set("General", key, templateStr);
+        QMessageBox::information(this, "Saved", savedMessage);
+    };
+    connect(process, &QProcess::finished, this, finish);
+    // A process that never starts emits errorOccurred but not finished().
+    connect(process, &QProcess::errorOccurred, this, [finish](QProcess::ProcessError error) {
+        if (error == QProcess::FailedToStart) {
+            finish();
+        }
+    });
+    QTimer::singleShot(kTemplateCheckTimeoutMs, process, [process]() {
+        if (process->state() != QProcess::NotRunning) {
+            ProcessUtils::terminateProcessTree(process);
+        }
+    });
 
-    QProcess process;
-    ProcessUtils::setProcessEnvironment(process);
-    process.start(ProcessUtils::findBinary("yt-dlp", m_configManager).path, QStringList() << "-o" << templateStr << "dummy:");
-    if (!process.waitForFinished(2000)) {
-        ProcessUtils::terminateProcessTree(&process);
-    }
-    QString err = process.readAllStandardError();
-    if (err.contains("error:", Qt::CaseInsensitive) && (err.contains("template", Qt::CaseInsensitive) || err.contains("missing", Qt::CaseInsensitive))) {
-        QMessageBox::warning(this, "Invalid Template", "yt-dlp rejected the template:\n" + err.trimmed());
-        return;
-    }
-
-    m_configManager->set("General", "output_template_audio", templateStr);
-    QMessageBox::information(this, "Saved", "Audio output filename pattern saved.");
+    process->start(ProcessUtils::findBinary("yt-dlp", m_configManager).path, QStringList() << "-o" << templateStr << "dummy:");
 }
 
 void OutputTemplatesPage::validateAndSaveGalleryDlTemplate() {
@@ -194,9 +211,9 @@ void OutputTemplatesPage::validateAndSaveGalleryDlTemplate() {
     QMessageBox::information(this, "Saved", "Output filename pattern saved.");
 }
 
-void OutputTemplatesPage::insertVideoTemplateToken(int index) { if (index > 0) m_videoOutputTemplateInput->insert(m_videoTemplateTokensCombo->itemText(index)); m_videoTemplateTokensCombo->setCurrentIndex(0); }
-void OutputTemplatesPage::insertAudioTemplateToken(int index) { if (index > 0) m_audioOutputTemplateInput->insert(m_audioTemplateTokensCombo->itemText(index)); m_audioTemplateTokensCombo->setCurrentIndex(0); }
-void OutputTemplatesPage::insertGalleryDlTemplateToken(int index) { if (index > 0) m_galleryDlOutputTemplateInput->insert(m_galleryDlTemplateTokensCombo->itemText(index)); m_galleryDlTemplateTokensCombo->setCurrentIndex(0); }
+void OutputTemplatesPage::insertVideoTemplateToken(int index) { if (index > 0) m_videoOutputTemplateInput->insert(kYtDlpTemplateTokens.at(index - 1)); m_videoTemplateTokensCombo->setCurrentIndex(0); }
+void OutputTemplatesPage::insertAudioTemplateToken(int index) { if (index > 0) m_audioOutputTemplateInput->insert(kYtDlpTemplateTokens.at(index - 1)); m_audioTemplateTokensCombo->setCurrentIndex(0); }
+void OutputTemplatesPage::insertGalleryDlTemplateToken(int index) { if (index > 0) m_galleryDlOutputTemplateInput->insert(kGalleryDlTemplateTokens.at(index - 1)); m_galleryDlTemplateTokensCombo->setCurrentIndex(0); }
 void OutputTemplatesPage::handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value) {
     if (section == "General" && key == "output_template_video") m_videoOutputTemplateInput->setText(value.toString());
     else if (section == "General" && key == "output_template_audio") m_audioOutputTemplateInput->setText(value.toString());
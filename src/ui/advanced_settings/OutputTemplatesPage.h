@@ -22,6 +22,8 @@ private slots:
     void insertGalleryDlTemplateToken(int index);
     void handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value);
 private:
+    void validateAndSaveYtDlpTemplate(const QString &templateStr, const QString &key, const QString &savedMessage, QPushButton *saveButton);
+
     ConfigManager *m_configManager;
     QLineEdit *m_videoOutputTemplateInput;
     QComboBox *m_videoTemplateTokensCombo;
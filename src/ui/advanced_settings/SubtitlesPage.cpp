@@ -10,11 +10,96 @@
 #include <QLabel>
 #include <QPushButton>
 #include <QDialog>
-#include <QListWidget>
+#include <QListView>
+#include <QStandardItemModel>
 #include <QDialogButtonBox>
-#include <QMap>
 #include <QSignalBlocker>
-#include <algorithm>
+#include <QHash>
+#include <QSet>
+#include <iterator>
+
+namespace {
+const QStringList kSubtitleFormats = {"srt", "vtt", "ass"};
+
+// Format -> combo row, built once so syncing the saved format is a hash lookup
+// instead of a findText() scan over the combo model.
+int subtitleFormatIndex(const QString &format) {
+    static const QHash<QString, int> index = [] {
+        QHash<QString, int> map;
+        for (int i = 0; i < kSubtitleFormats.size(); ++i) {
+            map.insert(kSubtitleFormats.at(i), i);
+        }
+        return map;
+    }();
+    return index.value(format, -1);
+}
+
+struct SubtitleLanguage {
+    const char *code;
+    const char *name;
+};
+
+// Picker rows in display order: the special selectors first, then languages
+// sorted by name.
+constexpr SubtitleLanguage kSubtitleLanguages[] = {
+    {"runtime", "Select at Runtime"},
+    {"all", "All available"},
+    {"auto", "Auto-generated"},
+    {"live_chat", "Live Chat"},
+    {"ar", "Arabic"},
+    {"bn", "Bengali"},
+    {"zh-Hans", "Chinese (Simplified)"},
+    {"zh-Hant", "Chinese (Traditional)"},
+    {"cs", "Czech"},
+    {"da", "Danish"},
+    {"nl", "Dutch"},
+    {"en", "English"},
+    {"fi", "Finnish"},
+    {"fr", "French"},
+    {"de", "German"},
+    {"el", "Greek"},
+    {"hi", "Hindi"},
+    {"hu", "Hungarian"},
+    {"id", "Indonesian"},
+    {"it", "Italian"},
+    {"ja", "Japanese"},
+    {"ko", "Korean"},
+    {"no", "Norwegian"},
+    {"pl", "Polish"},
+    {"pt", "Portuguese"},
+    {"pa", "Punjabi"},
+    {"ro", "Romanian"},
+    {"ru", "Russian"},
+    {"es", "Spanish"},
+    {"sv", "Swedish"},
+    {"th", "Thai"},
+    {"tr", "Turkish"},
+    {"uk", "Ukrainian"},
+    {"vi", "Vietnamese"},
+};
+
+struct SubtitleLanguageChoices {
+    QStringList codes;
+    QStringList labels;
+};
+
+// The picker's rows never change, so build them the first time the dialog is
+// opened and reuse them for every later open.
+const SubtitleLanguageChoices &subtitleLanguageChoices() {
+    static const SubtitleLanguageChoices choices = [] {
+        SubtitleLanguageChoices result;
+        result.codes.reserve(std::size(kSubtitleLanguages));
+        result.labels.reserve(std::size(kSubtitleLanguages));
+        for (const SubtitleLanguage &language : kSubtitleLanguages) {
+            const QString code = QLatin1String(language.code);
+            result.codes.append(code);
+            result.labels.append(QString("%1 (%2)").arg(QLatin1String(language.name), code));
+        }
+        return result;
+    }();
+    return choices;
+}
+}
 
 SubtitlesPage::SubtitlesPage(ConfigManager *configManager, QWidget *parent)
     : QWidget(parent), m_configManager(configManager) {
@@ -42,7 +127,9 @@ SubtitlesPage::SubtitlesPage(ConfigManager *configManager, QWidget *parent)
     m_includeAutoSubtitlesCheck->setToolTip("Include auto-generated subtitles (e.g., YouTube's auto-captions) if manual ones aren't available.");
     m_subtitleFormatCombo = new QComboBox(this);
     m_subtitleFormatCombo->setToolTip("Select the preferred format for downloaded subtitle files.");
-    m_subtitleFormatCombo->addItems({"srt", "vtt", "ass"});
+    m_subtitleFormatCombo->addItems(kSubtitleFormats);
+    m_subtitleFormatCombo->setMinimumContentsLength(6);
+    m_subtitleFormatCombo->setSizeAdjustPolicy(QComboBox::AdjustToMinimumContentsLengthWithIcon);
 
     auto addFormRow = [&](const QString& labelText, QWidget* field) {
         QLabel* label = new QLabel(labelText, this);
@@ -77,11 +164,15 @@ void SubtitlesPage::loadSettings() {
     QSignalBlocker b5(m_includeAutoSubtitlesCheck);
     QSignalBlocker b6(m_subtitleFormatCombo);
 
-    m_subtitleLanguagesDisplay->setText(m_configManager->get("Subtitles", "languages", "en").toString());
-    m_embedSubtitlesCheck->setChecked(m_configManager->get("Subtitles", "embed_subtitles", true).toBool());
-    m_writeSubtitlesCheck->setChecked(m_configManager->get("Subtitles", "write_subtitles", false).toBool());
-    m_includeAutoSubtitlesCheck->setChecked(m_configManager->get("Subtitles", "write_auto_subtitles", true).toBool());
-    m_subtitleFormatCombo->setCurrentText(m_configManager->get("Subtitles", "format", "srt").toString());
+    const QVariantMap subtitles = m_configManager->getSection("Subtitles");
+    m_subtitleLanguagesDisplay->setText(subtitles.value("languages", "en").toString());
+    m_embedSubtitlesCheck->setChecked(subtitles.value("embed_subtitles", true).toBool());
+    m_writeSubtitlesCheck->setChecked(subtitles.value("write_subtitles", false).toBool());
+    m_includeAutoSubtitlesCheck->setChecked(subtitles.value("write_auto_subtitles", true).toBool());
+    const int formatRow = subtitleFormatIndex(subtitles.value("format", "srt").toString());
+    if (formatRow >= 0) {
+        m_subtitleFormatCombo->setCurrentIndex(formatRow);
+    }
     updateSubtitleFormatAvailability(m_embedSubtitlesCheck->isChecked());
 }
 
@@ -92,40 +183,31 @@ void SubtitlesPage::onSelectLanguagesClicked()
     dialog.setMinimumWidth(400);
     QVBoxLayout *layout = new QVBoxLayout(&dialog);
 
-    QListWidget *listWidget = new QListWidget(&dialog);
-    layout->addWidget(listWidget);
-
-    QMap<QString, QString> langMap;
-    langMap["runtime"] = "Select at Runtime";
-    langMap["all"] = "All available";
-    langMap["auto"] = "Auto-generated";
-    langMap["live_chat"] = "Live Chat";
-    langMap["en"] = "English"; langMap["es"] = "Spanish"; langMap["fr"] = "French"; langMap["de"] = "German";
-    langMap["it"] = "Italian"; langMap["pt"] = "Portuguese"; langMap["ru"] = "Russian"; langMap["ja"] = "Japanese";
-    langMap["ko"] = "Korean"; langMap["zh-Hans"] = "Chinese (Simplified)"; langMap["zh-Hant"] = "Chinese (Traditional)";
-    langMap["ar"] = "Arabic"; langMap["hi"] = "Hindi"; langMap["bn"] = "Bengali"; langMap["pa"] = "Punjabi";
-    langMap["tr"] = "Turkish"; langMap["vi"] = "Vietnamese"; langMap["id"] = "Indonesian"; langMap["nl"] = "Dutch";
-    langMap["pl"] = "Polish"; langMap["sv"] = "Swedish"; langMap["fi"] = "Finnish"; langMap["no"] = "Norwegian";
-    langMap["da"] = "Danish"; langMap["el"] = "Greek"; langMap["cs"] = "Czech"; langMap["hu"] = "Hungarian";
-    langMap["ro"] = "Romanian"; langMap["uk"] = "Ukrainian"; langMap["th"] = "Thai";
-
-    QStringList keys = langMap.keys();
-    std::sort(keys.begin(), keys.end(), [&langMap](const QString &a, const QString &b){
-        if (a == "runtime") return true; if (b == "runtime") return false;
-        if (a == "all") return true; if (b == "all") return false;
-        if (a == "auto") return true; if (b == "auto") return false;
-        if (a == "live_chat") return true; if (b == "live_chat") return false;
-        return langMap[a] < langMap[b];
-    });
-
-    QStringList selectedLangs = m_subtitleLanguagesDisplay->text().split(',', Qt::SkipEmptyParts);
-
-    for (const QString& code : keys) {
-        QListWidgetItem *item = new QListWidgetItem(QString("%1 (%2)").arg(langMap[code], code), listWidget);
-        item->setData(Qt::UserRole, code);
-        item->setFlags(item->flags() | Qt::ItemIsUserCheckable);
+    QListView *listView = new QListView(&dialog);
+    listView->setUniformItemSizes(true);
+    layout->addWidget(listView);
+
+    const QStringList selectedList = m_subtitleLanguagesDisplay->text().split(',', Qt::SkipEmptyParts);
+    const QSet<QString> selectedLangs(selectedList.cbegin(), selectedList.cend());
+
+    const SubtitleLanguageChoices &choices = subtitleLanguageChoices();
+
+    // Fully prepare every row before it joins the model so the whole list is
+    // inserted with a single rowsInserted notification.
+    QList<QStandardItem *> items;
+    items.reserve(choices.codes.size());
+    for (int i = 0; i < choices.codes.size(); ++i) {
+        const QString &code = choices.codes.at(i);
+        QStandardItem *item = new QStandardItem(choices.labels.at(i));
+        item->setData(code, Qt::UserRole);
+        item->setEditable(false);
+        item->setCheckable(true);
         item->setCheckState(selectedLangs.contains(code) ? Qt::Checked : Qt::Unchecked);
+        items.append(item);
     }
+    QStandardItemModel *model = new QStandardItemModel(&dialog);
+    model->appendColumn(items);
+    listView->setModel(model);
 
     QDialogButtonBox *buttonBox = new QDialogButtonBox(QDialogButtonBox::Ok | QDialogButtonBox::Cancel, &dialog);
     layout->addWidget(buttonBox);
@@ -135,8 +217,8 @@ void SubtitlesPage::onSelectLanguagesClicked()
 
     if (dialog.exec() == QDialog::Accepted) {
         QStringList newSelectedLangs;
-        for (int i = 0; i < listWidget->count(); ++i) {
-            QListWidgetItem *item = listWidget->item(i);
+        for (int i = 0; i < model->rowCount(); ++i) {
+            QStandardItem *item = model->item(i);
             if (item->checkState() == Qt::Checked) {
                 newSelectedLangs.append(item->data(Qt::UserRole).toString());
             }
@@ -157,17 +239,25 @@ void SubtitlesPage::handleConfigSettingChanged(const QString &section, const QSt
         return;
     }
 
+    // Mirror external changes without re-emitting them back into ConfigManager.
     if (key == "languages") {
         m_subtitleLanguagesDisplay->setText(value.toString());
     } else if (key == "embed_subtitles") {
         const bool checked = value.toBool();
+        QSignalBlocker b(m_embedSubtitlesCheck);
         m_embedSubtitlesCheck->setChecked(checked);
         updateSubtitleFormatAvailability(checked);
     } else if (key == "write_subtitles") {
+        QSignalBlocker b(m_writeSubtitlesCheck);
         m_writeSubtitlesCheck->setChecked(value.toBool());
     } else if (key == "write_auto_subtitles") {
+        QSignalBlocker b(m_includeAutoSubtitlesCheck);
         m_includeAutoSubtitlesCheck->setChecked(value.toBool());
     } else if (key == "format") {
-        m_subtitleFormatCombo->setCurrentText(value.toString());
+        const int formatRow = subtitleFormatIndex(value.toString());
+        if (formatRow >= 0) {
+            QSignalBlocker b(m_subtitleFormatCombo);
+            m_subtitleFormatCombo->setCurrentIndex(formatRow);
+        }
     }
 }
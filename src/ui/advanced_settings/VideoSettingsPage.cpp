@@ -6,8 +6,12 @@
 #include <QLabel>
 #include <QComboBox>
 #include <QSignalBlocker>
+#include <QStringListModel>
 
 namespace {
+const QStringList kVideoQualityChoices = {"Select at Runtime", "best", "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p", "worst"};
+const QStringList kVideoCodecChoices = {"Default", "H.264 (AVC)", "H.265 (HEVC)", "VP9", "AV1", "ProRes (Archive)", "Theora"};
+
 QString canonicalVideoCodecValue(QString codec)
 {
     codec = codec.trimmed();
@@ -19,6 +23,37 @@ QString canonicalVideoCodecValue(QString codec)
     }
     return codec;
 }
+
+// Container and audio codec choices per video codec. Kept as shared constants
+// so a rebuild hands the combo's model an implicitly shared list instead of
+// new strings.
+const QStringList &videoExtensionsForCodec(const QString &codec) {
+    static const QStringList kAll = {"mp4", "mkv", "webm"};
+    static const QStringList kWeb = {"webm", "mkv"};
+    static const QStringList kMpeg = {"mp4", "mkv"};
+    static const QStringList kProRes = {"mov"};
+    static const QStringList kTheora = {"ogv"};
+
+    if (codec == "AV1" || codec == "VP9") return kWeb;
+    if (codec == "H.264 (AVC)" || codec == "H.265 (HEVC)") return kMpeg;
+    if (codec == "ProRes (Archive)") return kProRes;
+    if (codec == "Theora") return kTheora;
+    return kAll;
+}
+
+const QStringList &videoAudioCodecsForCodec(const QString &codec) {
+    static const QStringList kAll = {"Default", "AAC", "Opus", "Vorbis", "MP3", "FLAC", "PCM"};
+    static const QStringList kWeb = {"Default", "Opus", "Vorbis", "AAC"};
+    static const QStringList kMpeg = {"Default", "AAC", "MP3", "FLAC", "PCM"};
+    static const QStringList kProRes = {"Default", "PCM", "AAC"};
+    static const QStringList kTheora = {"Default", "Vorbis"};
+
+    if (codec == "AV1" || codec == "VP9") return kWeb;
+    if (codec == "H.264 (AVC)" || codec == "H.265 (HEVC)") return kMpeg;
+    if (codec == "ProRes (Archive)") return kProRes;
+    if (codec == "Theora") return kTheora;
+    return kAll;
+}
 }
 
 VideoSettingsPage::VideoSettingsPage(ConfigManager *configManager, QWidget *parent)
@@ -32,7 +67,7 @@ VideoSettingsPage::VideoSettingsPage(ConfigManager *configManager, QWidget *pare
 
     m_videoQualityCombo = new QComboBox(this);
     m_videoQualityCombo->setToolTip("Pick the default picture quality for video downloads. Choose 'Select at Runtime' to hide the rest of these defaults and pick exact formats when you queue a download.");
-    m_videoQualityCombo->addItems({"Select at Runtime", "best", "2160p", "1440p", "1080p", "720p", "480p", "360p", "240p", "144p", "worst"});
+    m_videoQualityCombo->addItems(kVideoQualityChoices);
     QLabel *qualityLabel = new QLabel("Quality:", this);
     qualityLabel->setToolTip(m_videoQualityCombo->toolTip());
     videoLayout->addRow(qualityLabel, m_videoQualityCombo);
@@ -41,21 +76,23 @@ VideoSettingsPage::VideoSettingsPage(ConfigManager *configManager, QWidget *pare
     m_videoCodecLabel->setToolTip("Choose the default video codec used when runtime selection is off.");
     m_videoCodecCombo = new QComboBox(this);
     m_videoCodecCombo->setToolTip("Choose the video format (codec). This affects file size and compatibility. H.264 is common, H.265 is newer and smaller, AV1/VP9 are often used for web videos.");
-    m_videoCodecCombo->addItems({"Default", "H.264 (AVC)", "H.265 (HEVC)", "VP9", "AV1", "ProRes (Archive)", "Theora"});
+    m_videoCodecCombo->addItems(kVideoCodecChoices);
     videoLayout->addRow(m_videoCodecLabel, m_videoCodecCombo);
 
     m_videoExtLabel = new QLabel("Extension:", this);
     m_videoExtLabel->setToolTip("Select the file type for your video... changes automatically based on codec.");
     m_videoExtCombo = new QComboBox(this);
     m_videoExtCombo->setToolTip("Select the file type for your video... changes automatically based on codec.");
-    m_videoExtCombo->addItems({"mp4", "mkv", "webm"});
+    m_videoExtModel = new QStringListModel(videoExtensionsForCodec(QString()), m_videoExtCombo);
+    m_videoExtCombo->setModel(m_videoExtModel);
     videoLayout->addRow(m_videoExtLabel, m_videoExtCombo);
 
     m_videoAudioCodecLabel = new QLabel("Audio Codec:", this);
     m_videoAudioCodecLabel->setToolTip("Choose the default audio codec used inside video downloads when runtime selection is off.");
     m_videoAudioCodecCombo = new QComboBox(this);
     m_videoAudioCodecCombo->setToolTip("Choose the audio format (codec) that will be included in your video file.");
-    m_videoAudioCodecCombo->addItems({"Default", "AAC", "Opus", "Vorbis", "MP3", "FLAC", "PCM"});
+    m_videoAudioCodecModel = new QStringListModel(videoAudioCodecsForCodec(QString()), m_videoAudioCodecCombo);
+    m_videoAudioCodecCombo->setModel(m_videoAudioCodecModel);
     videoLayout->addRow(m_videoAudioCodecLabel, m_videoAudioCodecCombo);
 
     m_runtimeHintLabel = new QLabel("Runtime selection mode is enabled. Quality, codec, extension, and stream choices will be picked from the available formats when you queue a download.", this);
@@ -92,13 +129,14 @@ void VideoSettingsPage::onVideoExtChanged(const QString &text) { m_configManager
 void VideoSettingsPage::onVideoAudioCodecChanged(const QString &text) { m_configManager->set("Video", "video_audio_codec", text); }
 
 void VideoSettingsPage::handleConfigSettingChanged(const QString &section, const QString &key, const QVariant &value) {
+    // Changes made on this page arrive here too, when setCurrentText() is a
+    // no-op. For outside changes the combo's own change handler rebuilds the
+    // dependent combos, so this handler does not rebuild them a second time.
     if (section == "Video") {
         if (key == "quality" || key == "video_quality") {
             m_videoQualityCombo->setCurrentText(value.toString());
-            updateVideoOptions();
         } else if (key == "codec" || key == "video_codec") {
             m_videoCodecCombo->setCurrentText(canonicalVideoCodecValue(value.toString()));
-            updateVideoOptions();
         } else if (key == "extension" || key == "video_extension") {
             m_videoExtCombo->setCurrentText(value.toString());
         } else if (key == "audio_codec" || key == "video_audio_codec") {
@@ -131,27 +169,22 @@ void VideoSettingsPage::updateVideoOptions() {
     m_videoExtCombo->setVisible(!isDefaultCodec);
     if (isDefaultCodec) return;
 
+    // Rebuild silently: the model resets would otherwise report transient
+    // values (including an empty string) to the change handlers, which persist them.
     QString currentExt = m_videoExtCombo->currentText();
-    m_videoExtCombo->clear();
-    
-    if (selectedVideoCodec == "AV1" || selectedVideoCodec == "VP9") m_videoExtCombo->addItems({"webm", "mkv"});
-    else if (selectedVideoCodec == "H.264 (AVC)" || selectedVideoCodec == "H.265 (HEVC)") m_videoExtCombo->addItems({"mp4", "mkv"});
-    else if (selectedVideoCodec == "ProRes (Archive)") m_videoExtCombo->addItem("mov");
-    else if (selectedVideoCodec == "Theora") m_videoExtCombo->addItem("ogv");
-    else m_videoExtCombo->addItems({"mp4", "mkv", "webm"});
-
-    if (m_videoExtCombo->findText(currentExt) != -1) m_videoExtCombo->setCurrentText(currentExt);
-    else m_videoExtCombo->setCurrentIndex(0);
+    QSignalBlocker extBlocker(m_videoExtCombo);
+    const QStringList &extensions = videoExtensionsForCodec(selectedVideoCodec);
+    m_videoExtModel->setStringList(extensions);
+    // The row is known from the list just installed; no need to scan the model.
+    m_videoExtCombo->setCurrentIndex(qMax(0, extensions.indexOf(currentExt)));
+    extBlocker.unblock();
+    if (!m_videoExtCombo->signalsBlocked() && m_videoExtCombo->currentText() != currentExt) onVideoExtChanged(m_videoExtCombo->currentText());
 
     QString currentAudioCodec = m_videoAudioCodecCombo->currentText();
-    m_videoAudioCodecCombo->clear();
-    
-    if (selectedVideoCodec == "AV1" || selectedVideoCodec == "VP9") m_videoAudioCodecCombo->addItems({"Default", "Opus", "Vorbis", "AAC"});
-    else if (selectedVideoCodec == "H.264 (AVC)" || selectedVideoCodec == "H.265 (HEVC)") m_videoAudioCodecCombo->addItems({"Default", "AAC", "MP3", "FLAC", "PCM"});
-    else if (selectedVideoCodec == "ProRes (Archive)") m_videoAudioCodecCombo->addItems({"Default", "PCM", "AAC"});
-    else if (selectedVideoCodec == "Theora") m_videoAudioCodecCombo->addItems({"Default", "Vorbis"});
-    else m_videoAudioCodecCombo->addItems({"Default", "AAC", "Opus", "Vorbis", "MP3", "FLAC", "PCM"});
-
-    if (m_videoAudioCodecCombo->findText(currentAudioCodec) != -1) m_videoAudioCodecCombo->setCurrentText(currentAudioCodec);
-    else m_videoAudioCodecCombo->setCurrentIndex(0);
+    QSignalBlocker audioCodecBlocker(m_videoAudioCodecCombo);
+    const QStringList &audioCodecs = videoAudioCodecsForCodec(selectedVideoCodec);
+    m_videoAudioCodecModel->setStringList(audioCodecs);
+    m_videoAudioCodecCombo->setCurrentIndex(qMax(0, audioCodecs.indexOf(currentAudioCodec)));
+    audioCodecBlocker.unblock();
+    if (!m_videoAudioCodecCombo->signalsBlocked() && m_videoAudioCodecCombo->currentText() != currentAudioCodec) onVideoAudioCodecChanged(m_videoAudioCodecCombo->currentText());
 }
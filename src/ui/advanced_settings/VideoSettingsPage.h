@@ -6,6 +6,7 @@ class ConfigManager;
 class QComboBox;
 class QLabel;
 class QFormLayout;
+class QStringListModel;
 
 class VideoSettingsPage : public QWidget {
     Q_OBJECT
@@ -28,7 +29,9 @@ private:
     QComboBox *m_videoCodecCombo;
     QLabel *m_videoExtLabel;
     QComboBox *m_videoExtCombo;
+    QStringListModel *m_videoExtModel;
     QLabel *m_videoAudioCodecLabel;
     QComboBox *m_videoAudioCodecCombo;
+    QStringListModel *m_videoAudioCodecModel;
     QLabel *m_runtimeHintLabel;
 };
@@ -3,6 +3,9 @@
 #include <QDir>
 #include <QComboBox>
 #include <QTextEdit>
+#include "core/ProcessUtils.h"
+#include "ui/ToggleSwitch.h"
+#include "utils/StringUtils.h"
 
 StartTabCommandPreviewUpdater::StartTabCommandPreviewUpdater(ConfigManager *configManager, StartTabUiBuilder *uiBuilder,
                                                              YtDlpArgsBuilder *ytDlpArgsBuilder, GalleryDlArgsBuilder *galleryDlArgsBuilder,
@@ -36,7 +39,7 @@ void StartTabCommandPreviewUpdater::updateCommandPreview()
         return;
     }
 
-    QString url = m_uiBuilder->urlInput()->toPlainText().trimmed().split('\n').first();
+    QString url = StringUtils::firstNonEmptyLine(m_uiBuilder->urlInput()->toPlainText());
     if (url.isEmpty()) {
         url = "[URL]";
     }
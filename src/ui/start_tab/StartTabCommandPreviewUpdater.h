@@ -2,16 +2,11 @@
 #define STARTTABCOMMANDPREVIEWUPDATER_H
 
 #include <QObject>
-#include <QTextEdit>
-#include <QComboBox>
-#include <QDir>
 
 #include "core/ConfigManager.h"
 #include "ui/StartTabUiBuilder.h"
 #include "core/YtDlpArgsBuilder.h"
 #include "core/GalleryDlArgsBuilder.h"
-#include "core/ProcessUtils.h" // For resolveExecutablePath
-#include "ui/ToggleSwitch.h" // For ToggleSwitch
 
 class StartTabCommandPreviewUpdater : public QObject
 {
@@ -8,6 +8,8 @@
 #include <QDir>
 #include <QStandardItemModel>
 #include <QTextEdit>
+#include <QPlainTextEdit>
+#include <QFontDatabase>
 #include <QDialog>
 #include <QVBoxLayout>
 #include <QPushButton>
@@ -16,6 +18,29 @@
 #include "ui/ToggleSwitch.h"
 #include "core/ProcessUtils.h"
 #include <QTimer>
+#include <QHash>
+
+namespace {
+constexpr int kFormatsTimeoutMs = 30000;
+
+struct DownloadButtonText {
+    QString label;
+    QString toolTip;
+};
+
+// Download button caption per download type, looked up once per type change
+// instead of walking a string-comparison chain.
+const QHash<QString, DownloadButtonText> &downloadButtonTexts() {
+    static const QString queueToolTip = "Click to add the URL(s) to the download queue.";
+    static const QHash<QString, DownloadButtonText> texts = {
+        {"video", {"Download Video", queueToolTip}},
+        {"audio", {"Download Audio", queueToolTip}},
+        {"gallery", {"Download Gallery", queueToolTip}},
+        {"formats", {"View Video/Audio Formats", "Query yt-dlp to list available video and audio formats without downloading. Not supported for galleries."}},
+    };
+    return texts;
+}
+}
 
 StartTabDownloadActions::StartTabDownloadActions(ConfigManager *configManager, StartTabUiBuilder *uiBuilder,
                                                  YtDlpArgsBuilder *ytDlpArgsBuilder, GalleryDlArgsBuilder *galleryDlArgsBuilder,
@@ -38,8 +63,10 @@ StartTabDownloadActions::StartTabDownloadActions(ConfigManager *configManager, S
         connect(m_uiBuilder->openDownloadsFolderButton(), &QPushButton::clicked, this, &StartTabDownloadActions::openDownloadsFolder);
     }
 
-    connect(m_configManager, &ConfigManager::settingChanged, this, [this](const QString &group, const QString &/*key*/, const QVariant &/*value*/) {
-        if (group == "Binaries" || group == "General") {
+    connect(m_configManager, &ConfigManager::settingChanged, this, [this](const QString &group, const QString &key, const QVariant &/*value*/) {
+        // updateDynamicUI only depends on binary locations and the cookie browser;
+        // frequent General edits such as max_threads must not trigger it.
+        if (group == "Binaries" || (group == "General" && key == "cookies_from_browser")) {
             QTimer::singleShot(0, this, &StartTabDownloadActions::updateDynamicUI);
         }
     });
@@ -57,31 +84,6 @@ void StartTabDownloadActions::onDownloadButtonClicked() {
         qCritical() << "CRITICAL ERROR: m_urlInput is null in onDownloadButtonClicked!";
         return;
     }
-    QString urlStr = m_uiBuilder->urlInput()->toPlainText().trimmed();
-    qDebug() << "m_urlInput accessed. urlStr:" << urlStr;
-
-    if (urlStr.isEmpty()) {
-        QMessageBox::warning(m_parentWidget, "Input Error", "Please enter a valid URL(s).");
-        return;
-    }
-
-    QStringList urls = urlStr.split('\n', Qt::SkipEmptyParts);
-    if (urls.isEmpty()) {
-        QMessageBox::warning(m_parentWidget, "Input Error", "Please enter a valid URL(s).");
-        return;
-    }
-
-    if (!m_uiBuilder->playlistLogicCombo() || !m_uiBuilder->maxConcurrentCombo() || !m_uiBuilder->rateLimitCombo() || !m_uiBuilder->overrideDuplicateCheck()) {
-        qCritical() << "CRITICAL ERROR: One or more UI elements are null in onDownloadButtonClicked!";
-        return;
-    }
-
-    m_configManager->set("General", "playlist_logic", m_uiBuilder->playlistLogicCombo()->currentText());
-    m_configManager->set("General", "max_threads", m_uiBuilder->maxConcurrentCombo()->currentText());
-    m_configManager->set("General", "rate_limit", m_uiBuilder->rateLimitCombo()->currentText());
-    m_configManager->set("General", "override_archive", m_uiBuilder->overrideDuplicateCheck()->isChecked());
-    m_configManager->save();
-
     if (!m_uiBuilder->downloadTypeCombo()) {
         qCritical() << "CRITICAL ERROR: m_downloadTypeCombo is null in onDownloadButtonClicked!";
         return;
@@ -89,23 +91,44 @@ void StartTabDownloadActions::onDownloadButtonClicked() {
     QString type = m_uiBuilder->downloadTypeCombo()->currentData().toString();
     qDebug() << "m_downloadTypeCombo accessed. type:" << type;
 
-    if (type == "formats") {
-        checkFormats(urls.first());
-        return;
-    }
+    // The settings-row controls are written to ConfigManager by StartTab as
+    // they change, so a click does not need to write or sync them again.
 
     QVariantMap options;
     options["type"] = type;
 
-    for (const QString &singleUrl : urls) {
-        QUrl url(singleUrl);
-        if (!url.isValid()) {
-            QMessageBox::warning(m_parentWidget, "Input Error", "The URL entered is invalid: " + singleUrl);
+    // Split, trim, validate and queue in one pass over the editor text.
+    // Invalid entries are collected and reported once so a large paste cannot
+    // open one modal box per bad line.
+    const QString text = m_uiBuilder->urlInput()->toPlainText();
+    bool foundUrl = false;
+    QStringList invalidUrls;
+    for (QStringView line : QStringView(text).split(u'\n')) {
+        line = line.trimmed();
+        if (line.isEmpty()) {
+            continue;
+        }
+        foundUrl = true;
+        const QString singleUrl = line.toString();
+        if (type == "formats") {
+            checkFormats(singleUrl);
+            return;
+        }
+        if (!QUrl(singleUrl).isValid()) {
+            invalidUrls.append(singleUrl);
             continue;
         }
         emit downloadRequested(singleUrl, options);
     }
 
+    if (!foundUrl) {
+        QMessageBox::warning(m_parentWidget, "Input Error", "Please enter a valid URL(s).");
+        return;
+    }
+    if (!invalidUrls.isEmpty()) {
+        QMessageBox::warning(m_parentWidget, "Input Error", "The following URL(s) are invalid:\n" + invalidUrls.join('\n'));
+    }
+
     m_uiBuilder->urlInput()->clear();
     qDebug() << "StartTabDownloadActions::onDownloadButtonClicked finished.";
 }
@@ -116,22 +139,14 @@ void StartTabDownloadActions::onDownloadTypeChanged(int index)
         qCritical() << "CRITICAL ERROR: m_downloadTypeCombo or m_downloadButton is null in onDownloadTypeChanged!";
         return;
     }
-    QString type = m_uiBuilder->downloadTypeCombo()->itemData(index).toString();
-    
-    if (type == "video") {
-        m_uiBuilder->downloadButton()->setText("Download Video");
-        m_uiBuilder->downloadButton()->setToolTip("Click to add the URL(s) to the download queue.");
-    } else if (type == "audio") {
-        m_uiBuilder->downloadButton()->setText("Download Audio");
-        m_uiBuilder->downloadButton()->setToolTip("Click to add the URL(s) to the download queue.");
-    } else if (type == "gallery") {
-        m_uiBuilder->downloadButton()->setText("Download Gallery");
-        m_uiBuilder->downloadButton()->setToolTip("Click to add the URL(s) to the download queue.");
-    } else if (type == "formats") {
-        m_uiBuilder->downloadButton()->setText("View Video/Audio Formats");
-        m_uiBuilder->downloadButton()->setToolTip("Query yt-dlp to list available video and audio formats without downloading. Not supported for galleries.");
+    const QString type = m_uiBuilder->downloadTypeCombo()->itemData(index).toString();
+    const QHash<QString, DownloadButtonText> &texts = downloadButtonTexts();
+    const auto it = texts.constFind(type);
+    if (it != texts.constEnd()) {
+        m_uiBuilder->downloadButton()->setText(it->label);
+        m_uiBuilder->downloadButton()->setToolTip(it->toolTip);
     }
-    
+
     emit updateCommandPreview();
 }
 
@@ -140,6 +155,14 @@ void StartTabDownloadActions::checkFormats(const QString &url) {
         qCritical() << "CRITICAL ERROR: m_downloadButton is null in checkFormats!";
         return;
     }
+    // findBinary() caches its lookup, so this does not walk PATH per click;
+    // resolving first also means a missing yt-dlp never builds a process.
+    const QString ytDlpPath = resolveExecutablePath("yt-dlp.exe");
+    if (ytDlpPath.isEmpty()) {
+        emit missingBinariesDetected({"yt-dlp"});
+        return;
+    }
+
     m_uiBuilder->downloadButton()->setEnabled(false);
     m_uiBuilder->downloadButton()->setText("Checking...");
 
@@ -154,31 +177,39 @@ void StartTabDownloadActions::checkFormats(const QString &url) {
         args << "--cookies-from-browser" << cookiesBrowser;
     }
 
-    const QString ytDlpPath = resolveExecutablePath("yt-dlp.exe");
-    if (ytDlpPath.isEmpty()) {
-        if (m_uiBuilder->downloadButton()) {
-            m_uiBuilder->downloadButton()->setEnabled(true);
-        }
-        if (m_uiBuilder->downloadTypeCombo()) {
-            onDownloadTypeChanged(m_uiBuilder->downloadTypeCombo()->currentIndex());
+    // A process that never starts emits errorOccurred but not finished(); without
+    // this the button would stay on "Checking..." for the rest of the session.
+    connect(process, &QProcess::errorOccurred, this, [this, process](QProcess::ProcessError error) {
+        if (error != QProcess::FailedToStart) {
+            return;
         }
-
-        emit missingBinariesDetected({"yt-dlp"});
+        restoreDownloadButton();
+        QMessageBox::critical(m_parentWidget, "Error", "Failed to start yt-dlp:\n" + process->errorString());
         process->deleteLater();
-        return;
-    }
+    });
+    // yt-dlp can stall on an unreachable host; give up after a while so the
+    // button comes back. The kill is reported through onViewFormatsFinished.
+    QTimer::singleShot(kFormatsTimeoutMs, process, [process]() {
+        if (process->state() != QProcess::NotRunning) {
+            process->kill();
+        }
+    });
 
     process->start(ytDlpPath, args);
 }
 
-void StartTabDownloadActions::onViewFormatsFinished(int exitCode, QProcess::ExitStatus exitStatus) {
-    QProcess *process = qobject_cast<QProcess*>(sender());
+void StartTabDownloadActions::restoreDownloadButton() {
     if (m_uiBuilder->downloadButton()) {
         m_uiBuilder->downloadButton()->setEnabled(true);
     }
     if (m_uiBuilder->downloadTypeCombo()) {
         onDownloadTypeChanged(m_uiBuilder->downloadTypeCombo()->currentIndex());
     }
+}
+
+void StartTabDownloadActions::onViewFormatsFinished(int exitCode, QProcess::ExitStatus exitStatus) {
+    QProcess *process = qobject_cast<QProcess*>(sender());
+    restoreDownloadButton();
 
     if (exitStatus == QProcess::NormalExit && exitCode == 0) {
         QString output = process->readAllStandardOutput();
@@ -188,10 +219,14 @@ void StartTabDownloadActions::onViewFormatsFinished(int exitCode, QProcess::Exit
         dialog.resize(600, 400);
 
         QVBoxLayout *layout = new QVBoxLayout(&dialog);
-        QTextEdit *textEdit = new QTextEdit(&dialog);
+        // The format table is plain, column-aligned text: a plain-text view with
+        // a fixed-pitch font and no wrapping lays it out in one cheap pass,
+        // where QTextEdit::setText() would first probe it for rich text.
+        QPlainTextEdit *textEdit = new QPlainTextEdit(&dialog);
         textEdit->setReadOnly(true);
-        textEdit->setFontFamily("Courier New");
-        textEdit->setText(output);
+        textEdit->setLineWrapMode(QPlainTextEdit::NoWrap);
+        textEdit->setFont(QFontDatabase::systemFont(QFontDatabase::FixedFont));
+        textEdit->setPlainText(output);
         layout->addWidget(textEdit);
 
         QPushButton *closeButton = new QPushButton("Close", &dialog);
@@ -224,9 +259,8 @@ void StartTabDownloadActions::updateDynamicUI() {
         return;
     }
 
-    QStringList requiredYt = {"yt-dlp", "ffmpeg", "ffprobe", "deno"};
     bool hasMissingYt = false;
-    for (const QString &bin : requiredYt) {
+    for (const QString &bin : ProcessUtils::kYtDlpRequiredBinaries) {
         QString source = ProcessUtils::findBinary(bin, m_configManager).source;
         if (source == "Not Found" || source == "Invalid Custom") {
             hasMissingYt = true;
@@ -234,9 +268,8 @@ void StartTabDownloadActions::updateDynamicUI() {
         }
     }
 
-    QStringList requiredGallery = {"gallery-dl", "ffmpeg", "ffprobe"};
     bool hasMissingGallery = false;
-    for (const QString &bin : requiredGallery) {
+    for (const QString &bin : ProcessUtils::kGalleryDlRequiredBinaries) {
         QString source = ProcessUtils::findBinary(bin, m_configManager).source;
         if (source == "Not Found" || source == "Invalid Custom") {
             hasMissingGallery = true;
@@ -248,7 +281,7 @@ void StartTabDownloadActions::updateDynamicUI() {
     bool ytDlpOnlyMissing = (ytSource == "Not Found" || ytSource == "Invalid Custom");
 
     auto updateItemText = [this](const QString &dataValue, const QString &baseText, bool isMissing) {
-        int index = m_uiBuilder->downloadTypeCombo()->findData(dataValue);
+        int index = m_uiBuilder->downloadTypeIndex(dataValue);
         if (index != -1) {
             QString newText = baseText + (isMissing ? " (missing binaries)" : "");
             m_uiBuilder->downloadTypeCombo()->setItemText(index, newText);
@@ -2,21 +2,16 @@
 #define STARTTABDOWNLOADACTIONS_H
 
 #include <QObject>
-#include <QMessageBox>
 #include <QProcess>
-#include <QDesktopServices>
-#include <QDir>
-#include <QStandardItemModel>
-#include <QVBoxLayout> // For dialog layout
-#include <QTextEdit> // For dialog text
-#include <QPushButton> // For dialog button
 #include <QStringList>
+#include <QVariantMap>
 
 #include "core/ConfigManager.h"
 #include "ui/StartTabUiBuilder.h"
 #include "core/YtDlpArgsBuilder.h"
 #include "core/GalleryDlArgsBuilder.h"
-#include "core/ProcessUtils.h" // For resolveExecutablePath and findBinary
+
+class QWidget;
 
 class StartTabDownloadActions : public QObject
 {
@@ -50,6 +45,7 @@ private:
     QWidget *m_parentWidget; // To use for QMessageBox parent
 
     void checkFormats(const QString &url);
+    void restoreDownloadButton();
     QString resolveExecutablePath(const QString &name) const;
 };
 
@@ -1,14 +1,28 @@
 #include "StartTabUrlHandler.h"
 #include <QGuiApplication>
 #include <QUrl>
-#include <QJsonArray>
-#include <QJsonObject>
 #include <QFocusEvent>
 #include <QDebug>
 #include <QMessageBox>
 #include <QClipboard>
 #include <QPushButton>
+#include <QTimer>
 #include "core/ProcessUtils.h"
+#include "utils/StringUtils.h"
+
+namespace {
+
+// Host of the first URL in the text, treating scheme-less input as https.
+QString firstUrlHost(const QString &text)
+{
+    QString firstUrlStr = StringUtils::firstNonEmptyLine(text);
+    if (!firstUrlStr.startsWith("http://", Qt::CaseInsensitive) && !firstUrlStr.startsWith("https://", Qt::CaseInsensitive)) {
+        firstUrlStr = "https://" + firstUrlStr;
+    }
+    return QUrl(firstUrlStr).host().toLower();
+}
+
+} // namespace
 
 StartTabUrlHandler::StartTabUrlHandler(ConfigManager *configManager, ExtractorJsonParser *extractorJsonParser, StartTabUiBuilder *uiBuilder, QObject *parent)
     : QObject(parent),
@@ -54,7 +68,7 @@ void StartTabUrlHandler::handleFocusInEvent(QFocusEvent *event)
 {
     if (event->reason() == Qt::MouseFocusReason)
     {
-        checkClipboardForUrl();
+        scheduleClipboardCheck();
     }
 }
 
@@ -62,12 +76,30 @@ bool StartTabUrlHandler::handleEventFilter(QObject *obj, QEvent *event)
 {
     if (obj == m_uiBuilder->urlInput()) {
         if (event->type() == QEvent::MouseButtonPress || event->type() == QEvent::FocusIn) {
-            checkClipboardForUrl();
+            scheduleClipboardCheck();
         }
     }
     return false; // Let StartTab continue processing the event
 }
 
+void StartTabUrlHandler::scheduleClipboardCheck()
+{
+    // Reading the clipboard can block on X11/Wayland while the selection owner
+    // answers, so let the focus change paint first. A click into the field
+    // delivers both FocusIn and MouseButtonPress; they share one check.
+    if (m_clipboardCheckPending) {
+        return;
+    }
+    m_clipboardCheckPending = true;
+    QTimer::singleShot(0, this, &StartTabUrlHandler::onDeferredClipboardCheck);
+}
+
+void StartTabUrlHandler::onDeferredClipboardCheck()
+{
+    m_clipboardCheckPending = false;
+    checkClipboardForUrl();
+}
+
 void StartTabUrlHandler::onClipboardChangedWhileDialogIsOpen()
 {
     if (!m_typeSelectionDialog) return;
@@ -76,29 +108,10 @@ void StartTabUrlHandler::onClipboardChangedWhileDialogIsOpen()
     QString text = clipboard->text().trimmed();
     if (text.isEmpty()) return;
 
-    QString firstUrlStr = text.split('\n', Qt::SkipEmptyParts).first().trimmed();
-    if (!firstUrlStr.startsWith("http://", Qt::CaseInsensitive) && !firstUrlStr.startsWith("https://", Qt::CaseInsensitive)) {
-        firstUrlStr = "https://" + firstUrlStr;
-    }
-    QUrl url(firstUrlStr);
-    QString host = url.host().toLower();
-
+    const QString host = firstUrlHost(text);
     if (host.isEmpty()) return;
 
-    QJsonObject ytDlpExtractors = m_extractorJsonParser->getYtDlpExtractors();
-    bool inYtDlp = false;
-    for (auto it = ytDlpExtractors.begin(); it != ytDlpExtractors.end(); ++it) {
-        QJsonArray domains = it.value().toObject()["domains"].toArray();
-        for (const QJsonValue &domainValue : domains) {
-            QString domainStr = domainValue.toString().toLower();
-            if (host == domainStr || host.endsWith("." + domainStr)) {
-                inYtDlp = true;
-                break;
-            }
-        }
-        if (inYtDlp) break;
-    }
-
+    const bool inYtDlp = m_extractorJsonParser->ytDlpSupportsHost(host);
     if (!inYtDlp) {
         m_typeSelectionDialog->reject();
     }
@@ -119,7 +132,7 @@ void StartTabUrlHandler::onTypeSelectionDialogFinished(int /*result*/)
         else if (btnText.startsWith("View Video/Audio Formats")) dataValue = "formats";
 
         if (!dataValue.isEmpty() && m_uiBuilder->downloadTypeCombo()) {
-            int index = m_uiBuilder->downloadTypeCombo()->findData(dataValue);
+            int index = m_uiBuilder->downloadTypeIndex(dataValue);
             if (index != -1) {
                 m_uiBuilder->downloadTypeCombo()->setCurrentIndex(index);
             }
@@ -142,24 +155,6 @@ bool StartTabUrlHandler::checkClipboardForUrl()
         return false;
     }
 
-    QJsonObject ytDlpExtractors = m_extractorJsonParser->getYtDlpExtractors();
-    QJsonObject galleryDlExtractors = m_extractorJsonParser->getGalleryDlExtractors();
-
-    if (ytDlpExtractors.isEmpty() && galleryDlExtractors.isEmpty()) {
-        return false;
-    }
-
-    QString firstUrlStr = text.split('\n', Qt::SkipEmptyParts).first().trimmed();
-    if (!firstUrlStr.startsWith("http://", Qt::CaseInsensitive) && !firstUrlStr.startsWith("https://", Qt::CaseInsensitive)) {
-        firstUrlStr = "https://" + firstUrlStr;
-    }
-    QUrl url(firstUrlStr);
-    QString host = url.host().toLower();
-
-    if (host.isEmpty()) {
-        return false;
-    }
-
     ExtractorSupport support = checkUrlExtractorSupport(text);
 
     if (support != ExtractorSupport::None) {
@@ -172,7 +167,7 @@ bool StartTabUrlHandler::checkClipboardForUrl()
 
         if (support == ExtractorSupport::GalleryDlOnly) {
             if (m_uiBuilder->downloadTypeCombo()) {
-                int galleryIndex = m_uiBuilder->downloadTypeCombo()->findData("gallery");
+                int galleryIndex = m_uiBuilder->downloadTypeIndex("gallery");
                 m_uiBuilder->downloadTypeCombo()->setCurrentIndex(galleryIndex);
                 m_lastAutoSwitchedUrl = text;
             }
@@ -187,9 +182,8 @@ bool StartTabUrlHandler::checkClipboardForUrl()
                 m_typeSelectionDialog->setText("The pasted URL is likely for video/audio.\nPlease select a download type:");
                 m_typeSelectionDialog->setIcon(QMessageBox::Question);
 
-                QStringList requiredYt = {"yt-dlp", "ffmpeg", "ffprobe", "deno"};
                 bool hasMissingYt = false;
-                for (const QString &bin : requiredYt) {
+                for (const QString &bin : ProcessUtils::kYtDlpRequiredBinaries) {
                     QString source = ProcessUtils::findBinary(bin, m_configManager).source;
                     if (source == "Not Found" || source == "Invalid Custom") {
                         hasMissingYt = true;
@@ -219,45 +213,13 @@ bool StartTabUrlHandler::checkClipboardForUrl()
 
 StartTabUrlHandler::ExtractorSupport StartTabUrlHandler::checkUrlExtractorSupport(const QString &url) const
 {
-    QJsonObject ytDlpExtractors = m_extractorJsonParser->getYtDlpExtractors();
-    QJsonObject galleryDlExtractors = m_extractorJsonParser->getGalleryDlExtractors();
-
-    QString firstUrlStr = url.split('\n', Qt::SkipEmptyParts).first().trimmed();
-    if (!firstUrlStr.startsWith("http://", Qt::CaseInsensitive) && !firstUrlStr.startsWith("https://", Qt::CaseInsensitive)) {
-        firstUrlStr = "https://" + firstUrlStr;
-    }
-    QUrl parsedUrl(firstUrlStr);
-    QString host = parsedUrl.host().toLower();
-
+    const QString host = firstUrlHost(url);
     if (host.isEmpty()) {
         return ExtractorSupport::None;
     }
 
-    bool inYtDlp = false;
-    for (auto it = ytDlpExtractors.begin(); it != ytDlpExtractors.end(); ++it) {
-        QJsonArray domains = it.value().toObject()["domains"].toArray();
-        for (const QJsonValue &domainValue : domains) {
-            QString domainStr = domainValue.toString().toLower();
-            if (host == domainStr || host.endsWith("." + domainStr)) {
-                inYtDlp = true;
-                break;
-            }
-        }
-        if (inYtDlp) break;
-    }
-
-    bool inGalleryDl = false;
-    for (auto it = galleryDlExtractors.begin(); it != galleryDlExtractors.end(); ++it) {
-        QJsonArray domains = it.value().toObject()["domains"].toArray();
-        for (const QJsonValue &domainValue : domains) {
-            QString domainStr = domainValue.toString().toLower();
-            if (host == domainStr || host.endsWith("." + domainStr)) {
-                inGalleryDl = true;
-                break;
-            }
-        }
-        if (inGalleryDl) break;
-    }
+    const bool inYtDlp = m_extractorJsonParser->ytDlpSupportsHost(host);
+    const bool inGalleryDl = m_extractorJsonParser->galleryDlSupportsHost(host);
 
     if (inYtDlp && inGalleryDl) {
         return ExtractorSupport::Both;
@@ -281,7 +243,7 @@ void StartTabUrlHandler::autoSwitchDownloadType(const QString &url)
     switch (support) {
         case ExtractorSupport::YtDlpOnly:
             if (m_uiBuilder->downloadTypeCombo() && m_uiBuilder->downloadTypeCombo()->currentData().toString() == "gallery") {
-                int videoIndex = m_uiBuilder->downloadTypeCombo()->findData("video");
+                int videoIndex = m_uiBuilder->downloadTypeIndex("video");
                 if (videoIndex != -1) {
                     m_uiBuilder->downloadTypeCombo()->setCurrentIndex(videoIndex);
                     m_lastAutoSwitchedUrl = url;
@@ -291,7 +253,7 @@ void StartTabUrlHandler::autoSwitchDownloadType(const QString &url)
 
         case ExtractorSupport::GalleryDlOnly:
             if (m_uiBuilder->downloadTypeCombo()) {
-                int galleryIndex = m_uiBuilder->downloadTypeCombo()->findData("gallery");
+                int galleryIndex = m_uiBuilder->downloadTypeIndex("gallery");
                 if (galleryIndex != -1) {
                     m_uiBuilder->downloadTypeCombo()->setCurrentIndex(galleryIndex);
                     m_lastAutoSwitchedUrl = url;
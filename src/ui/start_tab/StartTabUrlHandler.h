@@ -2,16 +2,14 @@
 #define STARTTABURLHANDLER_H
 
 #include <QObject>
-#include <QClipboard>
-#include <QMessageBox>
-#include <QTextEdit>
-#include <QComboBox>
-#include <QFocusEvent>
-#include <QEvent>
 #include "core/ConfigManager.h"
 #include "utils/ExtractorJsonParser.h"
 #include "ui/StartTabUiBuilder.h" // To access UI elements
 
+class QEvent;
+class QFocusEvent;
+class QMessageBox;
+
 class StartTabUrlHandler : public QObject
 {
     Q_OBJECT
@@ -34,6 +32,9 @@ public slots:
     void handleFocusInEvent(QFocusEvent *event); // To be called from StartTab's focusInEvent
     bool handleEventFilter(QObject *obj, QEvent *event); // To be called from StartTab's eventFilter
 
+private slots:
+    void onDeferredClipboardCheck();
+
 private:
     enum class ExtractorSupport {
         None,
@@ -48,8 +49,10 @@ private:
 
     QMessageBox *m_typeSelectionDialog;
     QString m_lastAutoSwitchedUrl;
+    bool m_clipboardCheckPending = false;
 
     bool checkClipboardForUrl();
+    void scheduleClipboardCheck();
     ExtractorSupport checkUrlExtractorSupport(const QString &url) const;
     void autoSwitchDownloadType(const QString &url);
 };
@@ -46,6 +46,10 @@ QStringList BinaryFinder::getExtendedSearchPaths() {
 }
 
 QString BinaryFinder::findBinary(const QString& binaryName) {
+    return findBinaryIn(binaryName, getExtendedSearchPaths());
+}
+
+QString BinaryFinder::findBinaryIn(const QString& binaryName, const QStringList& searchPaths) {
     QString executableName = binaryName;
 #ifdef Q_OS_WIN
     if (!executableName.endsWith(".exe", Qt::CaseInsensitive)) {
@@ -53,18 +57,28 @@ QString BinaryFinder::findBinary(const QString& binaryName) {
     }
 #endif
 
-    QStringList searchPaths = getExtendedSearchPaths();
     QString foundPath = QStandardPaths::findExecutable(executableName, searchPaths);
 
     return QDir::toNativeSeparators(foundPath);
 }
 
+QStringList BinaryFinder::allBinaryNames() {
+    return {"yt-dlp", "ffmpeg", "ffprobe", "gallery-dl", "deno", "aria2c"};
+}
+
 QMap<QString, QString> BinaryFinder::findAllBinaries() {
+    return findBinaries(allBinaryNames());
+}
+
+QMap<QString, QString> BinaryFinder::findBinaries(const QStringList& binaryNames) {
     QMap<QString, QString> results;
-    QStringList requiredBinaries = {"yt-dlp", "ffmpeg", "ffprobe", "gallery-dl", "deno", "aria2c"};
+    if (binaryNames.isEmpty()) {
+        return results;
+    }
 
-    for (const QString& bin : requiredBinaries) {
-        results[bin] = findBinary(bin);
+    const QStringList searchPaths = getExtendedSearchPaths();
+    for (const QString& bin : binaryNames) {
+        results[bin] = findBinaryIn(bin, searchPaths);
     }
 
     return results;
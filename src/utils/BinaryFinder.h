@@ -20,8 +20,21 @@ public:
      */
     static QMap<QString, QString> findAllBinaries();
 
+    /**
+     * @brief Finds several binaries, building the search path list only once.
+     * @param binaryNames The executable names to look up.
+     * @return A map where keys are binary names and values are their resolved absolute paths.
+     */
+    static QMap<QString, QString> findBinaries(const QStringList& binaryNames);
+
+    /**
+     * @brief Names of every external binary the application can use.
+     */
+    static QStringList allBinaryNames();
+
 private:
     static QStringList getExtendedSearchPaths();
+    static QString findBinaryIn(const QString& binaryName, const QStringList& searchPaths);
 };
 
 #endif // BINARYFINDER_H
\ No newline at end of file
@@ -3,54 +3,81 @@
 #include <QDir>
 #include <QStandardPaths>
 #include <QProcess>
+#include <QSet>
 
-namespace BrowserUtils {
+namespace {
 
-QStringList getInstalledBrowsers() {
-    QStringList browsers;
+struct BrowserInstall {
+    const char *name;
+    const char *relativePath;
+    bool perUser; // Installed under the user's AppData\Local instead of Program Files
+};
 
-    // Common paths on Windows
-    // Note: This is a basic check. A more robust check would query the registry.
+// Common install locations on Windows.
+// Note: This is a basic check. A more robust check would query the registry.
+const BrowserInstall kBrowserInstalls[] = {
+    {"chrome", "/Google/Chrome/Application/chrome.exe", false},
+    {"firefox", "/Mozilla Firefox/firefox.exe", false},
+    {"edge", "/Microsoft/Edge/Application/msedge.exe", false},
+    {"opera", "/Programs/Opera/launcher.exe", true},
+    {"brave", "/BraveSoftware/Brave-Browser/Application/brave.exe", false},
+    {"vivaldi", "/Vivaldi/Application/vivaldi.exe", true},
+};
 
-    QString programFiles = qgetenv("ProgramFiles");
-    QString programFilesX86 = qgetenv("ProgramFiles(x86)");
-    QString localAppData = QStandardPaths::writableLocation(QStandardPaths::HomeLocation) + "/AppData/Local";
-
-    // Chrome
-    if (QFile::exists(programFiles + "/Google/Chrome/Application/chrome.exe") ||
-        QFile::exists(programFilesX86 + "/Google/Chrome/Application/chrome.exe")) {
-        browsers << "chrome";
+// Lower-cased names of the folders directly under root, from a single listing.
+QSet<QString> topLevelFolders(const QString &root) {
+    QSet<QString> folders;
+    if (root.isEmpty()) {
+        return folders;
     }
-
-    // Firefox
-    if (QFile::exists(programFiles + "/Mozilla Firefox/firefox.exe") ||
-        QFile::exists(programFilesX86 + "/Mozilla Firefox/firefox.exe")) {
-        browsers << "firefox";
+    const QStringList entries = QDir(root).entryList(QDir::Dirs | QDir::NoDotAndDotDot);
+    for (const QString &entry : entries) {
+        folders.insert(entry.toLower());
     }
+    return folders;
+}
 
-    // Edge
-    if (QFile::exists(programFiles + "/Microsoft/Edge/Application/msedge.exe") ||
-        QFile::exists(programFilesX86 + "/Microsoft/Edge/Application/msedge.exe")) {
-        browsers << "edge";
-    }
+// Only stats the executable when the browser's vendor folder is present, so
+// browsers that aren't installed cost nothing beyond the root listings.
+bool isInstalledUnder(const QString &root, const QSet<QString> &rootFolders, const QString &relativePath) {
+    return rootFolders.contains(relativePath.section('/', 1, 1).toLower())
+        && QFile::exists(root + relativePath);
+}
 
-    // Opera
-    if (QFile::exists(localAppData + "/Programs/Opera/launcher.exe")) {
-        browsers << "opera";
-    }
+QStringList detectInstalledBrowsers() {
+    QStringList browsers;
 
-    // Brave
-    if (QFile::exists(programFiles + "/BraveSoftware/Brave-Browser/Application/brave.exe") ||
-        QFile::exists(programFilesX86 + "/BraveSoftware/Brave-Browser/Application/brave.exe")) {
-        browsers << "brave";
-    }
+    const QString programFiles = qgetenv("ProgramFiles");
+    const QString programFilesX86 = qgetenv("ProgramFiles(x86)");
+    const QString localAppData = QStandardPaths::writableLocation(QStandardPaths::HomeLocation) + "/AppData/Local";
+
+    const QSet<QString> programFilesFolders = topLevelFolders(programFiles);
+    const QSet<QString> programFilesX86Folders = topLevelFolders(programFilesX86);
+    const QSet<QString> localAppDataFolders = topLevelFolders(localAppData);
 
-    // Vivaldi
-    if (QFile::exists(localAppData + "/Vivaldi/Application/vivaldi.exe")) {
-        browsers << "vivaldi";
+    for (const BrowserInstall &browser : kBrowserInstalls) {
+        const QString relativePath = QString::fromLatin1(browser.relativePath);
+        const bool installed = browser.perUser
+            ? isInstalledUnder(localAppData, localAppDataFolders, relativePath)
+            : (isInstalledUnder(programFiles, programFilesFolders, relativePath)
+               || isInstalledUnder(programFilesX86, programFilesX86Folders, relativePath));
+        if (installed) {
+            browsers << QString::fromLatin1(browser.name);
+        }
     }
 
     return browsers;
 }
 
+} // namespace
+
+namespace BrowserUtils {
+
+QStringList getInstalledBrowsers() {
+    // Install locations don't change while the app runs, so probe the
+    // filesystem once and hand back the same list afterwards.
+    static const QStringList browsers = detectInstalledBrowsers();
+    return browsers;
+}
+
 }
@@ -8,14 +8,55 @@
 #include <QDebug>
 #include <QtConcurrent>
 #include <QFuture>
+#include <QJsonArray>
+
+namespace {
+
+QSet<QString> collectDomains(const QJsonObject &extractors)
+{
+    QSet<QString> domains;
+    for (auto it = extractors.constBegin(); it != extractors.constEnd(); ++it) {
+        const QJsonArray domainList = it.value().toObject().value("domains").toArray();
+        for (const QJsonValue &domainValue : domainList) {
+            const QString domain = domainValue.toString().toLower();
+            if (!domain.isEmpty()) {
+                domains.insert(domain);
+            }
+        }
+    }
+    return domains;
+}
+
+// Checks the host and each parent domain in turn ("a.b.example.com",
+// "b.example.com", "example.com", "com"), one set lookup per label.
+bool hostMatchesDomain(const QSet<QString> &domains, const QString &host)
+{
+    const QString lowerHost = host.toLower();
+    qsizetype start = 0;
+    while (start < lowerHost.size()) {
+        if (domains.contains(lowerHost.mid(start))) {
+            return true;
+        }
+        const qsizetype dot = lowerHost.indexOf(u'.', start);
+        if (dot < 0) {
+            break;
+        }
+        start = dot + 1;
+    }
+    return false;
+}
+
+} // namespace
 
 ExtractorJsonParser::ExtractorJsonParser(QObject *parent) : QObject(parent)
 {
-    m_loader = new QFutureWatcher<QPair<QJsonObject, QJsonObject>>(this);
-    connect(m_loader, &QFutureWatcher<QPair<QJsonObject, QJsonObject>>::finished, this, [this]() {
-        QPair<QJsonObject, QJsonObject> result = m_loader->result();
-        m_ytDlpExtractors = result.first;
-        m_galleryDlExtractors = result.second;
+    m_loader = new QFutureWatcher<LoadedExtractors>(this);
+    connect(m_loader, &QFutureWatcher<LoadedExtractors>::finished, this, [this]() {
+        LoadedExtractors result = m_loader->result();
+        m_ytDlpExtractors = result.ytDlp;
+        m_galleryDlExtractors = result.galleryDl;
+        m_ytDlpDomains = result.ytDlpDomains;
+        m_galleryDlDomains = result.galleryDlDomains;
         qInfo() << "ExtractorJsonParser: Loaded" << m_ytDlpExtractors.size() << "yt-dlp and" << m_galleryDlExtractors.size() << "gallery-dl extractors.";
         emit extractorsReady();
     });
@@ -31,6 +72,16 @@ QJsonObject ExtractorJsonParser::getGalleryDlExtractors() const
     return m_galleryDlExtractors;
 }
 
+bool ExtractorJsonParser::ytDlpSupportsHost(const QString &host) const
+{
+    return hostMatchesDomain(m_ytDlpDomains, host);
+}
+
+bool ExtractorJsonParser::galleryDlSupportsHost(const QString &host) const
+{
+    return hostMatchesDomain(m_galleryDlDomains, host);
+}
+
 QJsonObject ExtractorJsonParser::getAllExtractors() const
 {
     QJsonObject merged = m_ytDlpExtractors;
@@ -45,13 +96,13 @@ void ExtractorJsonParser::startGeneration()
     if (m_loader->isRunning()) {
         return;
     }
-    QFuture<QPair<QJsonObject, QJsonObject>> future = QtConcurrent::run([this]() {
+    QFuture<LoadedExtractors> future = QtConcurrent::run([this]() {
         return loadExtractors();
     });
     m_loader->setFuture(future);
 }
 
-QPair<QJsonObject, QJsonObject> ExtractorJsonParser::loadExtractors()
+ExtractorJsonParser::LoadedExtractors ExtractorJsonParser::loadExtractors()
 {
     const QString appDir = QCoreApplication::applicationDirPath();
     const QString ytDlpPath = QDir(appDir).filePath("extractors_yt-dlp.json");
@@ -67,7 +118,7 @@ QPair<QJsonObject, QJsonObject> ExtractorJsonParser::loadExtractors()
         qWarning() << "ExtractorJsonParser: extractors_gallery-dl.json not found or is empty in" << appDir;
     }
 
-    return qMakePair(ytDlpExtractors, galleryDlExtractors);
+    return {ytDlpExtractors, galleryDlExtractors, collectDomains(ytDlpExtractors), collectDomains(galleryDlExtractors)};
 }
 
 QJsonObject ExtractorJsonParser::loadExtractorsFromFile(const QString &path) const
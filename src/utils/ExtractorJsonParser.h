@@ -4,7 +4,7 @@
 #include <QObject>
 #include <QJsonObject>
 #include <QFutureWatcher>
-#include <QPair>
+#include <QSet>
 
 class ExtractorJsonParser : public QObject
 {
@@ -15,18 +15,32 @@ public:
     QJsonObject getYtDlpExtractors() const;
     QJsonObject getGalleryDlExtractors() const;
     QJsonObject getAllExtractors() const; // Merges both for convenience
+    // True if host equals, or is a subdomain of, a domain the tool lists.
+    bool ytDlpSupportsHost(const QString &host) const;
+    bool galleryDlSupportsHost(const QString &host) const;
     void startGeneration();
 
 signals:
     void extractorsReady();
 
 private:
-    QPair<QJsonObject, QJsonObject> loadExtractors();
+    struct LoadedExtractors {
+        QJsonObject ytDlp;
+        QJsonObject galleryDl;
+        QSet<QString> ytDlpDomains;
+        QSet<QString> galleryDlDomains;
+    };
+
+    LoadedExtractors loadExtractors();
     QJsonObject loadExtractorsFromFile(const QString &path) const;
 
     QJsonObject m_ytDlpExtractors;
     QJsonObject m_galleryDlExtractors;
-    QFutureWatcher<QPair<QJsonObject, QJsonObject>> *m_loader;
+    // Lower-cased "domains" entries, built once on the loader thread so URL
+    // checks are set lookups instead of a walk over every extractor.
+    QSet<QString> m_ytDlpDomains;
+    QSet<QString> m_galleryDlDomains;
+    QFutureWatcher<LoadedExtractors> *m_loader;
 };
 
 #endif // EXTRACTORJSONPARSER_H
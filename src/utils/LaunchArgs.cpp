@@ -0,0 +1,17 @@
+#include "LaunchArgs.h"
+#include <QCoreApplication>
+#include <QStringList>
+
+namespace LaunchArgs {
+
+bool isServerMode() {
+    // QCoreApplication::arguments() rebuilds the list on every call, so keep
+    // the answer instead of rescanning it from each component that asks.
+    static const bool serverMode = [] {
+        const QStringList args = QCoreApplication::arguments();
+        return args.contains("--headless") || args.contains("--server");
+    }();
+    return serverMode;
+}
+
+}
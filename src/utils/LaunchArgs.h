@@ -0,0 +1,10 @@
+#ifndef LAUNCHARGS_H
+#define LAUNCHARGS_H
+
+namespace LaunchArgs {
+    // True when the app was started with --headless or --server. The command
+    // line is scanned once; call only after QCoreApplication is constructed.
+    bool isServerMode();
+}
+
+#endif // LAUNCHARGS_H
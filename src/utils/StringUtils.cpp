@@ -6,4 +6,19 @@ namespace StringUtils {
 
 // cleanDisplayTitle is no longer needed as the title is now extracted directly from yt-dlp's info.json.
 
+QString firstNonEmptyLine(QStringView text) {
+    while (!text.isEmpty()) {
+        const qsizetype newline = text.indexOf(u'\n');
+        const QStringView trimmed = (newline < 0 ? text : text.first(newline)).trimmed();
+        if (!trimmed.isEmpty()) {
+            return trimmed.toString();
+        }
+        if (newline < 0) {
+            break;
+        }
+        text = text.sliced(newline + 1);
+    }
+    return QString();
+}
+
 }
@@ -2,9 +2,14 @@
 #define STRINGUTILS_H
 
 #include <QString>
+#include <QStringView>
 
 namespace StringUtils {
     // cleanDisplayTitle is no longer needed as the title is now extracted directly from yt-dlp's info.json.
+
+    // Returns the first trimmed, non-empty line, stopping at it instead of
+    // splitting the rest of the text.
+    QString firstNonEmptyLine(QStringView text);
 }
 
 #endif // STRINGUTILS_H